@@ -22,8 +22,20 @@ from .artifacts import (
     promote_artifact,
     store_artifact_discovery,
 )
-from .database import SCHEMA_VERSION, PongogoDatabase, get_default_db_path
-from .events import get_event_stats, get_recent_events, store_routing_event
+from .database import (
+    SCHEMA_VERSION,
+    PongogoDatabase,
+    SQLitePool,
+    TransientDBError,
+    get_database,
+    get_default_db_path,
+)
+from .events import (
+    get_event_stats,
+    get_recent_events,
+    store_routing_event,
+    store_routing_events_batch,
+)
 from .observations import (
     GuidanceType,
     ImplementationType,
@@ -34,6 +46,7 @@ from .observations import (
     promote_observation,
     reject_observation,
     store_observation,
+    store_observations_batch,
 )
 from .triggers import (
     TriggerType,
@@ -46,10 +59,14 @@ from .triggers import (
 __all__ = [
     # Database
     "PongogoDatabase",
+    "SQLitePool",
+    "TransientDBError",
+    "get_database",
     "get_default_db_path",
     "SCHEMA_VERSION",
     # Events
     "store_routing_event",
+    "store_routing_events_batch",
     "get_event_stats",
     "get_recent_events",
     # Triggers
@@ -68,6 +85,7 @@ __all__ = [
     "SourceType",
     # Observations
     "store_observation",
+    "store_observations_batch",
     "promote_observation",
     "reject_observation",
     "get_observations_by_status",
@@ -14,7 +14,7 @@ from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
-from .database import PongogoDatabase, get_default_db_path
+from .database import get_database
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +59,7 @@ def store_artifact_discovery(
         Row ID if new discovery, None if duplicate (same content_hash exists)
     """
     try:
-        db = PongogoDatabase(db_path=db_path or get_default_db_path())
+        db = get_database(db_path)
 
         # Generate content hash for deduplication
         content_hash = hashlib.sha256(section_content.encode()).hexdigest()
@@ -126,11 +126,14 @@ def promote_artifact(
         Row ID of artifact_implemented record
     """
     try:
-        db = PongogoDatabase(db_path=db_path or get_default_db_path())
+        db = get_database(db_path)
 
         # Get discovered artifact
         discovered = db.execute_one(
-            "SELECT * FROM artifact_discovered WHERE id = ?",
+            """
+            SELECT section_title, section_content
+            FROM artifact_discovered WHERE id = ?
+            """,
             (discovered_id,),
         )
         if not discovered:
@@ -202,7 +205,7 @@ def get_artifacts_by_status(
         List of artifact dictionaries
     """
     try:
-        db = PongogoDatabase(db_path=db_path or get_default_db_path())
+        db = get_database(db_path)
 
         if source_type:
             rows = db.execute(
@@ -248,7 +251,7 @@ def archive_artifact(
         True if archived, False otherwise
     """
     try:
-        db = PongogoDatabase(db_path=db_path or get_default_db_path())
+        db = get_database(db_path)
 
         rows = db.execute_update(
             """
@@ -278,7 +281,7 @@ def get_artifact_stats(db_path: Path | None = None) -> dict:
         Dictionary with artifact counts by status and source type
     """
     try:
-        db = PongogoDatabase(db_path=db_path or get_default_db_path())
+        db = get_database(db_path)
 
         # Count by status
         by_status = db.execute(
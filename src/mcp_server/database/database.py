@@ -12,9 +12,13 @@ Fallback: ~/.pongogo/pongogo.db (user-level)
 """
 
 import logging
+import os
 import sqlite3
-from collections.abc import Iterator
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -22,6 +26,28 @@ logger = logging.getLogger(__name__)
 # Schema version for migrations
 SCHEMA_VERSION = "3.1.0"  # Phase 9: Added guidance_fulfillment table
 
+# How long SQLite itself waits on a locked database before raising
+# "database is locked" (milliseconds). Handled inside the SQLite busy handler,
+# so callers don't need their own sleep/retry loops.
+BUSY_TIMEOUT_MS = 10_000
+
+# Prepared statements kept per connection (sqlite3 default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Rows fetched per step by iter_execute
+ITER_FETCH_SIZE = 256
+
+# Applied once per connection when it is opened
+CONNECTION_PRAGMAS = (
+    f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}",
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA journal_mode = WAL",  # Readers don't block the writer
+    "PRAGMA synchronous = NORMAL",  # Safe with WAL; no fsync on every commit
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",  # 256 MiB
+    "PRAGMA cache_size = -65536",  # 64 MiB page cache
+)
+
 
 def get_default_db_path(project_root: Path | None = None) -> Path:
     """Get the default database path.
@@ -84,6 +110,9 @@ CREATE TABLE IF NOT EXISTS routing_events (
 CREATE INDEX IF NOT EXISTS idx_routing_events_timestamp ON routing_events(timestamp);
 CREATE INDEX IF NOT EXISTS idx_routing_events_session ON routing_events(session_id);
 CREATE INDEX IF NOT EXISTS idx_routing_events_engine ON routing_events(engine_version);
+-- Commencement look-back reads the latest events that routed something
+CREATE INDEX IF NOT EXISTS idx_routing_events_routed_time
+    ON routing_events(timestamp) WHERE instruction_count > 0;
 
 -- Routing triggers (friction, guidance, violation dictionaries)
 CREATE TABLE IF NOT EXISTS routing_triggers (
@@ -104,6 +133,7 @@ CREATE TABLE IF NOT EXISTS routing_triggers (
 
 CREATE INDEX IF NOT EXISTS idx_triggers_type ON routing_triggers(trigger_type);
 CREATE INDEX IF NOT EXISTS idx_triggers_enabled ON routing_triggers(enabled);
+CREATE INDEX IF NOT EXISTS idx_triggers_enabled_type_cover ON routing_triggers(trigger_type, enabled, trigger_key, trigger_value) WHERE enabled = 1;
 
 -- Artifact discovered (file-based knowledge from repo)
 CREATE TABLE IF NOT EXISTS artifact_discovered (
@@ -125,6 +155,8 @@ CREATE TABLE IF NOT EXISTS artifact_discovered (
 
 CREATE INDEX IF NOT EXISTS idx_artifact_discovered_status ON artifact_discovered(status);
 CREATE INDEX IF NOT EXISTS idx_artifact_discovered_source_type ON artifact_discovered(source_type);
+CREATE INDEX IF NOT EXISTS idx_artifact_discovered_location ON artifact_discovered(source_file, section_title);
+CREATE INDEX IF NOT EXISTS idx_artifact_discovered_status_time ON artifact_discovered(status, discovered_at DESC);
 
 -- Artifact implemented (promoted to instruction files)
 CREATE TABLE IF NOT EXISTS artifact_implemented (
@@ -174,6 +206,77 @@ CREATE TABLE IF NOT EXISTS observation_discovered (
 
 CREATE INDEX IF NOT EXISTS idx_observation_discovered_status ON observation_discovered(status);
 CREATE INDEX IF NOT EXISTS idx_observation_discovered_type ON observation_discovered(observation_type);
+CREATE INDEX IF NOT EXISTS idx_obs_status_type_time ON observation_discovered(status, observation_type, discovered_at DESC);
+CREATE INDEX IF NOT EXISTS idx_obs_status_time ON observation_discovered(status, discovered_at DESC);
+CREATE INDEX IF NOT EXISTS idx_obs_live_type ON observation_discovered(observation_type) WHERE status NOT IN ('REJECTED', 'ARCHIVED');
+CREATE INDEX IF NOT EXISTS idx_obs_guidance_nn ON observation_discovered(guidance_type) WHERE guidance_type IS NOT NULL;
+
+-- Observation counters (kept current by triggers; read by get_observation_stats)
+-- Keys: 'status:<status>', 'type:<type>' (live rows only), 'guidance:<type>'
+CREATE TABLE IF NOT EXISTS observation_counters (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_observation_counters_insert
+AFTER INSERT ON observation_discovered
+BEGIN
+    INSERT INTO observation_counters (key, value)
+    VALUES ('status:' || NEW.status, 1)
+    ON CONFLICT(key) DO UPDATE SET value = value + 1;
+
+    INSERT INTO observation_counters (key, value)
+    SELECT 'type:' || NEW.observation_type, 1
+    WHERE NEW.status NOT IN ('REJECTED', 'ARCHIVED')
+    ON CONFLICT(key) DO UPDATE SET value = value + 1;
+
+    INSERT INTO observation_counters (key, value)
+    SELECT 'guidance:' || NEW.guidance_type, 1
+    WHERE NEW.guidance_type IS NOT NULL
+    ON CONFLICT(key) DO UPDATE SET value = value + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_observation_counters_delete
+AFTER DELETE ON observation_discovered
+BEGIN
+    UPDATE observation_counters SET value = value - 1
+    WHERE key = 'status:' || OLD.status;
+
+    UPDATE observation_counters SET value = value - 1
+    WHERE key = 'type:' || OLD.observation_type
+      AND OLD.status NOT IN ('REJECTED', 'ARCHIVED');
+
+    UPDATE observation_counters SET value = value - 1
+    WHERE key = 'guidance:' || OLD.guidance_type;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_observation_counters_update
+AFTER UPDATE OF status, observation_type, guidance_type ON observation_discovered
+BEGIN
+    UPDATE observation_counters SET value = value - 1
+    WHERE key = 'status:' || OLD.status;
+
+    UPDATE observation_counters SET value = value - 1
+    WHERE key = 'type:' || OLD.observation_type
+      AND OLD.status NOT IN ('REJECTED', 'ARCHIVED');
+
+    UPDATE observation_counters SET value = value - 1
+    WHERE key = 'guidance:' || OLD.guidance_type;
+
+    INSERT INTO observation_counters (key, value)
+    VALUES ('status:' || NEW.status, 1)
+    ON CONFLICT(key) DO UPDATE SET value = value + 1;
+
+    INSERT INTO observation_counters (key, value)
+    SELECT 'type:' || NEW.observation_type, 1
+    WHERE NEW.status NOT IN ('REJECTED', 'ARCHIVED')
+    ON CONFLICT(key) DO UPDATE SET value = value + 1;
+
+    INSERT INTO observation_counters (key, value)
+    SELECT 'guidance:' || NEW.guidance_type, 1
+    WHERE NEW.guidance_type IS NOT NULL
+    ON CONFLICT(key) DO UPDATE SET value = value + 1;
+END;
 
 -- Observation implemented (promoted to triggers/instructions/rules)
 CREATE TABLE IF NOT EXISTS observation_implemented (
@@ -219,6 +322,16 @@ CREATE TABLE IF NOT EXISTS scan_history (
 
 CREATE INDEX IF NOT EXISTS idx_scan_history_date ON scan_history(scan_date);
 
+-- Per-file scan results, reused while a file's mtime and size are unchanged
+CREATE TABLE IF NOT EXISTS scan_file_cache (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    source_type TEXT NOT NULL,
+    sections TEXT NOT NULL,
+    last_scan TEXT NOT NULL
+);
+
 -- Guidance fulfillment tracking (Phase 9, Issue #390)
 -- Tracks whether guidance given in message N is operationalized in subsequent messages
 CREATE TABLE IF NOT EXISTS guidance_fulfillment (
@@ -257,6 +370,193 @@ CREATE INDEX IF NOT EXISTS idx_guidance_fulfillment_session ON guidance_fulfillm
 CREATE INDEX IF NOT EXISTS idx_guidance_fulfillment_action ON guidance_fulfillment(action_type);
 """
 
+# Full-text index over discovery keywords, used by DiscoverySystem.find_matches.
+# Kept out of SCHEMA because FTS5 is an optional SQLite build module; without
+# it the table is simply absent and matching falls back to a Python scan.
+# tokenchars '_' keeps snake_case keywords as single tokens.
+DISCOVERY_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS artifact_discovered_fts USING fts5(
+    keywords,
+    content='artifact_discovered',
+    content_rowid='id',
+    tokenize="unicode61 tokenchars '_'"
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_artifact_discovered_fts_insert
+AFTER INSERT ON artifact_discovered
+BEGIN
+    INSERT INTO artifact_discovered_fts (rowid, keywords)
+    VALUES (new.id, new.keywords);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_artifact_discovered_fts_delete
+AFTER DELETE ON artifact_discovered
+BEGIN
+    INSERT INTO artifact_discovered_fts (artifact_discovered_fts, rowid, keywords)
+    VALUES ('delete', old.id, old.keywords);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_artifact_discovered_fts_update
+AFTER UPDATE OF keywords ON artifact_discovered
+BEGIN
+    INSERT INTO artifact_discovered_fts (artifact_discovered_fts, rowid, keywords)
+    VALUES ('delete', old.id, old.keywords);
+    INSERT INTO artifact_discovered_fts (rowid, keywords)
+    VALUES (new.id, new.keywords);
+END;
+"""
+
+# Rebuilds observation_counters from a full scan. Run once for databases that
+# predate the counters (tracked via schema_info 'observation_counters_seeded').
+SEED_OBSERVATION_COUNTERS = (
+    "DELETE FROM observation_counters",
+    """
+    INSERT INTO observation_counters (key, value)
+    SELECT 'status:' || status, COUNT(*)
+    FROM observation_discovered
+    GROUP BY status
+    UNION ALL
+    SELECT 'type:' || observation_type, COUNT(*)
+    FROM observation_discovered
+    WHERE status NOT IN ('REJECTED', 'ARCHIVED')
+    GROUP BY observation_type
+    UNION ALL
+    SELECT 'guidance:' || guidance_type, COUNT(*)
+    FROM observation_discovered
+    WHERE guidance_type IS NOT NULL
+    GROUP BY guidance_type
+    """,
+)
+
+
+class TransientDBError(Exception):
+    """The database stayed locked past BUSY_TIMEOUT_MS; retrying later may work."""
+
+
+def raise_if_transient(error: sqlite3.Error) -> None:
+    """Re-raise SQLite lock/busy errors as TransientDBError.
+
+    Lets callers tell "try again later" apart from errors that a retry won't
+    fix, instead of both collapsing into the same sentinel return value.
+    """
+    if isinstance(error, sqlite3.OperationalError):
+        message = str(error)
+        if "locked" in message or "busy" in message:
+            raise TransientDBError(message) from error
+
+
+@dataclass
+class _PooledConnection:
+    """A pooled connection plus the file it was opened against."""
+
+    conn: sqlite3.Connection
+    identity: tuple[int, int, int] | None
+    depth: int = 0  # Open connection() contexts (nesting level)
+
+
+class SQLitePool:
+    """Persistent SQLite connections shared by every user of a database path.
+
+    sqlite3 connections can't be shared across threads, so each thread gets
+    its own connection per path, opened once and configured with
+    CONNECTION_PRAGMAS. Each thread keeps at most max_per_thread connections,
+    closing the least recently used idle one beyond that.
+    """
+
+    def __init__(self, max_per_thread: int = 8):
+        self.max_per_thread = max_per_thread
+        self._local = threading.local()
+
+    def _slots(self) -> OrderedDict[str, _PooledConnection]:
+        slots = getattr(self._local, "slots", None)
+        if slots is None:
+            slots = self._local.slots = OrderedDict()
+        return slots
+
+    @staticmethod
+    def _file_identity(path: str) -> tuple[int, int, int] | None:
+        """Identify the on-disk database file (device, inode, mode)."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_dev, st.st_ino, st.st_mode)
+
+    @staticmethod
+    def _open(path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _checkout(self, path: str) -> _PooledConnection:
+        """Get this thread's connection for path, opening it on first use.
+
+        The connection is reopened if the database file was replaced, removed,
+        or had its permissions changed since it was opened.
+        """
+        slots = self._slots()
+        slot = slots.get(path)
+
+        # Only revalidate between transactions, never inside a nested context
+        if slot is not None and slot.depth == 0:
+            if slot.identity != self._file_identity(path):
+                slot.conn.close()
+                del slots[path]
+                slot = None
+
+        if slot is None:
+            conn = self._open(path)
+            slot = _PooledConnection(conn, self._file_identity(path))
+            slots[path] = slot
+            self._evict(slots)
+        else:
+            slots.move_to_end(path)
+
+        return slot
+
+    def _evict(self, slots: OrderedDict[str, _PooledConnection]) -> None:
+        """Close least recently used idle connections over the per-thread cap."""
+        for path in list(slots)[:-1]:  # Never the one just checked out
+            if len(slots) <= self.max_per_thread:
+                return
+            if slots[path].depth == 0:
+                slots.pop(path).conn.close()
+
+    @contextmanager
+    def connection(self, db_path: Path | str) -> Iterator[sqlite3.Connection]:
+        """Transaction scope on the calling thread's connection for db_path."""
+        slot = self._checkout(os.path.abspath(db_path))
+        slot.depth += 1
+        try:
+            yield slot.conn
+            if slot.depth == 1:
+                slot.conn.commit()
+        except Exception:
+            if slot.depth == 1:
+                slot.conn.rollback()
+            raise
+        finally:
+            slot.depth -= 1
+
+    def close(self, db_path: Path | str) -> None:
+        """Close the calling thread's connection for db_path, if open."""
+        slot = self._slots().pop(os.path.abspath(db_path), None)
+        if slot is not None:
+            slot.conn.close()
+
+
+_pool = SQLitePool()
+
+
+# Database paths whose schema has been created/verified by this process
+_initialized_paths: set[Path] = set()
+
 
 class PongogoDatabase:
     """Unified database for all Pongogo routing data."""
@@ -279,11 +579,20 @@ class PongogoDatabase:
         self._ensure_db_exists()
 
     def _ensure_db_exists(self) -> None:
-        """Create database and schema if they don't exist."""
+        """Create database and schema if they don't exist.
+
+        Runs once per database path per process; later instances for the same
+        existing file skip the DDL.
+        """
+        if self.db_path in _initialized_paths and self.db_path.exists():
+            return
+
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         with self.connection() as conn:
             conn.executescript(SCHEMA)
+            self._create_discovery_fts(conn)
+            self._seed_observation_counters(conn)
             # Set schema version
             conn.execute(
                 "INSERT OR REPLACE INTO schema_info (key, value) VALUES (?, ?)",
@@ -293,26 +602,68 @@ class PongogoDatabase:
                 "INSERT OR REPLACE INTO schema_info (key, value) VALUES (?, ?)",
                 ("schema_created_at", "datetime('now')"),
             )
+            # Let SQLite refresh planner statistics where they are stale/missing
+            conn.execute("PRAGMA optimize")
+
+        _initialized_paths.add(self.db_path)
+
+    def _create_discovery_fts(self, conn: sqlite3.Connection) -> None:
+        """Create the discovery keyword index, building it once for old rows."""
+        try:
+            conn.executescript(DISCOVERY_FTS_SCHEMA)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, discovery matching will scan: {e}")
+            return
+
+        built = conn.execute(
+            "SELECT 1 FROM schema_info WHERE key = 'discovery_fts_built'"
+        ).fetchone()
+        if built:
+            return
+
+        conn.execute(
+            "INSERT INTO artifact_discovered_fts (artifact_discovered_fts) "
+            "VALUES ('rebuild')"
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO schema_info (key, value) VALUES (?, ?)",
+            ("discovery_fts_built", SCHEMA_VERSION),
+        )
+
+    def _seed_observation_counters(self, conn: sqlite3.Connection) -> None:
+        """Backfill observation_counters once for pre-existing observations."""
+        seeded = conn.execute(
+            "SELECT 1 FROM schema_info WHERE key = 'observation_counters_seeded'"
+        ).fetchone()
+        if seeded:
+            return
+
+        # The DELETE takes the write lock, so the rebuild and the flag commit
+        # together with no concurrent observation writes in between
+        for statement in SEED_OBSERVATION_COUNTERS:
+            conn.execute(statement)
+        conn.execute(
+            "INSERT OR REPLACE INTO schema_info (key, value) VALUES (?, ?)",
+            ("observation_counters_seeded", SCHEMA_VERSION),
+        )
 
     @contextmanager
     def connection(self) -> Iterator[sqlite3.Connection]:
         """Context manager for database connections.
 
+        Uses the calling thread's pooled connection for this path (see
+        SQLitePool). The outermost context commits on success and rolls back
+        on error; nested contexts join its transaction.
+
         Yields:
             sqlite3.Connection with row_factory set to sqlite3.Row
         """
-        conn = sqlite3.connect(self.db_path, timeout=10.0)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        conn.execute("PRAGMA journal_mode = WAL")  # Better concurrent access
-        try:
+        with _pool.connection(self.db_path) as conn:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+
+    def close(self) -> None:
+        """Close the calling thread's pooled connection for this path, if open."""
+        _pool.close(self.db_path)
 
     def execute(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
         """Execute SQL and return all results."""
@@ -320,6 +671,20 @@ class PongogoDatabase:
             cursor = conn.execute(sql, params)
             return cursor.fetchall()
 
+    def iter_execute(self, sql: str, params: tuple = ()) -> Iterator[sqlite3.Row]:
+        """Execute a read query and yield results without fetchall().
+
+        The cursor runs outside connection()'s transaction scope, so writes
+        made on this thread while iterating still commit on their own.
+        """
+        conn = _pool._checkout(os.path.abspath(self.db_path)).conn
+        cursor = conn.execute(sql, params)
+        try:
+            while rows := cursor.fetchmany(ITER_FETCH_SIZE):
+                yield from rows
+        finally:
+            cursor.close()
+
     def execute_one(self, sql: str, params: tuple = ()) -> sqlite3.Row | None:
         """Execute SQL and return first result."""
         with self.connection() as conn:
@@ -338,6 +703,20 @@ class PongogoDatabase:
             cursor = conn.execute(sql, params)
             return cursor.rowcount
 
+    def execute_many(self, sql: str, seq_of_params: Iterable[tuple]) -> int:
+        """Execute SQL once per parameter tuple in a single transaction.
+
+        Args:
+            sql: Statement to execute
+            seq_of_params: Parameter tuples, one per execution
+
+        Returns:
+            Total rows affected across all executions
+        """
+        with self.connection() as conn:
+            cursor = conn.executemany(sql, seq_of_params)
+            return cursor.rowcount
+
     def get_schema_version(self) -> str:
         """Get current schema version."""
         result = self.execute_one(
@@ -378,3 +757,54 @@ class PongogoDatabase:
             stats["error"] = str(e)
 
         return stats
+
+
+# (PONGOGO_PROJECT_ROOT, PONGOGO_KNOWLEDGE_PATH, cwd) -> resolved default path
+_default_db_paths: dict[tuple[str | None, str | None, str], Path] = {}
+
+
+def _default_db_path() -> Path:
+    """get_default_db_path(), memoized per environment and working directory.
+
+    Keyed on the inputs get_project_root() reads. The user-level fallback is
+    not memoized, so a project .pongogo/ created later in the process is still
+    picked up.
+    """
+    key = (
+        os.environ.get("PONGOGO_PROJECT_ROOT"),
+        os.environ.get("PONGOGO_KNOWLEDGE_PATH"),
+        os.getcwd(),
+    )
+    path = _default_db_paths.get(key)
+    if path is None:
+        path = get_default_db_path()
+        if path != Path.home() / ".pongogo" / "pongogo.db":
+            _default_db_paths[key] = path
+    return path
+
+
+_db_cache: dict[Path, PongogoDatabase] = {}
+_db_cache_lock = threading.Lock()
+
+
+def get_database(db_path: Path | str | None = None) -> PongogoDatabase:
+    """Get a shared PongogoDatabase for a path, creating it on first use.
+
+    Reusing the instance keeps each thread's connection open and skips schema
+    setup on every call. A new instance is created if the database file has
+    been removed since it was cached.
+
+    Args:
+        db_path: Explicit path to database file (default: get_default_db_path())
+
+    Returns:
+        Cached PongogoDatabase for the path
+    """
+    path = Path(db_path) if db_path else _default_db_path()
+
+    with _db_cache_lock:
+        db = _db_cache.get(path)
+        if db is None or not path.exists():
+            db = PongogoDatabase(db_path=path)
+            _db_cache[path] = db
+        return db
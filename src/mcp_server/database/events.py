@@ -7,18 +7,66 @@ Captures routing events for lookback features, diagnostics, and analysis.
 import hashlib
 import json
 import logging
-import sqlite3
-import time
 from datetime import datetime
 from pathlib import Path
 
-from .database import PongogoDatabase, get_default_db_path
+from .database import get_database, get_default_db_path
 
 logger = logging.getLogger(__name__)
 
-# Retry configuration for transient database locks
-MAX_RETRIES = 3
-RETRY_BASE_DELAY = 0.05  # 50ms base delay with exponential backoff
+_INSERT_ROUTING_EVENT_SQL = """
+    INSERT INTO routing_events
+    (timestamp, user_message, message_hash, routed_instructions,
+     instruction_count, routing_scores, engine_version,
+     session_id, context, routing_latency_ms)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Per-engine counts; every event is in exactly one group (NULL included), so
+# they also sum to the total without a separate COUNT(*) scan
+_ENGINE_DISTRIBUTION_SQL = """
+    SELECT engine_version, COUNT(*) as cnt
+    FROM routing_events
+    GROUP BY engine_version
+    ORDER BY cnt DESC
+"""
+
+# Remaining get_event_stats values in one statement. First/last follow id
+# (insert order) and are rowid seeks; the 24h count is a timestamp index range.
+_EVENT_STATS_SQL = """
+    SELECT
+        (SELECT timestamp FROM routing_events ORDER BY id ASC LIMIT 1)
+            AS first_event,
+        (SELECT timestamp FROM routing_events ORDER BY id DESC LIMIT 1)
+            AS last_event,
+        (SELECT COUNT(*) FROM routing_events
+         WHERE timestamp > datetime('now', '-1 day')) AS last_24h_count
+"""
+
+
+def _routing_event_params(
+    timestamp: str,
+    user_message: str,
+    routed_instructions: list[str],
+    engine_version: str,
+    routing_scores: dict[str, int] | None = None,
+    context: dict | None = None,
+    session_id: str | None = None,
+    routing_latency_ms: float | None = None,
+) -> tuple:
+    """Build the _INSERT_ROUTING_EVENT_SQL parameters for one event."""
+    return (
+        timestamp,
+        user_message,
+        hashlib.sha256(user_message.encode()).hexdigest()[:16],
+        json.dumps(routed_instructions) if routed_instructions else None,
+        len(routed_instructions) if routed_instructions else 0,
+        json.dumps(routing_scores) if routing_scores else None,
+        engine_version,
+        session_id,
+        json.dumps(context) if context else None,
+        routing_latency_ms,
+    )
 
 
 def store_routing_event(
@@ -34,8 +82,8 @@ def store_routing_event(
     """Store a routing event to the database.
 
     Event capture is non-blocking - failures are logged but don't interrupt
-    the routing response. Uses retry with exponential backoff for transient
-    database lock errors under high contention.
+    the routing response. Transient lock contention is absorbed by SQLite's
+    busy handler (see BUSY_TIMEOUT_MS) rather than a Python retry loop.
 
     Args:
         user_message: The user's query/message
@@ -50,67 +98,62 @@ def store_routing_event(
     Returns:
         True if event was stored successfully, False otherwise
     """
-    timestamp = datetime.now().isoformat()
-    message_hash = hashlib.sha256(user_message.encode()).hexdigest()[:16]
-    instructions_json = json.dumps(routed_instructions) if routed_instructions else None
-    scores_json = json.dumps(routing_scores) if routing_scores else None
-    context_json = json.dumps(context) if context else None
-    instruction_count = len(routed_instructions) if routed_instructions else 0
-
-    last_error = None
-    for attempt in range(MAX_RETRIES):
-        try:
-            db = PongogoDatabase(db_path=db_path or get_default_db_path())
-
-            db.execute_insert(
-                """
-                INSERT INTO routing_events
-                (timestamp, user_message, message_hash, routed_instructions,
-                 instruction_count, routing_scores, engine_version,
-                 session_id, context, routing_latency_ms)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    timestamp,
-                    user_message,
-                    message_hash,
-                    instructions_json,
-                    instruction_count,
-                    scores_json,
-                    engine_version,
-                    session_id,
-                    context_json,
-                    routing_latency_ms,
-                ),
-            )
-
-            logger.debug(f"Routing event captured: {instruction_count} instructions")
-            return True
-
-        except sqlite3.OperationalError as e:
-            last_error = e
-            # Retry on database locked errors
-            if "database is locked" in str(e) and attempt < MAX_RETRIES - 1:
-                delay = RETRY_BASE_DELAY * (2**attempt)  # Exponential backoff
-                logger.debug(
-                    f"Database locked, retrying in {delay:.3f}s (attempt {attempt + 1}/{MAX_RETRIES})"
-                )
-                time.sleep(delay)
-                continue
-            else:
-                logger.warning(
-                    f"Failed to store routing event after {attempt + 1} attempts: {e}"
-                )
-                return False
-
-        except Exception as e:
-            logger.warning(f"Failed to store routing event: {e}")
-            return False
-
-    logger.warning(
-        f"Failed to store routing event after {MAX_RETRIES} attempts: {last_error}"
+    params = _routing_event_params(
+        datetime.now().isoformat(),
+        user_message,
+        routed_instructions,
+        engine_version,
+        routing_scores=routing_scores,
+        context=context,
+        session_id=session_id,
+        routing_latency_ms=routing_latency_ms,
     )
-    return False
+
+    try:
+        db = get_database(db_path or get_default_db_path())
+        db.execute_insert(_INSERT_ROUTING_EVENT_SQL, params)
+
+        logger.debug(
+            f"Routing event captured: {len(routed_instructions or [])} instructions"
+        )
+        return True
+
+    except Exception as e:
+        logger.warning(f"Failed to store routing event: {e}")
+        return False
+
+
+def store_routing_events_batch(
+    events: list[dict],
+    db_path: Path | None = None,
+) -> int:
+    """Store many routing events in one transaction.
+
+    Args:
+        events: One dict per event, holding store_routing_event's keyword
+            arguments (user_message, routed_instructions and engine_version
+            required; db_path not allowed)
+        db_path: Optional explicit database path
+
+    Returns:
+        Number of events stored (0 on failure)
+    """
+    if not events:
+        return 0
+
+    try:
+        db = get_database(db_path or get_default_db_path())
+        now = datetime.now().isoformat()
+        params = [_routing_event_params(now, **event) for event in events]
+
+        db.execute_many(_INSERT_ROUTING_EVENT_SQL, params)
+
+        logger.debug(f"Routing events captured: {len(params)} events")
+        return len(params)
+
+    except Exception as e:
+        logger.warning(f"Failed to store routing event batch: {e}")
+        return 0
 
 
 def get_event_stats(db_path: Path | None = None) -> dict:
@@ -138,11 +181,11 @@ def get_event_stats(db_path: Path | None = None) -> dict:
         }
 
     try:
-        db = PongogoDatabase(db_path=path)
+        db = get_database(path)
 
-        # Total count
-        result = db.execute_one("SELECT COUNT(*) as cnt FROM routing_events")
-        total_count = result["cnt"] if result else 0
+        engines = db.execute(_ENGINE_DISTRIBUTION_SQL)
+        engine_distribution = {row["engine_version"]: row["cnt"] for row in engines}
+        total_count = sum(engine_distribution.values())
 
         if total_count == 0:
             return {
@@ -155,44 +198,14 @@ def get_event_stats(db_path: Path | None = None) -> dict:
                 "database_exists": True,
             }
 
-        # First event
-        first = db.execute_one(
-            "SELECT timestamp FROM routing_events ORDER BY id ASC LIMIT 1"
-        )
-        first_event = first["timestamp"] if first else None
-
-        # Last event
-        last = db.execute_one(
-            "SELECT timestamp FROM routing_events ORDER BY id DESC LIMIT 1"
-        )
-        last_event = last["timestamp"] if last else None
-
-        # Last 24h count
-        last_24h = db.execute_one(
-            """
-            SELECT COUNT(*) as cnt FROM routing_events
-            WHERE timestamp > datetime('now', '-1 day')
-            """
-        )
-        last_24h_count = last_24h["cnt"] if last_24h else 0
-
-        # Engine version distribution
-        engines = db.execute(
-            """
-            SELECT engine_version, COUNT(*) as cnt
-            FROM routing_events
-            GROUP BY engine_version
-            ORDER BY cnt DESC
-            """
-        )
-        engine_distribution = {row["engine_version"]: row["cnt"] for row in engines}
+        totals = db.execute_one(_EVENT_STATS_SQL)
 
         return {
             "status": "active",
             "total_count": total_count,
-            "first_event": first_event,
-            "last_event": last_event,
-            "last_24h_count": last_24h_count,
+            "first_event": totals["first_event"],
+            "last_event": totals["last_event"],
+            "last_24h_count": totals["last_24h_count"],
             "engine_distribution": engine_distribution,
             "database_path": str(path),
             "database_exists": True,
@@ -228,7 +241,7 @@ def get_recent_events(
         List of event dictionaries
     """
     try:
-        db = PongogoDatabase(db_path=db_path or get_default_db_path())
+        db = get_database(db_path or get_default_db_path())
 
         if session_id:
             rows = db.execute(
@@ -12,14 +12,66 @@ Lifecycle: DISCOVERED → REVIEWING → PROMOTED/REJECTED → (optionally) ARCHI
 
 import json
 import logging
+import sqlite3
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
-from .database import PongogoDatabase, get_default_db_path
+from .database import get_database, raise_if_transient
 
 logger = logging.getLogger(__name__)
 
+# Columns returned by get_observations_by_status
+_OBSERVATION_COLUMNS = (
+    "id, event_id, observation_type, observation_content, observation_target, "
+    "guidance_type, should_persist, persistence_scope, status, promoted_to, "
+    "session_id, context, discovered_at, reviewed_at, promoted_at, rejected_at, "
+    "rejection_reason"
+)
+
+_INSERT_OBSERVATION_SQL = """
+    INSERT INTO observation_discovered
+    (event_id, observation_type, observation_content, observation_target,
+     guidance_type, should_persist, persistence_scope, status,
+     session_id, context, discovered_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# INSERT ... SELECT inserts nothing when the observation doesn't exist
+_PROMOTE_INSERT_SQL = """
+    INSERT INTO observation_implemented
+    (discovered_id, implementation_type, trigger_id, instruction_id,
+     rule_content, rule_scope, title, description, status, created_at)
+    SELECT id, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    FROM observation_discovered WHERE id = ?
+"""
+
+_MARK_PROMOTED_SQL = """
+    UPDATE observation_discovered
+    SET status = ?, promoted_to = ?, promoted_at = ?
+    WHERE id = ?
+"""
+
+_MARK_REJECTED_SQL = """
+    UPDATE observation_discovered
+    SET status = ?, rejected_at = ?, rejection_reason = ?
+    WHERE id = ?
+"""
+
+_SELECT_BY_STATUS_SQL = f"""
+    SELECT {_OBSERVATION_COLUMNS} FROM observation_discovered
+    WHERE status = ?
+    ORDER BY discovered_at DESC
+    LIMIT ?
+"""
+
+_SELECT_BY_STATUS_AND_TYPE_SQL = f"""
+    SELECT {_OBSERVATION_COLUMNS} FROM observation_discovered
+    WHERE status = ? AND observation_type = ?
+    ORDER BY discovered_at DESC
+    LIMIT ?
+"""
+
 
 class ObservationType(str, Enum):
     """Types of runtime observations."""
@@ -60,6 +112,47 @@ class ImplementationType(str, Enum):
     PROJECT_RULE = "PROJECT_RULE"  # Stored as project-level rule
 
 
+# Status values bound into SQL parameters
+_DISCOVERED = ObservationStatus.DISCOVERED.value
+_PROMOTED = ObservationStatus.PROMOTED.value
+_REJECTED = ObservationStatus.REJECTED.value
+
+
+def _encode_context(context: dict | None) -> str | None:
+    """Serialize an observation context as compact JSON (None if empty)."""
+    if not context:
+        return None
+    return json.dumps(context, separators=(",", ":"), ensure_ascii=False)
+
+
+def _observation_params(
+    discovered_at: str,
+    observation_type: ObservationType,
+    observation_content: str,
+    event_id: int | None = None,
+    observation_target: str | None = None,
+    guidance_type: GuidanceType | None = None,
+    should_persist: bool = True,
+    persistence_scope: str = "project",
+    session_id: str | None = None,
+    context: dict | None = None,
+) -> tuple:
+    """Build the _INSERT_OBSERVATION_SQL parameters for one observation."""
+    return (
+        event_id,
+        observation_type.value,
+        observation_content,
+        observation_target,
+        guidance_type.value if guidance_type else None,
+        should_persist,
+        persistence_scope,
+        _DISCOVERED,
+        session_id,
+        _encode_context(context),
+        discovered_at,
+    )
+
+
 def store_observation(
     observation_type: ObservationType,
     observation_content: str,
@@ -88,44 +181,79 @@ def store_observation(
 
     Returns:
         Row ID of created observation
+
+    Raises:
+        TransientDBError: If the database stays locked past the busy timeout
     """
     try:
-        db = PongogoDatabase(db_path=db_path or get_default_db_path())
-
-        context_json = json.dumps(context) if context else None
-        guidance_value = guidance_type.value if guidance_type else None
+        db = get_database(db_path)
 
         row_id = db.execute_insert(
-            """
-            INSERT INTO observation_discovered
-            (event_id, observation_type, observation_content, observation_target,
-             guidance_type, should_persist, persistence_scope, status,
-             session_id, context, discovered_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                event_id,
-                observation_type.value,
-                observation_content,
-                observation_target,
-                guidance_value,
-                should_persist,
-                persistence_scope,
-                ObservationStatus.DISCOVERED.value,
-                session_id,
-                context_json,
+            _INSERT_OBSERVATION_SQL,
+            _observation_params(
                 datetime.now().isoformat(),
+                observation_type,
+                observation_content,
+                event_id=event_id,
+                observation_target=observation_target,
+                guidance_type=guidance_type,
+                should_persist=should_persist,
+                persistence_scope=persistence_scope,
+                session_id=session_id,
+                context=context,
             ),
         )
 
         logger.debug(f"Stored observation: {observation_type.value}")
         return row_id
 
-    except Exception as e:
+    except sqlite3.Error as e:
+        raise_if_transient(e)
         logger.warning(f"Failed to store observation: {e}")
         return 0
 
 
+def store_observations_batch(
+    observations: list[dict],
+    db_path: Path | None = None,
+) -> list[int]:
+    """Store many newly discovered observations in one transaction.
+
+    Args:
+        observations: One dict per observation, holding store_observation's
+            keyword arguments (observation_type and observation_content
+            required; db_path not allowed)
+        db_path: Optional explicit database path
+
+    Returns:
+        Row IDs of created observations in input order (empty list on failure)
+
+    Raises:
+        TransientDBError: If the database stays locked past the busy timeout
+    """
+    if not observations:
+        return []
+
+    try:
+        db = get_database(db_path)
+        now = datetime.now().isoformat()
+        params = [_observation_params(now, **obs) for obs in observations]
+
+        with db.connection() as conn:
+            conn.executemany(_INSERT_OBSERVATION_SQL, params)
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+        # Rows inserted by one writer transaction get consecutive rowids
+        first_id = last_id - len(params) + 1
+        logger.debug(f"Stored {len(params)} observations")
+        return list(range(first_id, last_id + 1))
+
+    except sqlite3.Error as e:
+        raise_if_transient(e)
+        logger.warning(f"Failed to store observation batch: {e}")
+        return []
+
+
 def promote_observation(
     discovered_id: int,
     implementation_type: ImplementationType,
@@ -152,59 +280,50 @@ def promote_observation(
 
     Returns:
         Row ID of observation_implemented record
+
+    Raises:
+        TransientDBError: If the database stays locked past the busy timeout
     """
     try:
-        db = PongogoDatabase(db_path=db_path or get_default_db_path())
-
-        # Verify discovered observation exists
-        discovered = db.execute_one(
-            "SELECT * FROM observation_discovered WHERE id = ?",
-            (discovered_id,),
-        )
-        if not discovered:
-            logger.warning(f"Observation not found: {discovered_id}")
-            return None
+        db = get_database(db_path)
 
         now = datetime.now().isoformat()
 
-        # Create implemented record
-        impl_id = db.execute_insert(
-            """
-            INSERT INTO observation_implemented
-            (discovered_id, implementation_type, trigger_id, instruction_id,
-             rule_content, rule_scope, title, description, status, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                discovered_id,
-                implementation_type.value,
-                trigger_id,
-                instruction_id,
-                rule_content,
-                rule_scope,
-                title,
-                description,
-                "ACTIVE",
-                now,
-            ),
-        )
-
-        # Update discovered record
-        db.execute_update(
-            """
-            UPDATE observation_discovered
-            SET status = ?, promoted_to = ?, promoted_at = ?
-            WHERE id = ?
-            """,
-            (ObservationStatus.PROMOTED.value, impl_id, now, discovered_id),
-        )
+        with db.connection() as conn:
+            # Existence check rides along with the insert (see _PROMOTE_INSERT_SQL)
+            cursor = conn.execute(
+                _PROMOTE_INSERT_SQL,
+                (
+                    implementation_type.value,
+                    trigger_id,
+                    instruction_id,
+                    rule_content,
+                    rule_scope,
+                    title,
+                    description,
+                    "ACTIVE",
+                    now,
+                    discovered_id,
+                ),
+            )
+            if cursor.rowcount == 0:
+                logger.warning(f"Observation not found: {discovered_id}")
+                return None
+            impl_id = cursor.lastrowid
+
+            # Update discovered record in the same transaction
+            conn.execute(
+                _MARK_PROMOTED_SQL,
+                (_PROMOTED, impl_id, now, discovered_id),
+            )
 
         logger.info(
             f"Promoted observation {discovered_id} as {implementation_type.value}"
         )
         return impl_id
 
-    except Exception as e:
+    except sqlite3.Error as e:
+        raise_if_transient(e)
         logger.warning(f"Failed to promote observation: {e}")
         return None
 
@@ -223,18 +342,17 @@ def reject_observation(
 
     Returns:
         True if rejected, False otherwise
+
+    Raises:
+        TransientDBError: If the database stays locked past the busy timeout
     """
     try:
-        db = PongogoDatabase(db_path=db_path or get_default_db_path())
+        db = get_database(db_path)
 
         rows = db.execute_update(
-            """
-            UPDATE observation_discovered
-            SET status = ?, rejected_at = ?, rejection_reason = ?
-            WHERE id = ?
-            """,
+            _MARK_REJECTED_SQL,
             (
-                ObservationStatus.REJECTED.value,
+                _REJECTED,
                 datetime.now().isoformat(),
                 reason,
                 observation_id,
@@ -243,7 +361,8 @@ def reject_observation(
 
         return rows > 0
 
-    except Exception as e:
+    except sqlite3.Error as e:
+        raise_if_transient(e)
         logger.warning(f"Failed to reject observation: {e}")
         return False
 
@@ -253,7 +372,7 @@ def get_observations_by_status(
     observation_type: ObservationType | None = None,
     limit: int = 100,
     db_path: Path | None = None,
-) -> list[dict]:
+) -> list[sqlite3.Row]:
     """Get observations by status.
 
     Args:
@@ -263,35 +382,30 @@ def get_observations_by_status(
         db_path: Optional explicit database path
 
     Returns:
-        List of observation dictionaries
+        List of observation rows. Rows support row["column"] access; call
+        dict(row) where a real dict is needed (e.g. JSON serialization).
+
+    Raises:
+        TransientDBError: If the database stays locked past the busy timeout
     """
     try:
-        db = PongogoDatabase(db_path=db_path or get_default_db_path())
+        db = get_database(db_path)
 
         if observation_type:
             rows = db.execute(
-                """
-                SELECT * FROM observation_discovered
-                WHERE status = ? AND observation_type = ?
-                ORDER BY discovered_at DESC
-                LIMIT ?
-                """,
+                _SELECT_BY_STATUS_AND_TYPE_SQL,
                 (status.value, observation_type.value, limit),
             )
         else:
             rows = db.execute(
-                """
-                SELECT * FROM observation_discovered
-                WHERE status = ?
-                ORDER BY discovered_at DESC
-                LIMIT ?
-                """,
+                _SELECT_BY_STATUS_SQL,
                 (status.value, limit),
             )
 
-        return [dict(row) for row in rows]
+        return rows
 
-    except Exception as e:
+    except sqlite3.Error as e:
+        raise_if_transient(e)
         logger.warning(f"Failed to get observations: {e}")
         return []
 
@@ -301,52 +415,43 @@ def get_observation_stats(db_path: Path | None = None) -> dict:
 
     Returns:
         Dictionary with observation counts by status and type
+
+    Raises:
+        TransientDBError: If the database stays locked past the busy timeout
     """
     try:
-        db = PongogoDatabase(db_path=db_path or get_default_db_path())
+        db = get_database(db_path)
 
-        # Count by status
-        by_status = db.execute(
+        # Counters are maintained by triggers on observation_discovered, so
+        # this reads a handful of rows instead of scanning the table
+        rows = db.execute(
             """
-            SELECT status, COUNT(*) as cnt
-            FROM observation_discovered
-            GROUP BY status
+            SELECT key, value FROM observation_counters WHERE value > 0
+            UNION ALL
+            SELECT 'implemented', COUNT(*)
+            FROM observation_implemented
+            WHERE status = 'ACTIVE'
             """
         )
 
-        # Count by type (non-rejected/archived)
-        by_type = db.execute(
-            """
-            SELECT observation_type, COUNT(*) as cnt
-            FROM observation_discovered
-            WHERE status NOT IN ('REJECTED', 'ARCHIVED')
-            GROUP BY observation_type
-            """
-        )
-
-        # Count by guidance type
-        by_guidance = db.execute(
-            """
-            SELECT guidance_type, COUNT(*) as cnt
-            FROM observation_discovered
-            WHERE guidance_type IS NOT NULL
-            GROUP BY guidance_type
-            """
-        )
-
-        # Implemented count
-        implemented = db.execute_one(
-            "SELECT COUNT(*) as cnt FROM observation_implemented WHERE status = 'ACTIVE'"
-        )
-
-        return {
-            "by_status": {row["status"]: row["cnt"] for row in by_status},
-            "by_type": {row["observation_type"]: row["cnt"] for row in by_type},
-            "by_guidance": {row["guidance_type"]: row["cnt"] for row in by_guidance},
-            "implemented_count": implemented["cnt"] if implemented else 0,
+        stats: dict = {
+            "by_status": {},
+            "by_type": {},
+            "by_guidance": {},
+            "implemented_count": 0,
         }
-
-    except Exception as e:
+        groups = {"status": "by_status", "type": "by_type", "guidance": "by_guidance"}
+        for row in rows:
+            if row["key"] == "implemented":
+                stats["implemented_count"] = row["value"]
+            else:
+                group, _, name = row["key"].partition(":")
+                stats[groups[group]][name] = row["value"]
+
+        return stats
+
+    except sqlite3.Error as e:
+        raise_if_transient(e)
         logger.warning(f"Failed to get observation stats: {e}")
         return {
             "by_status": {},
@@ -5,14 +5,77 @@ Manages dictionaries for friction patterns, guidance detection, and violation pa
 """
 
 import logging
+import os
+import sqlite3
+import threading
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
-from .database import PongogoDatabase, get_default_db_path
+from .database import get_database, raise_if_transient
 
 logger = logging.getLogger(__name__)
 
+# Enabled-only lookups must say `enabled = 1` literally for the planner to use
+# the covering partial index idx_triggers_enabled_type_cover
+_SELECT_ENABLED_TRIGGERS_SQL = """
+    SELECT trigger_key, trigger_value
+    FROM routing_triggers
+    WHERE trigger_type = ? AND enabled = 1
+"""
+
+_SELECT_ALL_TRIGGERS_SQL = """
+    SELECT trigger_key, trigger_value
+    FROM routing_triggers
+    WHERE trigger_type = ?
+"""
+
+_UPSERT_TRIGGER_SQL = """
+    INSERT INTO routing_triggers
+    (trigger_type, trigger_key, trigger_value, category, description,
+     source, confidence, enabled, created_by, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(trigger_type, trigger_key) DO UPDATE SET
+        trigger_value = excluded.trigger_value,
+        category = excluded.category,
+        description = excluded.description,
+        source = excluded.source,
+        confidence = excluded.confidence,
+        enabled = excluded.enabled,
+        updated_at = excluded.updated_at
+"""
+
+_DISABLE_TRIGGERS_SQL = """
+    UPDATE routing_triggers
+    SET enabled = 0, updated_at = ?
+    WHERE trigger_type = ? AND source = ?
+"""
+
+# (db_path, trigger_type, enabled_only) -> (file signature, triggers)
+_trigger_cache: dict[tuple, tuple[tuple, dict[str, str | None]]] = {}
+_trigger_cache_lock = threading.RLock()
+
+
+def _file_signature(db_path: Path) -> tuple:
+    """Change marker for a database: mtime and size of the file and its WAL.
+
+    Commits land in the -wal file first, so the main file alone is not enough.
+    """
+    signature = []
+    for path in (db_path, db_path.with_name(db_path.name + "-wal")):
+        try:
+            st = os.stat(path)
+            signature.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def _invalidate_trigger_cache() -> None:
+    """Drop cached trigger dictionaries after a write."""
+    with _trigger_cache_lock:
+        _trigger_cache.clear()
+
 
 class TriggerType(str, Enum):
     """Types of routing triggers."""
@@ -37,32 +100,33 @@ def get_triggers_by_type(
 
     Returns:
         Dictionary mapping trigger_key -> trigger_value
+
+    Raises:
+        TransientDBError: If the database stays locked past the busy timeout
     """
     try:
-        db = PongogoDatabase(db_path=db_path or get_default_db_path())
-
-        if enabled_only:
-            rows = db.execute(
-                """
-                SELECT trigger_key, trigger_value
-                FROM routing_triggers
-                WHERE trigger_type = ? AND enabled = 1
-                """,
-                (trigger_type.value,),
-            )
-        else:
-            rows = db.execute(
-                """
-                SELECT trigger_key, trigger_value
-                FROM routing_triggers
-                WHERE trigger_type = ?
-                """,
-                (trigger_type.value,),
-            )
-
-        return {row["trigger_key"]: row["trigger_value"] for row in rows}
-
-    except Exception as e:
+        db = get_database(db_path)
+        type_value = trigger_type.value
+        key = (db.db_path, type_value, enabled_only)
+
+        # Read the signature before querying so a concurrent write can only
+        # make the cached entry look stale, never fresh
+        signature = _file_signature(db.db_path)
+        with _trigger_cache_lock:
+            cached = _trigger_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return dict(cached[1])
+
+        sql = _SELECT_ENABLED_TRIGGERS_SQL if enabled_only else _SELECT_ALL_TRIGGERS_SQL
+        rows = db.execute(sql, (type_value,))
+        triggers = {row["trigger_key"]: row["trigger_value"] for row in rows}
+
+        with _trigger_cache_lock:
+            _trigger_cache[key] = (signature, triggers)
+        return dict(triggers)
+
+    except sqlite3.Error as e:
+        raise_if_transient(e)
         logger.warning(f"Failed to get triggers: {e}")
         return {}
 
@@ -95,29 +159,20 @@ def upsert_trigger(
 
     Returns:
         Row ID of inserted/updated trigger
+
+    Raises:
+        TransientDBError: If the database stays locked past the busy timeout
     """
     try:
-        db = PongogoDatabase(db_path=db_path or get_default_db_path())
+        db = get_database(db_path)
+        type_value = trigger_type.value
         now = datetime.now().isoformat()
 
         # Try insert first, update if conflict
         row_id = db.execute_insert(
-            """
-            INSERT INTO routing_triggers
-            (trigger_type, trigger_key, trigger_value, category, description,
-             source, confidence, enabled, created_by, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(trigger_type, trigger_key) DO UPDATE SET
-                trigger_value = excluded.trigger_value,
-                category = excluded.category,
-                description = excluded.description,
-                source = excluded.source,
-                confidence = excluded.confidence,
-                enabled = excluded.enabled,
-                updated_at = excluded.updated_at
-            """,
+            _UPSERT_TRIGGER_SQL,
             (
-                trigger_type.value,
+                type_value,
                 trigger_key,
                 trigger_value,
                 category,
@@ -131,10 +186,12 @@ def upsert_trigger(
             ),
         )
 
-        logger.debug(f"Upserted trigger: {trigger_type.value}/{trigger_key}")
+        _invalidate_trigger_cache()
+        logger.debug(f"Upserted trigger: {type_value}/{trigger_key}")
         return row_id
 
-    except Exception as e:
+    except sqlite3.Error as e:
+        raise_if_transient(e)
         logger.warning(f"Failed to upsert trigger: {e}")
         return 0
 
@@ -159,35 +216,51 @@ def bulk_load_triggers(
 
     Returns:
         Number of triggers loaded
+
+    Raises:
+        TransientDBError: If the database stays locked past the busy timeout
     """
     try:
-        db = PongogoDatabase(db_path=db_path or get_default_db_path())
-
-        if replace_existing:
-            db.execute_update(
-                """
-                UPDATE routing_triggers
-                SET enabled = 0, updated_at = ?
-                WHERE trigger_type = ? AND source = ?
-                """,
-                (datetime.now().isoformat(), trigger_type.value, source),
+        db = get_database(db_path)
+        type_value = trigger_type.value
+        now = datetime.now().isoformat()
+        rows = [
+            (
+                type_value,
+                key,
+                value,
+                None,
+                None,
+                source,
+                "HIGH",
+                True,
+                None,
+                now,
+                now,
             )
-
-        count = 0
-        for key, value in triggers.items():
-            upsert_trigger(
-                trigger_type=trigger_type,
-                trigger_key=key,
-                trigger_value=value,
-                source=source,
-                db_path=db_path,
+            for key, value in triggers.items()
+        ]
+
+        # One transaction for the whole batch instead of a commit per trigger
+        with db.connection() as conn:
+            if replace_existing:
+                conn.execute(
+                    _DISABLE_TRIGGERS_SQL,
+                    (now, type_value, source),
+                )
+
+            conn.executemany(
+                _UPSERT_TRIGGER_SQL,
+                rows,
             )
-            count += 1
 
-        logger.info(f"Loaded {count} {trigger_type.value} triggers")
+        _invalidate_trigger_cache()
+        count = len(rows)
+        logger.info(f"Loaded {count} {type_value} triggers")
         return count
 
-    except Exception as e:
+    except sqlite3.Error as e:
+        raise_if_transient(e)
         logger.warning(f"Failed to bulk load triggers: {e}")
         return 0
 
@@ -197,9 +270,12 @@ def get_trigger_stats(db_path: Path | None = None) -> dict:
 
     Returns:
         Dictionary with trigger counts by type and source
+
+    Raises:
+        TransientDBError: If the database stays locked past the busy timeout
     """
     try:
-        db = PongogoDatabase(db_path=db_path or get_default_db_path())
+        db = get_database(db_path)
 
         # Count by type
         by_type = db.execute(
@@ -229,6 +305,7 @@ def get_trigger_stats(db_path: Path | None = None) -> dict:
             "by_source": {row["source"]: row["cnt"] for row in by_source},
         }
 
-    except Exception as e:
+    except sqlite3.Error as e:
+        raise_if_transient(e)
         logger.warning(f"Failed to get trigger stats: {e}")
         return {"by_type": {}, "by_source": {}}
@@ -6,13 +6,122 @@ Provides high-level operations for discovery scanning, matching, and promotion.
 Refactored to use unified database (schema v3.0.0) at .pongogo/pongogo.db
 """
 
+import heapq
 import json
+import re
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 from ..database.database import PongogoDatabase
-from .scanner import DiscoveryScanner
+from .scanner import DiscoveredSection, DiscoveryScanner
+
+# Filename slug cleanup (see DiscoverySystem._slugify)
+_SLUG_NONWORD_RE = re.compile(r"[^\w\s-]")
+_SLUG_SPACE_RE = re.compile(r"[\s-]+")
+
+# ASCII fast path for the same rules: word characters are kept, whitespace
+# and hyphens become spaces (collapsed by split()), everything else is dropped
+_SLUG_ASCII_TABLE = str.maketrans(
+    {
+        c: " " if _SLUG_SPACE_RE.match(c) else None
+        for c in map(chr, range(128))
+        if not (c.isalnum() or c == "_")
+    }
+)
+
+# Identical content already on file (e.g. a section copied into two files) is
+# left untouched, so a scan can queue every new section and insert in one batch.
+_INSERT_DISCOVERY_SQL = """
+    INSERT INTO artifact_discovered
+    (source_file, source_type, section_title, section_content,
+     content_hash, keywords, status, discovered_at)
+    VALUES (?, ?, ?, ?, ?, ?, 'DISCOVERED', ?)
+    ON CONFLICT(content_hash) DO NOTHING
+"""
+
+_SELECT_DISCOVERY_KEYS_SQL = """
+    SELECT id, source_file, section_title, content_hash
+    FROM artifact_discovered
+    ORDER BY id
+"""
+
+_UPDATE_DISCOVERY_SQL = """
+    UPDATE artifact_discovered
+    SET section_content = ?, content_hash = ?, keywords = ?, discovered_at = ?
+    WHERE id = ?
+"""
+
+_SELECT_DISCOVERED_KEYWORDS_SQL = """
+    SELECT id, keywords FROM artifact_discovered
+    WHERE status = 'DISCOVERED'
+    ORDER BY discovered_at DESC
+"""
+
+# Full rows for ids still in DISCOVERED; {placeholders} is filled per chunk
+_SELECT_DISCOVERED_BY_ID_SQL = """
+    SELECT * FROM artifact_discovered
+    WHERE status = 'DISCOVERED' AND id IN ({placeholders})
+"""
+
+# Ids bound per IN (...) query; stays under SQLite's historic 999-parameter cap
+_MAX_IN_PARAMS = 500
+
+_SELECT_SCAN_CACHE_SQL = """
+    SELECT path, mtime_ns, size, source_type, sections FROM scan_file_cache
+"""
+
+_UPSERT_SCAN_CACHE_SQL = """
+    INSERT INTO scan_file_cache
+    (path, mtime_ns, size, source_type, sections, last_scan)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(path) DO UPDATE SET
+        mtime_ns = excluded.mtime_ns,
+        size = excluded.size,
+        source_type = excluded.source_type,
+        sections = excluded.sections,
+        last_scan = excluded.last_scan
+"""
+
+_DELETE_SCAN_CACHE_SQL = "DELETE FROM scan_file_cache WHERE path = ?"
+
+_HAS_FTS_SQL = """
+    SELECT 1 FROM sqlite_master
+    WHERE type = 'table' AND name = 'artifact_discovered_fts'
+"""
+
+# Rows matching any query keyword, best bm25 score first
+_MATCH_DISCOVERIES_FTS_SQL = """
+    SELECT d.*
+    FROM artifact_discovered_fts f
+    JOIN artifact_discovered d ON d.id = f.rowid
+    WHERE artifact_discovered_fts MATCH ? AND d.status = 'DISCOVERED'
+    ORDER BY bm25(artifact_discovered_fts), d.discovered_at DESC
+    LIMIT ?
+"""
+
+_INSERT_SCAN_HISTORY_SQL = """
+    INSERT INTO scan_history
+    (scan_date, scan_type, source_type, files_scanned, sections_found,
+     new_discoveries, updated_discoveries)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+@lru_cache(maxsize=4096)
+def _keyword_set(keywords_json: str | None) -> frozenset[str]:
+    """Decode a stored keywords column, memoized by its raw JSON text.
+
+    Keywords only change when a section is rescanned, so repeated
+    find_matches calls without FTS5 reuse the decoded sets.
+    """
+    return frozenset(json.loads(keywords_json)) if keywords_json else frozenset()
+
+
+def _utc_now() -> str:
+    """Current UTC time as an ISO 8601 string, taken once per operation."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 @dataclass
@@ -81,6 +190,8 @@ class DiscoverySystem:
         self.project_root = Path(project_root)
         self.db = PongogoDatabase(project_root=project_root)
         self.scanner = DiscoveryScanner(project_root)
+        self._use_fts = self.db.execute_one(_HAS_FTS_SQL) is not None
+        self._scan_cache_loaded = False
 
     def scan_repository(self) -> ScanResult:
         """
@@ -89,90 +200,85 @@ class DiscoverySystem:
         Returns:
             ScanResult with counts of discoveries found
         """
+        self._load_scan_cache()
         discoveries = self.scanner.scan_all()
         summary = self.scanner.get_scan_summary(discoveries)
 
         new_count = 0
         updated_count = 0
-        now = datetime.utcnow().isoformat()
+        now = _utc_now()
+
+        # Load what is already stored in one pass instead of two lookups per
+        # section: known hashes, and the row for each (source_file, title)
+        known_hashes: set[str] = set()
+        by_location: dict[tuple[str, str], tuple[int, str]] = {}
+        for row in self.db.execute(_SELECT_DISCOVERY_KEYS_SQL):
+            known_hashes.add(row["content_hash"])
+            if row["section_title"] is not None:
+                by_location.setdefault(
+                    (row["source_file"], row["section_title"]),
+                    (row["id"], row["content_hash"]),
+                )
 
-        for d in discoveries:
-            # Check if we already have this content (by hash)
-            existing = self.db.execute_one(
-                "SELECT id FROM artifact_discovered WHERE content_hash = ?",
-                (d.content_hash,),
-            )
+        to_update: dict[int, tuple] = {}
+        to_insert: dict[tuple[str, str | None], DiscoveredSection] = {}
 
-            if existing:
-                # Content unchanged, nothing to do
+        for d in discoveries:
+            # Content unchanged (or already queued this scan), nothing to do
+            if d.content_hash in known_hashes:
+                updated_count += 1
+                continue
+
+            location = (d.source_file, d.section_title)
+            stored = by_location.get(location) if d.section_title is not None else None
+
+            if stored:
+                # Same source_file + section_title exists: update its content
+                row_id, old_hash = stored
+                known_hashes.discard(old_hash)
+                to_update[row_id] = (
+                    d.section_content,
+                    d.content_hash,
+                    json.dumps(d.keywords),
+                    now,
+                    row_id,
+                )
+                by_location[location] = (row_id, d.content_hash)
+                updated_count += 1
+            elif d.section_title is not None and location in to_insert:
+                # Repeated title in one file replaces the section queued above
+                known_hashes.discard(to_insert[location].content_hash)
+                to_insert[location] = d
                 updated_count += 1
             else:
-                # Check if same source_file + section_title exists (updated content)
-                existing_by_location = self.db.execute_one(
-                    """
-                    SELECT id FROM artifact_discovered
-                    WHERE source_file = ? AND section_title = ?
-                    """,
-                    (d.source_file, d.section_title),
+                key = (
+                    location if d.section_title is not None else (d.content_hash, None)
                 )
-
-                if existing_by_location:
-                    # Update existing discovery with new content
-                    self.db.execute_update(
-                        """
-                        UPDATE artifact_discovered
-                        SET section_content = ?, content_hash = ?, keywords = ?,
-                            discovered_at = ?
-                        WHERE id = ?
-                        """,
-                        (
-                            d.section_content,
-                            d.content_hash,
-                            json.dumps(d.keywords),
-                            now,
-                            existing_by_location["id"],
-                        ),
+                to_insert[key] = d
+                new_count += 1
+            known_hashes.add(d.content_hash)
+
+        # Nested connection contexts share this single transaction
+        with self.db.connection():
+            self._save_scan_cache(scanned_at=now)
+            self.db.execute_many(_UPDATE_DISCOVERY_SQL, to_update.values())
+            self.insert_discoveries(list(to_insert.values()), discovered_at=now)
+
+            # Record scan in history
+            self.db.execute_many(
+                _INSERT_SCAN_HISTORY_SQL,
+                [
+                    (
+                        now,
+                        "repository_scan",
+                        source_type,
+                        data.get("files", 0),
+                        data.get("sections", 0),
+                        new_count,
+                        updated_count,
                     )
-                    updated_count += 1
-                else:
-                    # Insert new discovery
-                    self.db.execute_insert(
-                        """
-                        INSERT INTO artifact_discovered
-                        (source_file, source_type, section_title, section_content,
-                         content_hash, keywords, status, discovered_at)
-                        VALUES (?, ?, ?, ?, ?, ?, 'DISCOVERED', ?)
-                        """,
-                        (
-                            d.source_file,
-                            d.source_type,
-                            d.section_title,
-                            d.section_content,
-                            d.content_hash,
-                            json.dumps(d.keywords),
-                            now,
-                        ),
-                    )
-                    new_count += 1
-
-        # Record scan in history
-        for source_type, data in summary.get("by_source", {}).items():
-            self.db.execute_insert(
-                """
-                INSERT INTO scan_history
-                (scan_date, scan_type, source_type, files_scanned, sections_found,
-                 new_discoveries, updated_discoveries)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    now,
-                    "repository_scan",
-                    source_type,
-                    data.get("files", 0),
-                    data.get("sections", 0),
-                    new_count,
-                    updated_count,
-                ),
+                    for source_type, data in summary.get("by_source", {}).items()
+                ],
             )
 
         return ScanResult(
@@ -182,6 +288,82 @@ class DiscoverySystem:
             by_source=summary.get("by_source", {}),
         )
 
+    def _load_scan_cache(self) -> None:
+        """Seed the scanner's per-file cache from scan_file_cache (once)."""
+        if self._scan_cache_loaded:
+            return
+        for row in self.db.execute(_SELECT_SCAN_CACHE_SQL):
+            sections = [
+                DiscoveredSection(
+                    source_file=row["path"],
+                    source_type=row["source_type"],
+                    section_title=title,
+                    section_content=content,
+                    content_hash=content_hash,
+                    keywords=keywords,
+                )
+                for title, content, content_hash, keywords in json.loads(
+                    row["sections"]
+                )
+            ]
+            signature = (row["mtime_ns"], row["size"], row["source_type"])
+            self.scanner.file_cache[row["path"]] = (signature, sections)
+        self._scan_cache_loaded = True
+
+    def _save_scan_cache(self, scanned_at: str) -> None:
+        """Persist files parsed by the last scan and drop files no longer seen."""
+        cache = self.scanner.file_cache
+        stale = [path for path in cache if path not in self.scanner.scanned_files]
+        for path in stale:
+            del cache[path]
+        self.db.execute_many(_DELETE_SCAN_CACHE_SQL, [(path,) for path in stale])
+
+        rows = []
+        for path in self.scanner.parsed_files:
+            (mtime_ns, size, source_type), sections = cache[path]
+            encoded = json.dumps(
+                [
+                    [d.section_title, d.section_content, d.content_hash, d.keywords]
+                    for d in sections
+                ]
+            )
+            rows.append((path, mtime_ns, size, source_type, encoded, scanned_at))
+        self.db.execute_many(_UPSERT_SCAN_CACHE_SQL, rows)
+
+    def insert_discoveries(
+        self, discoveries: list[DiscoveredSection], discovered_at: str | None = None
+    ) -> int:
+        """
+        Insert scanned sections in a single transaction.
+
+        Sections whose content_hash is already stored are skipped.
+
+        Args:
+            discoveries: Sections to insert
+            discovered_at: Timestamp to record (defaults to now)
+
+        Returns:
+            Number of rows inserted
+        """
+        if not discoveries:
+            return 0
+        discovered_at = discovered_at or _utc_now()
+        return self.db.execute_many(
+            _INSERT_DISCOVERY_SQL,
+            [
+                (
+                    d.source_file,
+                    d.source_type,
+                    d.section_title,
+                    d.section_content,
+                    d.content_hash,
+                    json.dumps(d.keywords),
+                    discovered_at,
+                )
+                for d in discoveries
+            ],
+        )
+
     def find_matches(self, keywords: list[str], limit: int = 10) -> list[Discovery]:
         """
         Find discoveries matching given keywords.
@@ -198,31 +380,42 @@ class DiscoverySystem:
         if not keywords:
             return []
 
-        # Build SQL for keyword matching
-        # Simple approach: count how many keywords match
-        discoveries = self.db.execute(
-            """
-            SELECT * FROM artifact_discovered
-            WHERE status = 'DISCOVERED'
-            ORDER BY discovered_at DESC
-            """
-        )
+        if self._use_fts:
+            # Quote each keyword so FTS5 treats it as a plain term
+            match = " OR ".join(
+                '"' + k.lower().replace('"', '""') + '"' for k in set(keywords)
+            )
+            rows = self.db.execute(_MATCH_DISCOVERIES_FTS_SQL, (match, limit))
+            return [Discovery.from_row(row) for row in rows]
 
-        # Score each discovery by keyword overlap
-        scored = []
+        # No FTS5: count how many keywords match each discovery, streaming
+        # only (id, keywords) so the current top N are all that is held
         keyword_set = {k.lower() for k in keywords}
 
-        for row in discoveries:
-            discovery_keywords = set(
-                json.loads(row["keywords"]) if row["keywords"] else []
-            )
-            overlap = len(keyword_set & discovery_keywords)
-            if overlap > 0:
-                scored.append((overlap, Discovery.from_row(row)))
+        def scored():
+            for row in self.db.iter_execute(_SELECT_DISCOVERED_KEYWORDS_SQL):
+                overlap = len(keyword_set & _keyword_set(row["keywords"]))
+                if overlap > 0:
+                    yield overlap, row["id"]
+
+        # nlargest matches a stable descending sort, so ties keep recency order
+        top_ids = [
+            discovery_id
+            for _, discovery_id in heapq.nlargest(limit, scored(), key=lambda x: x[0])
+        ]
+        if not top_ids:
+            return []
 
-        # Sort by score descending, take top N
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [d for _, d in scored[:limit]]
+        # Fetch full rows for the winners only. Rows deleted or moved out of
+        # DISCOVERED since the scan are skipped.
+        by_id = {}
+        for start in range(0, len(top_ids), _MAX_IN_PARAMS):
+            chunk = top_ids[start : start + _MAX_IN_PARAMS]
+            sql = _SELECT_DISCOVERED_BY_ID_SQL.format(
+                placeholders=",".join("?" * len(chunk))
+            )
+            by_id.update((row["id"], row) for row in self.db.execute(sql, chunk))
+        return [Discovery.from_row(by_id[i]) for i in top_ids if i in by_id]
 
     def promote(self, discovery_id: int) -> str | None:
         """
@@ -263,12 +456,14 @@ class DiscoverySystem:
         instruction_dir.mkdir(parents=True, exist_ok=True)
         instruction_path = instruction_dir / filename
 
+        # One timestamp for the generated file and the database records
+        now = _utc_now()
+
         # Generate instruction file content
-        content = self._generate_instruction_content(discovery)
+        content = self._generate_instruction_content(discovery, promoted_at=now)
         instruction_path.write_text(content, encoding="utf-8")
 
         # Create artifact_implemented record
-        now = datetime.utcnow().isoformat()
         relative_path = str(instruction_path.relative_to(self.project_root))
         word_count = len(discovery.section_content.split())
 
@@ -313,8 +508,11 @@ class DiscoverySystem:
         }
         return category_map.get(source_type, "discovered")
 
-    def _generate_instruction_content(self, discovery: Discovery) -> str:
+    def _generate_instruction_content(
+        self, discovery: Discovery, promoted_at: str | None = None
+    ) -> str:
         """Generate instruction file content from a discovery."""
+        promoted_at = promoted_at or _utc_now()
         title = discovery.section_title or "Discovered Knowledge"
         keywords_str = ", ".join(discovery.keywords[:10])
 
@@ -334,7 +532,7 @@ keywords: [{keywords_str}]
 source_file: {discovery.source_file}
 source_type: {discovery.source_type}
 discovered_at: {discovery.discovered_at}
-promoted_at: {datetime.utcnow().isoformat()}
+promoted_at: {promoted_at}
 auto_generated: true
 ---
 
@@ -348,12 +546,13 @@ auto_generated: true
 
     def _slugify(self, text: str) -> str:
         """Convert text to a valid filename slug."""
-        import re
-
         # Convert to lowercase and replace spaces/special chars with underscores
         slug = text.lower()
-        slug = re.sub(r"[^\w\s-]", "", slug)
-        slug = re.sub(r"[\s-]+", "_", slug)
+        if slug.isascii():
+            slug = "_".join(slug.translate(_SLUG_ASCII_TABLE).split())
+        else:
+            slug = _SLUG_NONWORD_RE.sub("", slug)
+            slug = _SLUG_SPACE_RE.sub("_", slug)
         slug = slug.strip("_")
         return slug[:50]  # Limit length
 
@@ -420,7 +619,7 @@ auto_generated: true
         Returns:
             True if archived, False if not found
         """
-        now = datetime.utcnow().isoformat()
+        now = _utc_now()
         affected = self.db.execute_update(
             """
             UPDATE artifact_discovered
@@ -438,20 +637,20 @@ auto_generated: true
         Returns:
             Dictionary with counts and status breakdown
         """
-        # Count total
-        total_row = self.db.execute_one(
-            "SELECT COUNT(*) as cnt FROM artifact_discovered"
+        # Count by status in one pass; total is the sum over all statuses
+        status_rows = self.db.execute(
+            """
+            SELECT status, COUNT(*) as cnt
+            FROM artifact_discovered
+            GROUP BY status
+            """
         )
-        total = total_row["cnt"] if total_row else 0
-
-        # Count by status
-        by_status = {}
-        for status in ["DISCOVERED", "PROMOTED", "ARCHIVED"]:
-            row = self.db.execute_one(
-                "SELECT COUNT(*) as cnt FROM artifact_discovered WHERE status = ?",
-                (status,),
-            )
-            by_status[status] = row["cnt"] if row else 0
+        counts = {row["status"]: row["cnt"] for row in status_rows}
+        total = sum(counts.values())
+        by_status = {
+            status: counts.get(status, 0)
+            for status in ["DISCOVERED", "PROMOTED", "ARCHIVED"]
+        }
 
         # Count by source type (non-archived)
         source_rows = self.db.execute(
@@ -6,10 +6,16 @@ using simple markdown parsing (no LLM required for P05 MVP).
 """
 
 import hashlib
+import os
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
+# Worker threads per folder scan (file reads release the GIL)
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 @dataclass
 class DiscoveredSection:
@@ -33,102 +39,123 @@ class DiscoveryScanner:
     # Minimum section content length to consider (avoid empty sections)
     MIN_SECTION_LENGTH = 50
 
+    # H2 and H3 headers that start a new section
+    _HEADER_RE = re.compile(r"^(#{2,3})\s+(.+)$", re.MULTILINE)
+    _NONBLANK_RE = re.compile(r"\S")
+
+    # Keyword extraction patterns
+    _TITLE_WORD_RE = re.compile(r"\b[a-zA-Z_][a-zA-Z0-9_]*\b")
+    # Code identifiers; scanned separately because matches can overlap
+    # (in "const function handler" both const and function capture)
+    _CODE_RES = [
+        re.compile(r"\bdef\s+([a-zA-Z_][a-zA-Z0-9_]*)"),  # Python functions
+        re.compile(r"\bclass\s+([A-Z][a-zA-Z0-9_]*)"),  # Python/JS classes
+        re.compile(r"\bfunction\s+([a-zA-Z_][a-zA-Z0-9_]*)"),  # JS functions
+        re.compile(r"\bconst\s+([a-zA-Z_][a-zA-Z0-9_]*)"),  # JS const
+        re.compile(r"`([a-zA-Z_][a-zA-Z0-9_]*)`"),  # Backtick identifiers
+    ]
+    # Capitalized multi-word phrases (likely proper nouns/concepts)
+    _CONCEPT_RE = re.compile(r"\b([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)+)\b")
+    _WORD_RE = re.compile(r"\b[a-zA-Z][a-zA-Z0-9_]{2,}\b")
+
     # Common words to exclude from keywords
-    STOP_WORDS = {
-        "the",
-        "a",
-        "an",
-        "and",
-        "or",
-        "but",
-        "in",
-        "on",
-        "at",
-        "to",
-        "for",
-        "of",
-        "with",
-        "by",
-        "from",
-        "as",
-        "is",
-        "was",
-        "are",
-        "were",
-        "be",
-        "been",
-        "being",
-        "have",
-        "has",
-        "had",
-        "do",
-        "does",
-        "did",
-        "will",
-        "would",
-        "could",
-        "should",
-        "may",
-        "might",
-        "must",
-        "shall",
-        "can",
-        "this",
-        "that",
-        "these",
-        "those",
-        "it",
-        "its",
-        "they",
-        "them",
-        "their",
-        "we",
-        "us",
-        "our",
-        "you",
-        "your",
-        "he",
-        "she",
-        "him",
-        "her",
-        "his",
-        "if",
-        "then",
-        "else",
-        "when",
-        "where",
-        "what",
-        "which",
-        "who",
-        "whom",
-        "how",
-        "why",
-        "all",
-        "each",
-        "every",
-        "both",
-        "few",
-        "more",
-        "most",
-        "other",
-        "some",
-        "such",
-        "no",
-        "not",
-        "only",
-        "same",
-        "so",
-        "than",
-        "too",
-        "very",
-        "just",
-        "also",
-        "now",
-        "here",
-        "there",
-        "any",
-        "into",
-    }
+    STOP_WORDS = frozenset(
+        {
+            "the",
+            "a",
+            "an",
+            "and",
+            "or",
+            "but",
+            "in",
+            "on",
+            "at",
+            "to",
+            "for",
+            "of",
+            "with",
+            "by",
+            "from",
+            "as",
+            "is",
+            "was",
+            "are",
+            "were",
+            "be",
+            "been",
+            "being",
+            "have",
+            "has",
+            "had",
+            "do",
+            "does",
+            "did",
+            "will",
+            "would",
+            "could",
+            "should",
+            "may",
+            "might",
+            "must",
+            "shall",
+            "can",
+            "this",
+            "that",
+            "these",
+            "those",
+            "it",
+            "its",
+            "they",
+            "them",
+            "their",
+            "we",
+            "us",
+            "our",
+            "you",
+            "your",
+            "he",
+            "she",
+            "him",
+            "her",
+            "his",
+            "if",
+            "then",
+            "else",
+            "when",
+            "where",
+            "what",
+            "which",
+            "who",
+            "whom",
+            "how",
+            "why",
+            "all",
+            "each",
+            "every",
+            "both",
+            "few",
+            "more",
+            "most",
+            "other",
+            "some",
+            "such",
+            "no",
+            "not",
+            "only",
+            "same",
+            "so",
+            "than",
+            "too",
+            "very",
+            "just",
+            "also",
+            "now",
+            "here",
+            "there",
+            "any",
+            "into",
+        }
+    )
 
     def __init__(self, project_root: Path):
         """
@@ -139,6 +166,15 @@ class DiscoveryScanner:
         """
         self.project_root = Path(project_root)
 
+        # Relative path -> ((mtime_ns, size, source_type), sections). Files
+        # whose signature is unchanged are not re-read or re-parsed.
+        self.file_cache: dict[
+            str, tuple[tuple[int, int, str], list[DiscoveredSection]]
+        ] = {}
+        # Files seen / parsed (cache misses) since the last scan_all()
+        self.scanned_files: set[str] = set()
+        self.parsed_files: set[str] = set()
+
     def scan_all(self) -> list[DiscoveredSection]:
         """
         Scan all knowledge sources and return discovered sections.
@@ -146,24 +182,18 @@ class DiscoveryScanner:
         Returns:
             List of DiscoveredSection objects
         """
-        discoveries = []
-
-        # Scan CLAUDE.md
-        claude_md = self.project_root / "CLAUDE.md"
-        if claude_md.exists():
-            discoveries.extend(self._scan_markdown_file(claude_md, "CLAUDE_MD"))
-
-        # Scan wiki folder
-        wiki_path = self._find_folder(self.WIKI_FOLDER_NAMES)
-        if wiki_path:
-            discoveries.extend(self._scan_folder(wiki_path, "WIKI"))
-
-        # Scan docs folder
-        docs_path = self._find_folder(self.DOCS_FOLDER_NAMES)
-        if docs_path:
-            discoveries.extend(self._scan_folder(docs_path, "DOCS"))
-
-        return discoveries
+        self.scanned_files = set()
+        self.parsed_files = set()
+
+        # CLAUDE.md, wiki/ and docs/ are independent; scan them concurrently
+        # and concatenate in that fixed order
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self.scan_claude_md),
+                executor.submit(self.scan_wiki),
+                executor.submit(self.scan_docs),
+            ]
+            return [d for future in futures for d in future.result()]
 
     def scan_claude_md(self) -> list[DiscoveredSection]:
         """Scan CLAUDE.md file only."""
@@ -196,13 +226,29 @@ class DiscoveryScanner:
 
     def _scan_folder(self, folder: Path, source_type: str) -> list[DiscoveredSection]:
         """Scan all markdown files in a folder recursively."""
-        discoveries = []
-        for md_file in folder.rglob("*.md"):
-            # Skip hidden files and directories
-            if any(part.startswith(".") for part in md_file.parts):
-                continue
-            discoveries.extend(self._scan_markdown_file(md_file, source_type))
-        return discoveries
+        md_files = []
+        for dirpath, dirnames, filenames in os.walk(folder):
+            # Prune hidden directories so their subtrees are never listed
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            md_files.extend(
+                Path(dirpath, name)
+                for name in filenames
+                if name.endswith(".md") and not name.startswith(".")
+            )
+        if len(md_files) < 2:
+            return [
+                d
+                for md_file in md_files
+                for d in self._scan_markdown_file(md_file, source_type)
+            ]
+
+        # Files are independent and mostly I/O; map() keeps os.walk top-down order
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+            results = executor.map(
+                lambda md_file: self._scan_markdown_file(md_file, source_type),
+                md_files,
+            )
+            return [d for sections in results for d in sections]
 
     def _scan_markdown_file(
         self, file_path: Path, source_type: str
@@ -213,20 +259,32 @@ class DiscoveryScanner:
         Returns:
             List of DiscoveredSection objects
         """
+        relative_path = str(file_path.relative_to(self.project_root))
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return []
+
+        self.scanned_files.add(relative_path)
+        signature = (stat.st_mtime_ns, stat.st_size, source_type)
+        cached = self.file_cache.get(relative_path)
+        if cached and cached[0] == signature:
+            return list(cached[1])
+
         try:
             content = file_path.read_text(encoding="utf-8")
         except (OSError, UnicodeDecodeError):
             return []
 
-        relative_path = str(file_path.relative_to(self.project_root))
         discoveries = []
 
-        # Split content by H2/H3 headers
-        sections = self._split_by_headers(content)
+        # Split content by H2/H3 headers; only kept sections are sliced
+        for title, start, end in self._split_by_headers(content):
+            section_content = content[start:end]
+            stripped = section_content.strip()
 
-        for title, section_content in sections:
             # Skip sections that are too short
-            if len(section_content.strip()) < self.MIN_SECTION_LENGTH:
+            if len(stripped) < self.MIN_SECTION_LENGTH:
                 continue
 
             # Calculate content hash
@@ -240,47 +298,47 @@ class DiscoveryScanner:
                     source_file=relative_path,
                     source_type=source_type,
                     section_title=title,
-                    section_content=section_content.strip(),
+                    section_content=stripped,
                     content_hash=content_hash,
                     keywords=keywords,
                 )
             )
 
-        return discoveries
+        self.file_cache[relative_path] = (signature, discoveries)
+        self.parsed_files.add(relative_path)
+        return list(discoveries)
 
-    def _split_by_headers(self, content: str) -> list[tuple[str | None, str]]:
+    def _split_by_headers(self, content: str) -> list[tuple[str | None, int, int]]:
         """
         Split markdown content by H2 (##) and H3 (###) headers.
 
+        Sections are returned as offsets into content so callers slice only
+        the sections they keep; blank sections are dropped without copying.
+
         Returns:
-            List of (header_title, section_content) tuples
+            List of (header_title, start, end) tuples
         """
-        # Pattern to match H2 and H3 headers
-        header_pattern = re.compile(r"^(#{2,3})\s+(.+)$", re.MULTILINE)
-
-        sections: list[tuple[str | None, str]] = []
+        sections: list[tuple[str | None, int, int]] = []
         last_end = 0
         last_title: str | None = None
 
-        for match in header_pattern.finditer(content):
+        for match in self._HEADER_RE.finditer(content):
             # Save previous section if it exists
             if last_end > 0 or match.start() > 0:
-                section_content = content[last_end : match.start()]
-                if section_content.strip():
-                    sections.append((last_title, section_content))
+                if self._NONBLANK_RE.search(content, last_end, match.start()):
+                    sections.append((last_title, last_end, match.start()))
 
             last_title = match.group(2).strip()
             last_end = match.end()
 
         # Don't forget the last section
         if last_end < len(content):
-            section_content = content[last_end:]
-            if section_content.strip():
-                sections.append((last_title, section_content))
+            if self._NONBLANK_RE.search(content, last_end):
+                sections.append((last_title, last_end, len(content)))
 
         # If no headers found, treat entire content as one section
-        if not sections and content.strip():
-            sections.append((None, content))
+        if not sections and self._NONBLANK_RE.search(content):
+            sections.append((None, 0, len(content)))
 
         return sections
 
@@ -297,41 +355,37 @@ class DiscoveryScanner:
 
         # Add words from title (these are high signal)
         if title:
-            title_words = re.findall(r"\b[a-zA-Z_][a-zA-Z0-9_]*\b", title.lower())
+            title_words = self._TITLE_WORD_RE.findall(title.lower())
             keywords.update(w for w in title_words if len(w) > 2)
 
         # Extract code identifiers (function names, class names)
         # Look for patterns like: def func_name, class ClassName, function funcName
-        code_patterns = [
-            r"\bdef\s+([a-zA-Z_][a-zA-Z0-9_]*)",  # Python functions
-            r"\bclass\s+([A-Z][a-zA-Z0-9_]*)",  # Python/JS classes
-            r"\bfunction\s+([a-zA-Z_][a-zA-Z0-9_]*)",  # JS functions
-            r"\bconst\s+([a-zA-Z_][a-zA-Z0-9_]*)",  # JS const
-            r"`([a-zA-Z_][a-zA-Z0-9_]*)`",  # Backtick identifiers
-        ]
-        for pattern in code_patterns:
-            matches = re.findall(pattern, content)
+        for code_re in self._CODE_RES:
+            matches = code_re.findall(content)
             keywords.update(m.lower() for m in matches if len(m) > 2)
 
         # Extract capitalized multi-word phrases (likely proper nouns/concepts)
-        concept_pattern = r"\b([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)+)\b"
-        concepts = re.findall(concept_pattern, content)
+        concepts = self._CONCEPT_RE.findall(content)
         for concept in concepts[:10]:  # Limit to avoid noise
             keywords.add(concept.lower().replace(" ", "_"))
 
         # Word frequency analysis (words appearing 3+ times)
-        words = re.findall(r"\b[a-zA-Z][a-zA-Z0-9_]{2,}\b", content.lower())
-        word_counts: dict[str, int] = {}
-        for word in words:
-            if word not in self.STOP_WORDS and len(word) > 3:
-                word_counts[word] = word_counts.get(word, 0) + 1
+        # Counting runs entirely in C (findall, Counter); stop words and
+        # short words are filtered per distinct word rather than per token.
+        # Lowercase before matching: lowercasing can change non-ASCII text
+        # (e.g. "İ" or the Kelvin sign) in ways the ASCII pattern sees.
+        word_counts = Counter(self._WORD_RE.findall(content.lower()))
 
         # Add words that appear frequently
-        frequent = [w for w, c in word_counts.items() if c >= 3]
+        frequent = [
+            w
+            for w, c in word_counts.items()
+            if c >= 3 and len(w) > 3 and w not in self.STOP_WORDS
+        ]
         keywords.update(frequent[:20])  # Limit to top 20
 
         # Remove stop words and return sorted list
-        keywords = {k for k in keywords if k not in self.STOP_WORDS}
+        keywords -= self.STOP_WORDS
         return sorted(keywords)[:30]  # Max 30 keywords per section
 
     def get_scan_summary(self, discoveries: list[DiscoveredSection]) -> dict:
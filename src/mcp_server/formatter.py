@@ -23,6 +23,99 @@ import json
 import re
 from typing import Any
 
+# YAML frontmatter block (--- at start, --- to close), with trailing blank lines
+_FRONTMATTER_BLOCK_RE = re.compile(r"^---\s*\n.*?\n---\s*\n", re.DOTALL)
+# Frontmatter text, for evaluation criteria
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
+# Rest of the closing delimiter line plus trailing blank lines
+_FRONTMATTER_TAIL_RE = re.compile(r"\s*\n")
+_SUCCESS_SIGNALS_RE = re.compile(r"success_signals:\s*\n((?:\s+-[^\n]+\n?)+)")
+_FAILURE_SIGNALS_RE = re.compile(r"failure_signals:\s*\n((?:\s+-[^\n]+\n?)+)")
+_SIGNAL_ITEM_RE = re.compile(r"-\s*(.+)")
+
+# Instruction content included per routed instruction before truncation
+EXCERPT_MAX_CHARS = 1500
+
+# XML special characters in interpolated metadata (text and attribute values)
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+# Fixed blocks of the routing XML, appended as single fragments
+_DIRECTIVE_BLOCK = (
+    "<directive>\n"
+    "You MUST read and follow these instructions before responding to the user.\n"
+    "These were automatically discovered based on the user's message context.\n"
+    "</directive>\n\n"
+)
+_GUIDANCE_REQUIREMENT = (
+    "<requirement>\n"
+    "MANDATORY: Call log_user_guidance() MCP tool BEFORE responding.\n"
+    "</requirement>\n"
+)
+_GUIDANCE_RATIONALE = (
+    "<rationale>\n"
+    "User guidance not captured is lost. The user will repeat themselves, "
+    "causing friction.\n"
+    "</rationale>\n"
+    "</action>\n\n"
+)
+_EXPECTED_BEHAVIOR_BLOCK = (
+    "<expected_behavior>\n"
+    "After reading the above:\n"
+    "1. Identify which instruction applies to the user's request\n"
+    "2. READ the instruction content (not from memory)\n"
+    "3. Follow step-by-step guidance if present\n"
+    "4. Check compliance_criteria to verify correct execution\n"
+    "5. If unsure about requirements, ask the user rather than guessing\n"
+    "</expected_behavior>\n\n"
+    "</pongogo_routing>"
+)
+
+
+def _xml_escape(value: Any) -> str:
+    """Escape a metadata value for an XML tag body or double-quoted attribute."""
+    return f"{value}".translate(_XML_ESCAPE)
+
+
+def _frontmatter_bounds(content: str) -> tuple[str | None, int]:
+    """
+    Locate YAML frontmatter without copying the body.
+
+    Args:
+        content: Full instruction file content
+
+    Returns:
+        Tuple of (frontmatter text or None if absent, index where body starts)
+    """
+    # Frontmatter can only open at the very start; routed content usually
+    # has it stripped already, so skip the regexes unless they could match
+    if not content.startswith("---"):
+        return None, 0
+    match = _FRONTMATTER_RE.match(content)
+    if not match:
+        return None, 0
+
+    # The body starts after the closing line when "---" ends it; otherwise
+    # a later delimiter may close the block that gets stripped
+    tail = _FRONTMATTER_TAIL_RE.match(content, match.end())
+    if tail:
+        return match.group(1), tail.end()
+    block = _FRONTMATTER_BLOCK_RE.match(content)
+    return match.group(1), block.end() if block else 0
+
+
+def split_frontmatter(content: str) -> tuple[str | None, str]:
+    """
+    Split instruction content into YAML frontmatter text and body.
+
+    Args:
+        content: Full instruction file content
+
+    Returns:
+        Tuple of (frontmatter text or None if absent, content without it)
+    """
+    frontmatter, body_start = _frontmatter_bounds(content)
+    return frontmatter, content[body_start:]
+
 
 def extract_content_without_frontmatter(content: str) -> str:
     """
@@ -34,42 +127,46 @@ def extract_content_without_frontmatter(content: str) -> str:
     Returns:
         Content with frontmatter stripped
     """
-    # Match YAML frontmatter (--- at start, --- to close)
-    frontmatter_pattern = r"^---\s*\n.*?\n---\s*\n"
-    return re.sub(frontmatter_pattern, "", content, flags=re.DOTALL)
+    return split_frontmatter(content)[1]
 
 
 def _extract_evaluation_criteria(content: str) -> dict[str, list[str]]:
     """
     Extract evaluation criteria from instruction content if present.
 
-    Looks for success_signals and failure_signals in YAML frontmatter.
-
     Args:
         content: Full instruction file content
 
     Returns:
         Dict with 'success' and 'failure' lists, empty if not found
     """
-    criteria: dict[str, list[str]] = {"success": [], "failure": []}
+    return _parse_evaluation_criteria(split_frontmatter(content)[0])
 
-    # Try to extract from YAML frontmatter
-    frontmatter_match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
-    if not frontmatter_match:
-        return criteria
 
-    frontmatter = frontmatter_match.group(1)
+def _parse_evaluation_criteria(frontmatter: str | None) -> dict[str, list[str]]:
+    """
+    Parse success_signals and failure_signals from YAML frontmatter text.
+
+    Args:
+        frontmatter: Frontmatter text from split_frontmatter (None if absent)
+
+    Returns:
+        Dict with 'success' and 'failure' lists, empty if not found
+    """
+    criteria: dict[str, list[str]] = {"success": [], "failure": []}
+    if not frontmatter:
+        return criteria
 
     # Extract success_signals
-    success_match = re.search(r"success_signals:\s*\n((?:\s+-[^\n]+\n?)+)", frontmatter)
+    success_match = _SUCCESS_SIGNALS_RE.search(frontmatter)
     if success_match:
-        signals = re.findall(r"-\s*(.+)", success_match.group(1))
+        signals = _SIGNAL_ITEM_RE.findall(success_match.group(1))
         criteria["success"] = [s.strip() for s in signals[:3]]  # Limit to 3
 
     # Extract failure_signals
-    failure_match = re.search(r"failure_signals:\s*\n((?:\s+-[^\n]+\n?)+)", frontmatter)
+    failure_match = _FAILURE_SIGNALS_RE.search(frontmatter)
     if failure_match:
-        signals = re.findall(r"-\s*(.+)", failure_match.group(1))
+        signals = _SIGNAL_ITEM_RE.findall(failure_match.group(1))
         criteria["failure"] = [s.strip() for s in signals[:3]]  # Limit to 3
 
     return criteria
@@ -111,39 +208,23 @@ def format_routing_results(
     # =========================================================================
     # DIRECTIVE: What Claude MUST do (CLR-1: Colleague-test clarity)
     # =========================================================================
-    output_parts.append("<directive>\n")
-    output_parts.append(
-        "You MUST read and follow these instructions before responding to the user.\n"
-    )
-    output_parts.append(
-        "These were automatically discovered based on the user's message context.\n"
-    )
-    output_parts.append("</directive>\n\n")
+    output_parts.append(_DIRECTIVE_BLOCK)
 
     # =========================================================================
     # GUIDANCE ACTION: User preference capture (blocking)
     # =========================================================================
     if guidance_action:
         output_parts.append('<action type="guidance_capture" priority="blocking">\n')
-        output_parts.append("<requirement>\n")
+        output_parts.append(_GUIDANCE_REQUIREMENT)
         output_parts.append(
-            "MANDATORY: Call log_user_guidance() MCP tool BEFORE responding.\n"
-        )
-        output_parts.append("</requirement>\n")
-        output_parts.append(
-            f"<directive>{guidance_action.get('directive', '')}</directive>\n"
+            f"<directive>{_xml_escape(guidance_action.get('directive', ''))}</directive>\n"
         )
         output_parts.append("<parameters>\n")
         output_parts.append(
             f"{json.dumps(guidance_action.get('parameters', {}), indent=2)}\n"
         )
         output_parts.append("</parameters>\n")
-        output_parts.append("<rationale>\n")
-        output_parts.append(
-            "User guidance not captured is lost. The user will repeat themselves, causing friction.\n"
-        )
-        output_parts.append("</rationale>\n")
-        output_parts.append("</action>\n\n")
+        output_parts.append(_GUIDANCE_RATIONALE)
 
     # =========================================================================
     # PROCEDURAL WARNING: Must-read instructions
@@ -151,10 +232,10 @@ def format_routing_results(
     if procedural_warning:
         output_parts.append('<warning type="procedural">\n')
         output_parts.append(
-            f"<message>{procedural_warning.get('warning', '')}</message>\n"
+            f"<message>{_xml_escape(procedural_warning.get('warning', ''))}</message>\n"
         )
         output_parts.append(
-            f"<enforcement>{procedural_warning.get('enforcement', 'Read before executing')}</enforcement>\n"
+            f"<enforcement>{_xml_escape(procedural_warning.get('enforcement', 'Read before executing'))}</enforcement>\n"
         )
         output_parts.append("</warning>\n\n")
 
@@ -164,13 +245,13 @@ def format_routing_results(
     if friction_risk and friction_risk.get("enabled"):
         output_parts.append('<monitoring type="friction_risk">\n')
         output_parts.append(
-            f"<guidance_type>{friction_risk.get('guidance_type', 'unknown')}</guidance_type>\n"
+            f"<guidance_type>{_xml_escape(friction_risk.get('guidance_type', 'unknown'))}</guidance_type>\n"
         )
         output_parts.append(
             f"<echo_detected>{friction_risk.get('echo_detected', False)}</echo_detected>\n"
         )
         output_parts.append(
-            f"<frustration_level>{friction_risk.get('frustration_level', 'none')}</frustration_level>\n"
+            f"<frustration_level>{_xml_escape(friction_risk.get('frustration_level', 'none'))}</frustration_level>\n"
         )
         output_parts.append("</monitoring>\n\n")
 
@@ -181,11 +262,11 @@ def format_routing_results(
         output_parts.append(f'<instructions count="{count}">\n')
 
         for _idx, instruction in enumerate(instructions, 1):
-            inst_id = instruction.get("id", "unknown")
-            category = instruction.get("category", "unknown")
+            inst_id = _xml_escape(instruction.get("id", "unknown"))
+            category = _xml_escape(instruction.get("category", "unknown"))
             description = instruction.get("description", "")
             score = instruction.get("routing_score", 0)
-            priority = instruction.get("priority", "P2")
+            priority = _xml_escape(instruction.get("priority", "P2"))
             file_path = instruction.get("file_path", "")
             content = instruction.get("content", "")
 
@@ -195,35 +276,38 @@ def format_routing_results(
             output_parts.append(f"<category>{category}</category>\n")
 
             if file_path:
-                output_parts.append(f"<file>{file_path}</file>\n")
+                output_parts.append(f"<file>{_xml_escape(file_path)}</file>\n")
 
             if description:
-                output_parts.append(f"<summary>{description}</summary>\n")
+                output_parts.append(f"<summary>{_xml_escape(description)}</summary>\n")
 
             # Extract and include evaluation criteria if present
             if content:
-                criteria = _extract_evaluation_criteria(content)
+                frontmatter, body_start = _frontmatter_bounds(content)
+                criteria = _parse_evaluation_criteria(frontmatter)
                 if criteria["success"] or criteria["failure"]:
                     output_parts.append("<compliance_criteria>\n")
                     if criteria["success"]:
                         output_parts.append("<success>\n")
                         for signal in criteria["success"]:
-                            output_parts.append(f"- {signal}\n")
+                            output_parts.append(f"- {_xml_escape(signal)}\n")
                         output_parts.append("</success>\n")
                     if criteria["failure"]:
                         output_parts.append("<failure>\n")
                         for signal in criteria["failure"]:
-                            output_parts.append(f"- {signal}\n")
+                            output_parts.append(f"- {_xml_escape(signal)}\n")
                         output_parts.append("</failure>\n")
                     output_parts.append("</compliance_criteria>\n")
 
-                # Include content (frontmatter stripped, truncated)
-                content_body = extract_content_without_frontmatter(content)
-                excerpt = (
-                    content_body[:1500] + "\n[...truncated]"
-                    if len(content_body) > 1500
-                    else content_body
-                )
+                # Include content (frontmatter stripped, truncated); slice the
+                # excerpt straight out of content rather than copying the body
+                if len(content) - body_start > EXCERPT_MAX_CHARS:
+                    excerpt = (
+                        content[body_start : body_start + EXCERPT_MAX_CHARS]
+                        + "\n[...truncated]"
+                    )
+                else:
+                    excerpt = content[body_start:]
                 output_parts.append("<content>\n")
                 output_parts.append(excerpt)
                 output_parts.append("\n</content>\n")
@@ -235,17 +319,6 @@ def format_routing_results(
     # =========================================================================
     # EXPECTED BEHAVIOR: How Claude should process (COT-2, HALL-1)
     # =========================================================================
-    output_parts.append("<expected_behavior>\n")
-    output_parts.append("After reading the above:\n")
-    output_parts.append("1. Identify which instruction applies to the user's request\n")
-    output_parts.append("2. READ the instruction content (not from memory)\n")
-    output_parts.append("3. Follow step-by-step guidance if present\n")
-    output_parts.append("4. Check compliance_criteria to verify correct execution\n")
-    output_parts.append(
-        "5. If unsure about requirements, ask the user rather than guessing\n"
-    )
-    output_parts.append("</expected_behavior>\n\n")
-
-    output_parts.append("</pongogo_routing>")
+    output_parts.append(_EXPECTED_BEHAVIOR_BLOCK)
 
     return "".join(output_parts)
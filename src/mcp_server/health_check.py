@@ -7,8 +7,13 @@ Task #470: Implement MCP health check tools
 Parent Epic: #463 (enable_routing_event_capture)
 """
 
+import copy
 import logging
+import os
 import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -20,17 +25,46 @@ from mcp_server.event_capture import get_events_db_path
 
 logger = logging.getLogger(__name__)
 
+# Cache for get_health_status results, keyed on the paths that were checked
+# so a changed project root or database location is never served stale
+_health_cache: dict = {"key": None, "result": None, "timestamp": 0.0}
+HEALTH_CACHE_TTL = 2.0  # seconds
+
+# Container detection result; containerization cannot change within a process
+_container_status: dict[str, Any] | None = None
+
+# Last config verdict, keyed on the config path and its change markers
+_config_cache: dict = {"key": None, "result": None}
+
+# datetime.fromisoformat accepts a trailing "Z" from Python 3.11
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+
 
 def check_container_status() -> dict[str, Any]:
     """
     Check Docker container status.
 
+    Detection runs once per process; later calls return the cached result.
+
     Returns:
         Dictionary with:
         - status: "healthy" | "unhealthy" | "unknown"
         - reason: Optional explanation when not healthy
         - container_id: Optional container ID when available
     """
+    global _container_status
+
+    if _container_status is None:
+        status = _detect_container_status()
+        if status["status"] == "unknown":
+            # Detection failed; retry on the next call
+            return status
+        _container_status = status
+    return dict(_container_status)
+
+
+def _detect_container_status() -> dict[str, Any]:
+    """Detect whether the server runs inside a container."""
     try:
         # Note: MCP server runs INSIDE the container, so we check if we're containerized
         # by looking for container markers
@@ -71,34 +105,29 @@ def check_container_status() -> dict[str, Any]:
         }
 
 
-def check_database_health() -> dict[str, Any]:
-    """
-    Check events database health.
+def _is_writable(db_path: Path) -> bool:
+    """Check OS permissions for writing a database and its journal files."""
+    return os.access(db_path, os.W_OK) and os.access(db_path.parent, os.W_OK)
 
-    Returns:
-        Dictionary with:
-        - status: "healthy" | "missing" | "locked" | "error"
-        - path: Database file path
-        - reason: Optional explanation
-        - writable: Boolean if database is writable
-    """
-    db_path = get_events_db_path()
-
-    if not db_path.exists():
-        return {
-            "status": "missing",
-            "path": str(db_path),
-            "reason": "Database file not found",
-            "writable": False,
-        }
 
+def _database_status(
+    conn: sqlite3.Connection, db_path: Path, deep: bool
+) -> dict[str, Any]:
+    """Test read and write access over an open events database connection."""
     try:
-        # Test read + write capability with short timeout
-        conn = sqlite3.connect(db_path, timeout=1)
+        # Test read capability, then write capability via permissions or,
+        # in deep mode, by taking the write lock
         conn.execute("SELECT 1")
-        conn.execute("BEGIN IMMEDIATE")  # Test write lock
-        conn.rollback()
-        conn.close()
+        if deep:
+            conn.execute("BEGIN IMMEDIATE")  # Test write lock
+            conn.rollback()
+        elif not _is_writable(db_path):
+            return {
+                "status": "error",
+                "path": str(db_path),
+                "reason": "Database is not writable",
+                "writable": False,
+            }
 
         return {
             "status": "healthy",
@@ -132,38 +161,14 @@ def check_database_health() -> dict[str, Any]:
         }
 
 
-def check_event_capture() -> dict[str, Any]:
-    """
-    Check event capture status (recent activity).
-
-    Returns:
-        Dictionary with:
-        - status: "active" | "empty" | "stale" | "unknown"
-        - total_count: Number of events
-        - last_event: Last event timestamp
-        - last_event_ago: Human-readable time since last event
-        - reason: Explanation
-    """
-    db_path = get_events_db_path()
-
-    if not db_path.exists():
-        return {
-            "status": "unknown",
-            "total_count": 0,
-            "last_event": None,
-            "last_event_ago": None,
-            "reason": "Database not found",
-        }
-
+def _event_capture_status(conn: sqlite3.Connection) -> dict[str, Any]:
+    """Summarize recent routing event activity over an open connection."""
     try:
-        conn = sqlite3.connect(db_path, timeout=1)
-
         # Get total count
         cursor = conn.execute("SELECT COUNT(*) FROM routing_events")
         total_count = cursor.fetchone()[0]
 
         if total_count == 0:
-            conn.close()
             return {
                 "status": "empty",
                 "total_count": 0,
@@ -177,12 +182,13 @@ def check_event_capture() -> dict[str, Any]:
             "SELECT timestamp FROM routing_events ORDER BY timestamp DESC LIMIT 1"
         )
         last_event = cursor.fetchone()[0]
-        conn.close()
 
         # Calculate time since last event
         now = datetime.now(timezone.utc)
         # Handle both offset-naive (no TZ) and offset-aware timestamps
-        last_event_str = last_event.replace("Z", "+00:00")
+        last_event_str = (
+            last_event if _FROMISO_HANDLES_Z else last_event.replace("Z", "+00:00")
+        )
         last_event_dt = datetime.fromisoformat(last_event_str)
         # If timestamp has no timezone info, assume UTC
         if last_event_dt.tzinfo is None:
@@ -224,10 +230,125 @@ def check_event_capture() -> dict[str, Any]:
         }
 
 
-def check_config_validity() -> dict[str, Any]:
+def _probe_events_db(
+    deep: bool = False, db_path: Path | None = None
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Check events database health and event capture over one connection.
+
+    Args:
+        deep: Take the write lock instead of checking file permissions
+        db_path: Already-resolved events database path (default: resolve)
+
+    Returns:
+        Tuple of (database health, event capture) dictionaries, as returned
+        by check_database_health and check_event_capture
+    """
+    if db_path is None:
+        db_path = get_events_db_path()
+
+    if not db_path.exists():
+        return (
+            {
+                "status": "missing",
+                "path": str(db_path),
+                "reason": "Database file not found",
+                "writable": False,
+            },
+            {
+                "status": "unknown",
+                "total_count": 0,
+                "last_event": None,
+                "last_event_ago": None,
+                "reason": "Database not found",
+            },
+        )
+
+    try:
+        conn = sqlite3.connect(db_path, timeout=1)
+    except Exception as e:
+        logger.error(f"Error opening events database: {e}")
+        return (
+            {
+                "status": "error",
+                "path": str(db_path),
+                "reason": str(e),
+                "writable": False,
+            },
+            {
+                "status": "unknown",
+                "total_count": 0,
+                "last_event": None,
+                "last_event_ago": None,
+                "reason": str(e),
+            },
+        )
+
+    try:
+        return _database_status(conn, db_path, deep), _event_capture_status(conn)
+    finally:
+        conn.close()
+
+
+def check_database_health(deep: bool = False) -> dict[str, Any]:
+    """
+    Check events database health.
+
+    Writability is judged from file permissions. Deep mode takes the write
+    lock instead, which also detects a database locked by another process.
+
+    Args:
+        deep: Take the write lock instead of checking file permissions
+
+    Returns:
+        Dictionary with:
+        - status: "healthy" | "missing" | "locked" | "error"
+        - path: Database file path
+        - reason: Optional explanation
+        - writable: Boolean if database is writable
+    """
+    return _probe_events_db(deep)[0]
+
+
+def check_event_capture() -> dict[str, Any]:
+    """
+    Check event capture status (recent activity).
+
+    Returns:
+        Dictionary with:
+        - status: "active" | "empty" | "stale" | "unknown"
+        - total_count: Number of events
+        - last_event: Last event timestamp
+        - last_event_ago: Human-readable time since last event
+        - reason: Explanation
+    """
+    return _probe_events_db()[1]
+
+
+def _config_signature(config_path: Path, instructions_dir: Path) -> tuple:
+    """Change marker for the config check.
+
+    Uses the config file's mtime and size plus the instructions directory's
+    mtime, which changes when category directories are added or removed.
+    """
+    st = config_path.stat()
+    try:
+        instructions_mtime = instructions_dir.stat().st_mtime_ns
+    except OSError:
+        instructions_mtime = None
+    return (config_path, st.st_mtime_ns, st.st_size, instructions_mtime)
+
+
+def check_config_validity(project_root: Path | None = None) -> dict[str, Any]:
     """
     Check configuration file validity.
 
+    The verdict is reused while config.yaml and the instructions directory
+    are unchanged.
+
+    Args:
+        project_root: Already-resolved project root (default: resolve)
+
     Returns:
         Dictionary with:
         - status: "valid" | "invalid" | "missing"
@@ -237,7 +358,8 @@ def check_config_validity() -> dict[str, Any]:
     """
     # Check .pongogo directory using project root (not cwd!)
     # This is critical for containers where cwd=/app but config is at /project/.pongogo
-    project_root = get_project_root()
+    if project_root is None:
+        project_root = get_project_root()
     pongogo_dir = project_root / ".pongogo"
     config_path = pongogo_dir / "config.yaml"
 
@@ -257,30 +379,39 @@ def check_config_validity() -> dict[str, Any]:
             "categories_count": 0,
         }
 
+    instructions_dir = pongogo_dir / "instructions"
     try:
-        with open(config_path) as f:
-            yaml.safe_load(f)
+        cache_key = _config_signature(config_path, instructions_dir)
+        if _config_cache["key"] == cache_key:
+            return dict(_config_cache["result"])
 
-        # Count instruction categories
-        instructions_dir = pongogo_dir / "instructions"
-        categories_count = 0
-        if instructions_dir.exists():
-            categories_count = sum(1 for p in instructions_dir.iterdir() if p.is_dir())
-
-        return {
-            "status": "valid",
-            "path": str(config_path),
-            "reason": "Configuration is valid YAML",
-            "categories_count": categories_count,
-        }
+        try:
+            with open(config_path) as f:
+                yaml.safe_load(f)
+        except yaml.YAMLError as e:
+            result = {
+                "status": "invalid",
+                "path": str(config_path),
+                "reason": f"Invalid YAML: {e}",
+                "categories_count": 0,
+            }
+        else:
+            # Count instruction categories
+            categories_count = 0
+            if instructions_dir.exists():
+                categories_count = sum(
+                    1 for p in instructions_dir.iterdir() if p.is_dir()
+                )
+
+            result = {
+                "status": "valid",
+                "path": str(config_path),
+                "reason": "Configuration is valid YAML",
+                "categories_count": categories_count,
+            }
 
-    except yaml.YAMLError as e:
-        return {
-            "status": "invalid",
-            "path": str(config_path),
-            "reason": f"Invalid YAML: {e}",
-            "categories_count": 0,
-        }
+        _config_cache.update(key=cache_key, result=result)
+        return dict(result)
 
     except Exception as e:
         logger.error(f"Error checking config validity: {e}")
@@ -292,13 +423,19 @@ def check_config_validity() -> dict[str, Any]:
         }
 
 
-def check_pi_system_storage() -> dict[str, Any]:
+def check_pi_system_storage(
+    deep: bool = False, project_root: Path | None = None
+) -> dict[str, Any]:
     """
     Check PI System storage access (potential_improvements.db).
 
     This validates that user guidance capture will work correctly.
     Critical for containers where /app/ is read-only but /project/ is writable.
 
+    Args:
+        deep: Take the PI database write lock instead of checking permissions
+        project_root: Already-resolved project root (default: resolve)
+
     Returns:
         Dictionary with:
         - status: "healthy" | "error" | "read_only"
@@ -306,7 +443,8 @@ def check_pi_system_storage() -> dict[str, Any]:
         - reason: Explanation
         - writable: Boolean if storage is writable
     """
-    project_root = get_project_root()
+    if project_root is None:
+        project_root = get_project_root()
     pi_db_path = project_root / ".pongogo" / "potential_improvements.db"
     pongogo_dir = project_root / ".pongogo"
 
@@ -340,10 +478,20 @@ def check_pi_system_storage() -> dict[str, Any]:
         if pi_db_path.exists():
             try:
                 conn = sqlite3.connect(pi_db_path, timeout=1)
-                conn.execute("SELECT 1")
-                conn.execute("BEGIN IMMEDIATE")
-                conn.rollback()
-                conn.close()
+                try:
+                    conn.execute("SELECT 1")
+                    if deep:
+                        conn.execute("BEGIN IMMEDIATE")
+                        conn.rollback()
+                finally:
+                    conn.close()
+                if not deep and not os.access(pi_db_path, os.W_OK):
+                    return {
+                        "status": "error",
+                        "path": str(pi_db_path),
+                        "reason": "PI database is not writable",
+                        "writable": False,
+                    }
                 return {
                     "status": "healthy",
                     "path": str(pi_db_path),
@@ -389,10 +537,31 @@ def check_pi_system_storage() -> dict[str, Any]:
         }
 
 
-def get_health_status() -> dict[str, Any]:
+def _check_config_and_pi_storage(
+    deep: bool, project_root: Path
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Run the config and PI storage checks in order."""
+    return (
+        check_config_validity(project_root),
+        check_pi_system_storage(deep, project_root),
+    )
+
+
+def invalidate_health_cache() -> None:
+    """Drop the cached get_health_status result."""
+    _health_cache.update(key=None, result=None, timestamp=0.0)
+
+
+def get_health_status(deep: bool = False) -> dict[str, Any]:
     """
     Get comprehensive health status of Pongogo installation.
 
+    Results are cached for HEALTH_CACHE_TTL seconds so back-to-back polls
+    share one set of checks. The timestamp reports when the checks ran.
+
+    Args:
+        deep: Probe database writability by taking the write lock
+
     Returns:
         Dictionary with:
         - overall: "healthy" | "degraded" | "unhealthy"
@@ -403,11 +572,31 @@ def get_health_status() -> dict[str, Any]:
         - pi_storage: PI System storage check
         - timestamp: Check timestamp (ISO format)
     """
-    container = check_container_status()
-    database = check_database_health()
-    events = check_event_capture()
-    config = check_config_validity()
-    pi_storage = check_pi_system_storage()
+    # Resolve paths once, before any check can create .pongogo/ and change
+    # where the events database resolves to
+    db_path = get_events_db_path()
+    project_root = get_project_root()
+    cache_key = (db_path, project_root, deep)
+    now = time.monotonic()
+    if (
+        _health_cache["key"] == cache_key
+        and (now - _health_cache["timestamp"]) < HEALTH_CACHE_TTL
+    ):
+        logger.debug("Using cached health status")
+        return copy.deepcopy(_health_cache["result"])
+
+    # The checks are independent and I/O bound, so run them concurrently.
+    # Config runs before PI storage in the same task because the storage
+    # check may create .pongogo/, which would change the config reason.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        container_future = executor.submit(check_container_status)
+        events_db_future = executor.submit(_probe_events_db, deep, db_path)
+        project_future = executor.submit(
+            _check_config_and_pi_storage, deep, project_root
+        )
+        container = container_future.result()
+        database, events = events_db_future.result()
+        config, pi_storage = project_future.result()
 
     # Determine overall status
     statuses = [
@@ -427,7 +616,7 @@ def get_health_status() -> dict[str, Any]:
     else:
         overall = "degraded"
 
-    return {
+    result = {
         "overall": overall,
         "container": container,
         "database": database,
@@ -436,3 +625,6 @@ def get_health_status() -> dict[str, Any]:
         "pi_storage": pi_storage,
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
+    # Callers get their own copy; nested check results must not be shared
+    _health_cache.update(key=cache_key, result=copy.deepcopy(result), timestamp=now)
+    return result
@@ -53,13 +53,18 @@ References:
 """
 
 import fnmatch
+import heapq
 import logging
+import os
 import re
 import sqlite3
+from collections.abc import Sequence
 from datetime import datetime as _datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+from mcp_server.database import get_database
 from mcp_server.instruction_handler import InstructionHandler
 from mcp_server.routing_engine import (
     FeatureSpec,
@@ -160,27 +165,29 @@ APPROVAL_PATTERNS = {
 }
 
 # Word patterns that suggest approval when message is short
-APPROVAL_WORDS = {
-    "yes",
-    "ok",
-    "okay",
-    "sure",
-    "good",
-    "great",
-    "fine",
-    "nice",
-    "perfect",
-    "excellent",
-    "thanks",
-    "approved",
-    "continue",
-    "proceed",
-    "agreed",
-    "correct",
-    "right",
-    "yep",
-    "yeah",
-}
+APPROVAL_WORDS = frozenset(
+    {
+        "yes",
+        "ok",
+        "okay",
+        "sure",
+        "good",
+        "great",
+        "fine",
+        "nice",
+        "perfect",
+        "excellent",
+        "thanks",
+        "approved",
+        "continue",
+        "proceed",
+        "agreed",
+        "correct",
+        "right",
+        "yep",
+        "yeah",
+    }
+)
 
 # IMP-003 refinement: Conservative commencement phrases (table-based, not regex)
 # These indicate continuation intent and should NOT suppress routing
@@ -218,6 +225,86 @@ COMMENCEMENT_PHRASES = [
     "proceed with",
 ]
 
+# Single-pass matcher for COMMENCEMENT_PHRASES: a phrase counts when it starts
+# the (lowercased) message or follows a space
+_COMMENCEMENT_RE = re.compile(
+    r"(?:^| )(?:" + "|".join(map(re.escape, COMMENCEMENT_PHRASES)) + r")"
+)
+
+# Stop words dropped by _extract_keywords
+KEYWORD_STOP_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "from",
+        "as",
+        "is",
+        "was",
+        "are",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "should",
+        "could",
+        "may",
+        "might",
+        "must",
+        "can",
+        "this",
+        "that",
+        "these",
+        "those",
+        "i",
+        "you",
+        "he",
+        "she",
+        "it",
+        "we",
+        "they",
+    }
+)
+
+# Word tokens as _extract_keywords and _detect_violations see them
+_TOKEN_RE = re.compile(r"\w+")
+
+# IMP-009: most recent routing event before the current one
+# unified schema v3.0.0: routed_instructions (JSON array), routing_scores (JSON obj)
+_PREVIOUS_ROUTING_SQL = """
+    SELECT routed_instructions, routing_scores
+    FROM routing_events
+    WHERE instruction_count > 0
+    ORDER BY timestamp DESC
+    LIMIT 1 OFFSET 1
+"""
+
+# Trailing punctuation stripped before exact approval matching
+_APPROVAL_STRIP_RE = re.compile(r"[.!?,]+$")
+_APPROVAL_PUNCT = ".,!?"
+# Messages with more words than this cannot be approvals: stripping trailing
+# punctuation removes at most one word, and checks 2-3 need <= 5 words
+_APPROVAL_MAX_WORDS = max(5, max(len(p.split()) for p in APPROVAL_PATTERNS) + 1)
+
 #
 # Evidence: Events 32, 33, 43, 45, 47, 50, 53 from Task #130 missed violations
 # Note: Refined to avoid false positives on common technical terms
@@ -246,6 +333,17 @@ VIOLATION_WORDS = {
 # Words that are only violations when emphasized (caps, exclamation, etc.)
 EMPHASIS_VIOLATION_WORDS = {"no", "stop", "bad"}
 
+# One pattern per emphasis form, each capturing which word was emphasized
+_EMPHASIS_ALTERNATION = "|".join(map(re.escape, sorted(EMPHASIS_VIOLATION_WORDS)))
+# Capitalized word, searched in the original message (e.g., "NO", "STOP")
+_EMPHASIS_CAPS_RE = re.compile(rf"\b({_EMPHASIS_ALTERNATION.upper()})\b")
+# Word with exclamation, searched in the lowercased message (e.g., "no!")
+_EMPHASIS_EXCLAIMED_RE = re.compile(rf"\b({_EMPHASIS_ALTERNATION})\s*!")
+# Sentence-start word, searched in the lowercased message (e.g., "No, that's")
+_EMPHASIS_SENTENCE_START_RE = re.compile(
+    rf"(?:^|[.!?]\s*)({_EMPHASIS_ALTERNATION})[,\s]"
+)
+
 # Categories to boost when violations detected
 VIOLATION_BOOST_CATEGORIES = {"trust_execution", "safety_prevention"}
 
@@ -1600,6 +1698,151 @@ def _compile_guidance_patterns(seeded: set, custom: set) -> _re.Pattern:
     return _re.compile("|".join(f"({p})" for p in merged), _re.IGNORECASE)
 
 
+def _top_by_score(scored: list[dict], limit: int) -> list[dict]:
+    """
+    Return scored[:limit] as if scored were stably sorted by routing_score desc.
+
+    Uses heapq.nlargest (O(N log k)) when only a few of many results are kept.
+    """
+    key = itemgetter("routing_score")
+    if isinstance(limit, int) and 0 <= limit < len(scored):
+        return heapq.nlargest(limit, scored, key=key)
+    return sorted(scored, key=key, reverse=True)[:limit]
+
+
+def _bundle_trigger(inst_id: str, categories: list[str]) -> str | None:
+    """
+    INSTRUCTION_BUNDLES key an instruction triggers, if any.
+
+    ID formats are tried in order: raw id, category/id, then both without the
+    .instructions suffix; the first one that is a bundle key wins.
+    """
+    ids_to_check = [inst_id]
+    if categories:
+        ids_to_check.append(f"{categories[0]}/{inst_id}")
+    if inst_id.endswith(".instructions"):
+        stripped_id = inst_id[: -len(".instructions")]
+        ids_to_check.append(stripped_id)
+        if categories:
+            ids_to_check.append(f"{categories[0]}/{stripped_id}")
+    return next((i for i in ids_to_check if i in INSTRUCTION_BUNDLES), None)
+
+
+def _compile_glob(pattern: str):
+    """
+    Compile a glob once into a matcher equivalent to fnmatch.fnmatch.
+
+    Returns:
+        Bound match method; call it with an os.path.normcase()d name
+    """
+    return re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
+
+class _InstructionProfile:
+    """
+    Per-instruction values that _score_instruction reads on every route.
+
+    Lowercased fields and the routing sub-dicts are invariant for a loaded
+    instruction, so they are computed once instead of once per message.
+    """
+
+    __slots__ = (
+        "instruction",
+        "id_lower",
+        "description_lower",
+        "tags",
+        "categories",
+        "categories_lower",
+        "meta_keywords",
+        "nlp_keywords",
+        "globs",
+        "file_patterns",
+        "branch_patterns",
+        "keyword_text",
+        "file_name",
+        "violation_category",
+        "friction_category",
+        "normalized_id",
+        "bundle_trigger",
+        "bundle_present_ids",
+        "bundle_lookup_ids",
+    )
+
+    def __init__(self, instruction, nlp_keywords: set[str], normalized_id: str):
+        self.instruction = instruction
+        # category/name form matched against IMP-009 look-back ids
+        self.normalized_id = normalized_id
+        self.id_lower = instruction.id.lower()
+        self.description_lower = instruction.description.lower()
+        # (original, lowercased) pairs: breakdowns report the original spelling
+        self.tags = [(tag, tag.lower()) for tag in instruction.tags]
+        self.categories = instruction.categories
+        self.categories_lower = [category.lower() for category in self.categories]
+        self.file_name = (
+            instruction.file_path.name if hasattr(instruction, "file_path") else ""
+        )
+        # First category eligible for each category-wide boost (None if none)
+        self.violation_category = next(
+            (c for c in self.categories if c in VIOLATION_BOOST_CATEGORIES), None
+        )
+        self.friction_category = next(
+            (c for c in self.categories if c in FRICTION_BOOST_CATEGORIES), None
+        )
+        # IMP-007: the bundle key this instruction triggers, the ids it counts
+        # as present under, and the ids a partner lookup finds it by
+        inst_id = instruction.id
+        self.bundle_trigger = _bundle_trigger(inst_id, self.categories)
+        if self.categories and "/" not in inst_id:
+            present_id = f"{self.categories[0]}/{inst_id}"
+        else:
+            present_id = inst_id
+        if present_id.endswith(".instructions"):
+            self.bundle_present_ids = (
+                present_id,
+                present_id[: -len(".instructions")],
+            )
+        else:
+            self.bundle_present_ids = (present_id,)
+        if self.categories:
+            self.bundle_lookup_ids = (inst_id, f"{self.categories[0]}/{inst_id}")
+        else:
+            self.bundle_lookup_ids = (inst_id,)
+
+        routing = instruction.routing or {}
+        triggers = routing.get("triggers", {})
+        # (original, lowercased, is_multi_word) triples
+        self.meta_keywords = [
+            (meta_keyword, meta_keyword.lower(), "_" in meta_keyword)
+            for meta_keyword in triggers.get("keywords", [])
+        ]
+        self.nlp_keywords = nlp_keywords
+        # (pattern, compiled matcher) pairs
+        self.globs = [
+            (pattern, _compile_glob(pattern))
+            for pattern in routing.get("applyTo", {}).get("globs", [])
+        ]
+        contextual = routing.get("contextual", {})
+        self.file_patterns = [
+            (pattern, _compile_glob(pattern)) for pattern in contextual.get("files", [])
+        ]
+        self.branch_patterns = [
+            (pattern, _compile_glob(pattern))
+            for pattern in contextual.get("branches", [])
+        ]
+
+        # Every field a message keyword is substring-matched against, one per
+        # line; keywords never contain newlines, so no match spans two fields
+        self.keyword_text = "\n".join(
+            [
+                self.id_lower,
+                self.description_lower,
+                *(tag_lower for _, tag_lower in self.tags),
+                *(meta_lower for _, meta_lower, _ in self.meta_keywords),
+                *self.categories_lower,
+            ]
+        )
+
+
 # Default feature configuration (all improvements enabled)
 DEFAULT_FEATURES = {
     "violation_detection": True,  #
@@ -1674,17 +1917,30 @@ class RuleBasedRouter(RoutingEngine):
         # Merge provided features with defaults (Task #204 Phase 00)
         self.features = {**DEFAULT_FEATURES, **(features or {})}
 
+        # Scoring profiles, rebuilt lazily when the loaded instructions change
+        # (the server creates the router before instructions are loaded)
+        self._profiles: list[_InstructionProfile] = []
+        self._profile_sources: list = []
+        # Branch patterns can match even an empty branch (e.g. "*")
+        self._has_branch_patterns = False
+        # Foundational to_dict() results (without score_breakdown) and their ids,
+        # refreshed together with the profiles
+        self._foundational: list[dict] = []
+        self._foundational_ids: set[str] = set()
+
         # Phase 4 (Issue #390): Load custom guidance triggers
         self._load_custom_triggers()
 
         if self.features.get("use_lexicon") and LEXICON_AVAILABLE:
             self._load_lexicon()
 
-        # Log feature configuration
-        feature_str = ", ".join(f"{k}={v}" for k, v in self.features.items())
-        logger.info(
-            f"RuleBasedRouter initialized (version: {self.version}, features: {feature_str})"
-        )
+        # Log feature configuration (skip building the summary if INFO is off;
+        # the CLI hook constructs a router per message)
+        if logger.isEnabledFor(logging.INFO):
+            feature_str = ", ".join(f"{k}={v}" for k, v in self.features.items())
+            logger.info(
+                f"RuleBasedRouter initialized (version: {self.version}, features: {feature_str})"
+            )
 
     def _load_custom_triggers(self):
         """
@@ -1787,6 +2043,63 @@ class RuleBasedRouter(RoutingEngine):
             self._load_lexicon()
             logger.info("Guidance trigger lexicon reloaded")
 
+    def _get_instruction_profiles(self) -> list[_InstructionProfile]:
+        """
+        Return scoring profiles for the currently loaded instructions.
+
+        Profiles are rebuilt whenever the handler's instruction objects differ
+        from the ones they were built from (reload, add, or replace).
+
+        Returns:
+            List of _InstructionProfile in instruction handler order
+        """
+        instructions = list(self.instruction_handler.instructions.values())
+        # List equality compares by identity first (InstructionFile has no __eq__)
+        if instructions != self._profile_sources:
+            profiles = []
+            for instruction in instructions:
+                routing = instruction.routing or {}
+                nlp_trigger = routing.get("triggers", {}).get("nlp", "")
+                nlp_keywords = (
+                    set(self._extract_keywords(nlp_trigger)) if nlp_trigger else set()
+                )
+                profiles.append(
+                    _InstructionProfile(
+                        instruction,
+                        nlp_keywords,
+                        self._normalize_instruction_id(instruction),
+                    )
+                )
+            self._profiles = profiles
+            self._profile_sources = instructions
+            self._has_branch_patterns = any(p.branch_patterns for p in profiles)
+            self._build_foundational_cache(instructions)
+            logger.debug(f"Built scoring profiles for {len(profiles)} instructions")
+        return self._profiles
+
+    def _build_foundational_cache(self, instructions: list) -> None:
+        """
+        Collect instructions marked as foundational (always-included).
+
+        Foundational status is determined by frontmatter:
+            foundational: true
+
+        Args:
+            instructions: Currently loaded InstructionFile objects
+        """
+        foundational = []
+        for instruction in instructions:
+            # Check for foundational flag in metadata
+            metadata = instruction.metadata or {}
+            if metadata.get("foundational", False):
+                result = instruction.to_dict()
+                result["routing_score"] = FOUNDATIONAL_SCORE
+                foundational.append(result)
+                logger.debug(f"Foundational instruction: {instruction.id}")
+
+        self._foundational = foundational
+        self._foundational_ids = {result.get("id") for result in foundational}
+
     @property
     def promotion_threshold(self) -> int:
         """Get the promotion threshold for user guidance."""
@@ -1983,9 +2296,7 @@ class RuleBasedRouter(RoutingEngine):
                             "suppressed": True,
                             "reason": f"IMP-003: {suppression_reason}",
                             "commencement_detected": False,
-                            "message_preview": message[:50]
-                            if len(message) > 50
-                            else message,
+                            "message_preview": message[:50],
                         },
                     }
                 elif commencement_detected:
@@ -2010,13 +2321,14 @@ class RuleBasedRouter(RoutingEngine):
             if self.features.get("guidance_pre_check", True):
                 pre_check_result = self._pre_check_guidance(message)
 
-            # Parse message and context
-            keywords = self._extract_keywords(message)
+            # Parse message and context (tokenize once for all detectors)
+            tokens = _TOKEN_RE.findall(message.lower())
+            keywords = self._extract_keywords(message, tokens)
             intent = self._extract_intent(message)
 
             #
             if self.features.get("violation_detection", True):
-                violation_info = self._detect_violations(message)
+                violation_info = self._detect_violations(message, tokens)
             else:
                 violation_info = {"detected": False, "signals": [], "boost_amount": 0}
 
@@ -2115,10 +2427,15 @@ class RuleBasedRouter(RoutingEngine):
                     )
 
             context = context or {}
-            files = context.get("files", [])
-            directories = context.get("directories", [])
-            branch = context.get("branch", "")
-            language = context.get("language", "")
+            if context:
+                # Empty tuples are shared constants, so defaults allocate nothing
+                files = context.get("files", ())
+                directories = context.get("directories", ())
+                branch = context.get("branch", "")
+                language = context.get("language", "")
+            else:
+                files = directories = ()
+                branch = language = ""
 
             #
             previous_routing_ids = set()
@@ -2176,11 +2493,28 @@ class RuleBasedRouter(RoutingEngine):
                 "scoring_breakdown": [],
             }
 
-            for instruction in self.instruction_handler.instructions.values():
+            keyword_set = frozenset(keywords)
+            profiles = self._get_instruction_profiles()
+            # Without any of these signals no instruction can score above zero
+            if not (
+                keywords
+                or files
+                or self._has_branch_patterns
+                or previous_routing_ids
+                or violation_info["detected"]
+                or semantic_flags_info["detected"]
+                or friction_info["detected"]
+                or mistake_info["detected"]
+                or lifecycle_info["detected"]
+            ):
+                profiles = ()
+            for profile in profiles:
+                instruction = profile.instruction
                 score, score_breakdown = self._score_instruction(
-                    instruction=instruction,
+                    profile=profile,
                     message=message,
                     keywords=keywords,
+                    keyword_set=keyword_set,
                     intent=intent,
                     files=files,
                     directories=directories,
@@ -2191,9 +2525,9 @@ class RuleBasedRouter(RoutingEngine):
                 )
 
                 #
-                # Normalize instruction ID for comparison (handle category/name and name.instructions formats)
+                # Normalized ID (category/name) is precomputed on the profile
                 if previous_routing_ids:
-                    inst_id_normalized = self._normalize_instruction_id(instruction)
+                    inst_id_normalized = profile.normalized_id
                     if inst_id_normalized in previous_routing_ids:
                         score += COMMENCEMENT_LOOKBACK_BOOST
                         score_breakdown["commencement_lookback"] = (
@@ -2207,29 +2541,25 @@ class RuleBasedRouter(RoutingEngine):
                 if friction_info["detected"] and self.features.get(
                     "friction_boost", True
                 ):
-                    for inst_category in instruction.categories:
-                        if inst_category in FRICTION_BOOST_CATEGORIES:
-                            score += FRICTION_BOOST_AMOUNT
-                            score_breakdown["friction_boost"] = {
-                                "category": inst_category,
-                                "boost": FRICTION_BOOST_AMOUNT,
-                                "friction_type": friction_info.get("friction_type"),
-                            }
-                            logger.debug(
-                                f"IMP-011: Friction boost for {instruction.id} (category: {inst_category}) by {FRICTION_BOOST_AMOUNT}"
-                            )
-                            break  # Only apply once per instruction
+                    # Only apply once per instruction
+                    inst_category = profile.friction_category
+                    if inst_category is not None:
+                        score += FRICTION_BOOST_AMOUNT
+                        score_breakdown["friction_boost"] = {
+                            "category": inst_category,
+                            "boost": FRICTION_BOOST_AMOUNT,
+                            "friction_type": friction_info.get("friction_type"),
+                        }
+                        logger.debug(
+                            f"IMP-011: Friction boost for {instruction.id} (category: {inst_category}) by {FRICTION_BOOST_AMOUNT}"
+                        )
 
                 #
                 if mistake_info["detected"] and self.features.get(
                     "outcome_boost", True
                 ):
                     # Check if this instruction is in the list of preventive instructions
-                    inst_filename = (
-                        instruction.file_path.name
-                        if hasattr(instruction, "file_path")
-                        else ""
-                    )
+                    inst_filename = profile.file_name
                     for preventive_inst in mistake_info.get("instruction_boosts", []):
                         if (
                             preventive_inst in inst_filename
@@ -2250,11 +2580,7 @@ class RuleBasedRouter(RoutingEngine):
                 if lifecycle_info["detected"] and self.features.get(
                     "lifecycle_keywords", True
                 ):
-                    inst_filename = (
-                        instruction.file_path.name
-                        if hasattr(instruction, "file_path")
-                        else ""
-                    )
+                    inst_filename = profile.file_name
                     for target_inst in lifecycle_info.get("instructions", []):
                         if target_inst in inst_filename or inst_filename in target_inst:
                             boost_amount = lifecycle_info.get("boost", 25)
@@ -2273,11 +2599,7 @@ class RuleBasedRouter(RoutingEngine):
                 if violation_info["detected"] and self.features.get(
                     "violation_checklist", True
                 ):
-                    inst_filename = (
-                        instruction.file_path.name
-                        if hasattr(instruction, "file_path")
-                        else ""
-                    )
+                    inst_filename = profile.file_name
                     for checklist_inst in VIOLATION_CHECKLIST_BOOST.get(
                         "instructions", []
                     ):
@@ -2300,10 +2622,15 @@ class RuleBasedRouter(RoutingEngine):
                             break  # Only apply once per instruction
 
                 if score > 0:
-                    result = instruction.to_dict()
-                    result["routing_score"] = score
-                    result["score_breakdown"] = score_breakdown
-                    scored_instructions.append(result)
+                    # Lightweight record; to_dict() is deferred to the top N
+                    # (bundle boosts only read profiles and update scores)
+                    scored_instructions.append(
+                        {
+                            "routing_score": score,
+                            "score_breakdown": score_breakdown,
+                            "profile": profile,
+                        }
+                    )
 
                     analysis["scoring_breakdown"].append(
                         {
@@ -2321,18 +2648,23 @@ class RuleBasedRouter(RoutingEngine):
                     analysis["bundle_boost"] = bundle_boost_info
                     logger.debug(f"IMP-007: Applied bundle boosts: {bundle_boost_info}")
 
-            # Sort by score descending
-            scored_instructions.sort(key=lambda x: x["routing_score"], reverse=True)
+            # Top N by score descending (ties keep scoring order)
+            top_instructions = []
+            for record in _top_by_score(scored_instructions, limit):
+                result = record["profile"].instruction.to_dict()
+                result["routing_score"] = record["routing_score"]
+                result["score_breakdown"] = record["score_breakdown"]
+                top_instructions.append(result)
 
             # Get foundational instructions (if enabled)
             if self.features.get("foundational", True):
                 foundational = self._get_foundational_instructions()
-                foundational_ids = {inst.get("id") for inst in foundational}
+                foundational_ids = self._foundational_ids
 
                 # Get top N query-specific (excluding foundational to avoid duplicates)
                 query_specific = [
                     inst
-                    for inst in scored_instructions[:limit]
+                    for inst in top_instructions
                     if inst.get("id") not in foundational_ids
                 ]
 
@@ -2346,7 +2678,7 @@ class RuleBasedRouter(RoutingEngine):
                 analysis["query_specific_count"] = len(query_specific)
             else:
                 # Foundational disabled - just return top N query-specific
-                combined = scored_instructions[:limit]
+                combined = top_instructions
                 analysis["foundational_count"] = 0
                 analysis["foundational_ids"] = []
                 analysis["foundational_disabled"] = True
@@ -2510,7 +2842,9 @@ class RuleBasedRouter(RoutingEngine):
                 "routing_analysis": {"error": str(e)},
             }
 
-    def _detect_violations(self, message: str) -> dict[str, Any]:
+    def _detect_violations(
+        self, message: str, tokens: list[str] | None = None
+    ) -> dict[str, Any]:
         """
         Detect violation signals in message that should boost compliance routing.
 
@@ -2524,6 +2858,7 @@ class RuleBasedRouter(RoutingEngine):
 
         Args:
             message: User message to analyze
+            tokens: Optional precomputed _TOKEN_RE tokens of message.lower()
 
         Returns:
             Dictionary with:
@@ -2535,21 +2870,26 @@ class RuleBasedRouter(RoutingEngine):
         message_lower = message.lower()
 
         # Check 1: Strong violation words (always trigger)
-        words = re.findall(r"\b\w+\b", message_lower)
+        words = tokens if tokens is not None else _TOKEN_RE.findall(message_lower)
         violation_matches = set(words) & VIOLATION_WORDS
         if violation_matches:
             signals.append(f"violation_words:{','.join(violation_matches)}")
 
         # Check 2: Emphasis-only violation words (need caps, exclamation, or sentence-start)
+        # One scan per form finds every emphasized word; matches of one form
+        # never share characters, so findall misses none
+        emphasized = set(_EMPHASIS_CAPS_RE.findall(message))
+        exclaimed = set(_EMPHASIS_EXCLAIMED_RE.findall(message_lower))
+        sentence_start = set(_EMPHASIS_SENTENCE_START_RE.findall(message_lower))
         for word in EMPHASIS_VIOLATION_WORDS:
             # Check for capitalized version (e.g., "NO", "STOP")
-            if re.search(rf"\b{word.upper()}\b", message):
+            if word.upper() in emphasized:
                 signals.append(f"emphasized_{word.upper()}")
             # Check for word with exclamation (e.g., "no!", "stop!")
-            elif re.search(rf"\b{word}\s*!", message_lower):
+            elif word in exclaimed:
                 signals.append(f"exclaimed_{word}")
             # Check for sentence-start negation (e.g., "No, that's wrong")
-            elif re.search(rf"(?:^|[.!?]\s*){word}[,\s]", message_lower):
+            elif word in sentence_start:
                 signals.append(f"sentence_start_{word}")
 
         # Check 3: High exclamation density (3+ indicates strong emotion)
@@ -2603,18 +2943,23 @@ class RuleBasedRouter(RoutingEngine):
         """
         # Normalize message
         message_clean = message.strip().lower()
-        # Remove trailing punctuation for matching
-        message_normalized = re.sub(r"[.!?,]+$", "", message_clean)
 
         # Check 0: Commencement phrases OVERRIDE approval suppression
         # These indicate work intent despite approval-like prefix
         # Using conservative phrase table instead of broad regex patterns
-        for phrase in COMMENCEMENT_PHRASES:
-            if message_clean.startswith(phrase) or f" {phrase}" in message_clean:
-                logger.debug(
-                    f"IMP-003: Commencement phrase detected, NOT suppressing: {message_clean}"
-                )
-                return (False, "commencement_phrase_detected", True)
+        if _COMMENCEMENT_RE.search(message_clean):
+            logger.debug(
+                f"IMP-003: Commencement phrase detected, NOT suppressing: {message_clean}"
+            )
+            return (False, "commencement_phrase_detected", True)
+
+        # Long messages cannot match any check below; skip the normalization
+        words = message_clean.split()
+        if len(words) > _APPROVAL_MAX_WORDS:
+            return (False, "not_approval", False)
+
+        # Remove trailing punctuation for matching
+        message_normalized = _APPROVAL_STRIP_RE.sub("", message_clean)
 
         # Check 1: Exact match with approval patterns
         if message_normalized in APPROVAL_PATTERNS:
@@ -2623,26 +2968,28 @@ class RuleBasedRouter(RoutingEngine):
             )
             return (True, "exact_approval_match", False)
 
+        # Checks 2 and 3 only apply to short messages; count approval words once
+        if len(words) > 5:
+            return (False, "not_approval", False)
+        approval_count = sum(
+            1 for word in words if word.rstrip(_APPROVAL_PUNCT) in APPROVAL_WORDS
+        )
+
         # Check 2: Very short message (≤3 words) - likely approval
-        words = message_clean.split()
         if len(words) <= 3:
             # Check if any word is an approval word
-            if any(word.rstrip(".,!?") in APPROVAL_WORDS for word in words):
+            if approval_count:
                 logger.debug(
                     f"IMP-003: Suppressing routing for short approval: {message_clean}"
                 )
                 return (True, "short_approval_message", False)
 
         # Check 3: Short message (≤5 words) dominated by approval words
-        if len(words) <= 5:
-            approval_count = sum(
-                1 for word in words if word.rstrip(".,!?") in APPROVAL_WORDS
+        if approval_count >= len(words) / 2:  # Majority are approval words
+            logger.debug(
+                f"IMP-003: Suppressing routing for approval-dominated message: {message_clean}"
             )
-            if approval_count >= len(words) / 2:  # Majority are approval words
-                logger.debug(
-                    f"IMP-003: Suppressing routing for approval-dominated message: {message_clean}"
-                )
-                return (True, "approval_dominated_message", False)
+            return (True, "approval_dominated_message", False)
 
         return (False, "not_approval", False)
 
@@ -2659,18 +3006,13 @@ class RuleBasedRouter(RoutingEngine):
         Returns:
             List of instruction dictionaries marked as foundational
         """
-        foundational = []
-        for instruction in self.instruction_handler.instructions.values():
-            # Check for foundational flag in metadata
-            metadata = instruction.metadata or {}
-            if metadata.get("foundational", False):
-                result = instruction.to_dict()
-                result["routing_score"] = FOUNDATIONAL_SCORE
-                result["score_breakdown"] = {"foundational": True}
-                foundational.append(result)
-                logger.debug(f"Foundational instruction: {instruction.id}")
-
-        return foundational
+        # Refreshes the foundational cache if the instructions changed
+        self._get_instruction_profiles()
+        # Fresh dicts per call: callers may annotate the returned results
+        return [
+            {**result, "score_breakdown": {"foundational": True}}
+            for result in self._foundational
+        ]
 
     def _get_previous_routing(self, context: dict | None = None) -> dict | None:
         """
@@ -2704,20 +3046,8 @@ class RuleBasedRouter(RoutingEngine):
         for db_path in db_paths:
             if db_path.exists():
                 try:
-                    conn = sqlite3.connect(str(db_path))
-                    cursor = conn.cursor()
-
-                    # Get most recent routing event (excluding current - look for previous)
-                    # unified schema v3.0.0: routed_instructions (JSON array), routing_scores (JSON obj)
-                    cursor.execute("""
-                        SELECT routed_instructions, routing_scores
-                        FROM routing_events
-                        WHERE instruction_count > 0
-                        ORDER BY timestamp DESC
-                        LIMIT 1 OFFSET 1
-                    """)
-                    row = cursor.fetchone()
-                    conn.close()
+                    # Shared database keeps a pooled connection and cached statement
+                    row = get_database(db_path).execute_one(_PREVIOUS_ROUTING_SQL)
 
                     if row and row[0]:
                         # routed_instructions is JSON array, parse it
@@ -2768,75 +3098,24 @@ class RuleBasedRouter(RoutingEngine):
         else:
             return inst_id
 
-    def _extract_keywords(self, message: str) -> list[str]:
+    def _extract_keywords(
+        self, message: str, tokens: list[str] | None = None
+    ) -> list[str]:
         """
         Extract keywords from message.
 
         Simple implementation: lowercase words, remove common words.
         Future: Use NLP library (spaCy, NLTK) for better extraction.
-        """
-        # Convert to lowercase
-        message_lower = message.lower()
-
-        # Remove punctuation
-        message_clean = re.sub(r"[^\w\s]", " ", message_lower)
 
-        # Split into words
-        words = message_clean.split()
+        Args:
+            message: Text to extract keywords from
+            tokens: Optional precomputed _TOKEN_RE tokens of message.lower()
+        """
+        # Lowercase word tokens (punctuation separates words)
+        words = tokens if tokens is not None else _TOKEN_RE.findall(message.lower())
 
         # Remove common stop words
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "from",
-            "as",
-            "is",
-            "was",
-            "are",
-            "were",
-            "be",
-            "been",
-            "being",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "should",
-            "could",
-            "may",
-            "might",
-            "must",
-            "can",
-            "this",
-            "that",
-            "these",
-            "those",
-            "i",
-            "you",
-            "he",
-            "she",
-            "it",
-            "we",
-            "they",
-        }
-
-        keywords = [w for w in words if w not in stop_words and len(w) > 2]
+        keywords = [w for w in words if w not in KEYWORD_STOP_WORDS and len(w) > 2]
 
         #
         # This enables metadata keywords like "time_free" to match query "time free"
@@ -2883,42 +3162,50 @@ class RuleBasedRouter(RoutingEngine):
 
     def _score_instruction(
         self,
-        instruction,
+        profile: _InstructionProfile,
         message: str,
         keywords: list[str],
         intent: str,
-        files: list[str],
-        directories: list[str],
+        files: Sequence[str],
+        directories: Sequence[str],
         branch: str,
         language: str,
         violation_info: dict | None = None,  # IMP-002
         semantic_flags_info: dict | None = None,  # IMP-008
+        keyword_set: frozenset[str] | None = None,
     ) -> tuple[int, dict]:
         """
         Score instruction relevance using multiple signals.
 
+        Args:
+            profile: Precomputed scoring profile of the instruction
+            keyword_set: Optional frozenset(keywords), built once per route.
+                When none of them occurs in the profile's keyword text, the
+                per-keyword substring loops are skipped since none could match
+
         Returns:
             (score, breakdown) where breakdown shows scoring details
         """
         score = 0
         breakdown = {}
+        categories = profile.categories
 
         #
         if violation_info and violation_info.get("detected"):
-            for category in instruction.categories:
-                if category in VIOLATION_BOOST_CATEGORIES:
-                    score += violation_info["boost_amount"]
-                    breakdown["violation_boost"] = {
-                        "category": category,
-                        "boost": violation_info["boost_amount"],
-                        "signals": violation_info["signals"],
-                    }
-                    break  # Only apply once per instruction
+            # Only apply once per instruction
+            category = profile.violation_category
+            if category is not None:
+                score += violation_info["boost_amount"]
+                breakdown["violation_boost"] = {
+                    "category": category,
+                    "boost": violation_info["boost_amount"],
+                    "signals": violation_info["signals"],
+                }
 
         #
         if semantic_flags_info and semantic_flags_info.get("detected"):
             category_boosts = semantic_flags_info.get("category_boosts", {})
-            for category in instruction.categories:
+            for category in categories:
                 if category in category_boosts:
                     boost = category_boosts[category]
                     score += boost
@@ -2932,33 +3219,41 @@ class RuleBasedRouter(RoutingEngine):
                         }
                     )
 
+        if keyword_set is None:
+            keyword_set = frozenset(keywords)
+
+        # Candidate check: K substring tests on one string instead of K per field
+        keyword_text = profile.keyword_text
+        if not any(keyword in keyword_text for keyword in keyword_set):
+            keywords = ()
+
         # 1. Keyword matching (+10 per keyword match)
         keyword_matches = []
+        id_lower = profile.id_lower
+        description_lower = profile.description_lower
+        tags = profile.tags
+        meta_keywords = profile.meta_keywords
         for keyword in keywords:
             # Check in id
-            if keyword in instruction.id.lower():
+            if keyword in id_lower:
                 score += 10
                 keyword_matches.append(f"id:{keyword}")
 
             # Check in description
-            if keyword in instruction.description.lower():
+            if keyword in description_lower:
                 score += 8
                 keyword_matches.append(f"description:{keyword}")
 
             # Check in tags
-            for tag in instruction.tags:
-                if keyword in tag.lower():
+            for tag, tag_lower in tags:
+                if keyword in tag_lower:
                     score += 5
                     keyword_matches.append(f"tag:{tag}")
 
             # Check in metadata keywords
             #
-            routing = instruction.routing or {}
-            triggers = routing.get("triggers", {})
-            meta_keywords = triggers.get("keywords", [])
-            for meta_keyword in meta_keywords:
-                meta_keyword_lower = meta_keyword.lower()
-                if "_" in meta_keyword_lower:
+            for meta_keyword, meta_keyword_lower, multi_word in meta_keywords:
+                if multi_word:
                     # Multi-word keyword: require exact match to prevent false positives
                     # e.g., "time_free" should NOT match query word "free" alone
                     if keyword == meta_keyword_lower:
@@ -2975,9 +3270,11 @@ class RuleBasedRouter(RoutingEngine):
 
         # 2. Category matching (+5 per category)
         category_matches = []
-        for category in instruction.categories:
+        for category, category_lower in zip(
+            categories, profile.categories_lower, strict=True
+        ):
             # Direct keyword match
-            if any(keyword in category.lower() for keyword in keywords):
+            if any(keyword in category_lower for keyword in keywords):
                 score += 5
                 category_matches.append(category)
 
@@ -2985,25 +3282,27 @@ class RuleBasedRouter(RoutingEngine):
             breakdown["category_matches"] = category_matches
 
         # 3. NLP trigger matching (+8)
-        routing = instruction.routing or {}
-        triggers = routing.get("triggers", {})
-        nlp_trigger = triggers.get("nlp", "")
-        if nlp_trigger:
+        if profile.nlp_keywords:
             # Check if message matches NLP trigger description
-            nlp_keywords = self._extract_keywords(nlp_trigger)
-            overlap = set(keywords) & set(nlp_keywords)
+            overlap = keyword_set & profile.nlp_keywords
             if overlap:
                 score += 8 * len(overlap)
                 breakdown["nlp_trigger_match"] = list(overlap)
 
         # 4. Glob/path matching (+7 per file match)
         glob_matches = []
-        apply_to = routing.get("applyTo", {})
-        globs = apply_to.get("globs", [])
+        globs = profile.globs
+        file_patterns = profile.file_patterns
+        if files and (globs or file_patterns):
+            normalized_files = [
+                (file_path, os.path.normcase(file_path)) for file_path in files
+            ]
+        else:
+            normalized_files = ()
 
-        for file_path in files:
-            for glob_pattern in globs:
-                if fnmatch.fnmatch(file_path, glob_pattern):
+        for file_path, normalized in normalized_files:
+            for glob_pattern, glob_match in globs:
+                if glob_match(normalized) is not None:
                     score += 7
                     glob_matches.append(f"{file_path} matches {glob_pattern}")
 
@@ -3012,30 +3311,29 @@ class RuleBasedRouter(RoutingEngine):
 
         # 5. Contextual matching (files, branches) (+5)
         contextual_matches = []
-        contextual = routing.get("contextual", {})
 
         # File context
-        file_patterns = contextual.get("files", [])
-        for file_path in files:
-            for pattern in file_patterns:
-                if fnmatch.fnmatch(file_path, pattern):
+        for file_path, normalized in normalized_files:
+            for _pattern, pattern_match in file_patterns:
+                if pattern_match(normalized) is not None:
                     score += 5
                     contextual_matches.append(f"file_context:{file_path}")
 
         # Branch context
-        branch_patterns = contextual.get("branches", [])
-        for pattern in branch_patterns:
-            if fnmatch.fnmatch(branch, pattern):
-                score += 5
-                contextual_matches.append(f"branch_context:{branch}")
+        if profile.branch_patterns:
+            normalized_branch = os.path.normcase(branch)
+            for _pattern, pattern_match in profile.branch_patterns:
+                if pattern_match(normalized_branch) is not None:
+                    score += 5
+                    contextual_matches.append(f"branch_context:{branch}")
 
         if contextual_matches:
             breakdown["contextual_matches"] = contextual_matches
 
         # 6. Tag matching (+3 per tag)
         tag_matches = []
-        for tag in instruction.tags:
-            if any(keyword in tag.lower() for keyword in keywords):
+        for tag, tag_lower in tags:
+            if any(keyword in tag_lower for keyword in keywords):
                 score += 3
                 tag_matches.append(tag)
 
@@ -4198,7 +4496,8 @@ class RuleBasedRouter(RoutingEngine):
         strong co-occurrence patterns (55-100%) in instruction pairs.
 
         Args:
-            scored_instructions: List of scored instruction dictionaries
+            scored_instructions: Scored instruction records (routing_score,
+                score_breakdown and scoring profile)
 
         Returns:
             Dictionary with:
@@ -4207,71 +4506,50 @@ class RuleBasedRouter(RoutingEngine):
         """
         boosts_applied = []
 
-        # Get set of instruction IDs currently in results
+        # Nothing in the results triggers a bundle (the common case)
+        if all(inst["profile"].bundle_trigger is None for inst in scored_instructions):
+            return {"applied": False, "boosts": [], "total_boosts": 0}
+
+        # Get set of instruction IDs currently in results, and the first
+        # record answering to each id or category/id (the partner lookup);
+        # the ID formats were computed once per profile
         instruction_ids = set()
+        by_id: dict[str, dict] = {}
         for inst in scored_instructions:
-            # Normalize instruction ID to category/name format
-            inst_id = inst.get("id", "")
-            categories = inst.get("categories", [])
-            if categories and "/" not in inst_id:
-                normalized_id = f"{categories[0]}/{inst_id}"
-            else:
-                normalized_id = inst_id
-            instruction_ids.add(normalized_id)
-            # Also add without .instructions suffix if present
-            if normalized_id.endswith(".instructions"):
-                instruction_ids.add(normalized_id[: -len(".instructions")])
+            profile = inst["profile"]
+            instruction_ids.update(profile.bundle_present_ids)
+            for lookup_id in profile.bundle_lookup_ids:
+                by_id.setdefault(lookup_id, inst)
 
         # Check each instruction against bundle definitions
         for inst in scored_instructions:
-            inst_id = inst.get("id", "")
-            categories = inst.get("categories", [])
-
-            # Try multiple ID formats
-            ids_to_check = [inst_id]
-            if categories:
-                ids_to_check.append(f"{categories[0]}/{inst_id}")
-            if inst_id.endswith(".instructions"):
-                ids_to_check.append(inst_id[: -len(".instructions")])
-                if categories:
-                    ids_to_check.append(
-                        f"{categories[0]}/{inst_id[: -len('.instructions')]}"
-                    )
-
-            for id_format in ids_to_check:
-                if id_format in INSTRUCTION_BUNDLES:
-                    bundle_partners = INSTRUCTION_BUNDLES[id_format]
-                    for partner_id, boost_amount, co_occurrence_rate in bundle_partners:
-                        # Check if partner is in results
-                        if partner_id in instruction_ids:
-                            # Find and boost the partner instruction
-                            for partner_inst in scored_instructions:
-                                p_id = partner_inst.get("id", "")
-                                p_categories = partner_inst.get("categories", [])
-                                p_normalized = (
-                                    f"{p_categories[0]}/{p_id}"
-                                    if p_categories
-                                    else p_id
-                                )
-
-                                if partner_id in (p_id, p_normalized):
-                                    partner_inst["routing_score"] += boost_amount
-                                    if "score_breakdown" not in partner_inst:
-                                        partner_inst["score_breakdown"] = {}
-                                    partner_inst["score_breakdown"]["bundle_boost"] = {
-                                        "from": id_format,
-                                        "boost": boost_amount,
-                                        "co_occurrence_rate": co_occurrence_rate,
-                                    }
-                                    boosts_applied.append(
-                                        {
-                                            "trigger": id_format,
-                                            "boosted": partner_id,
-                                            "amount": boost_amount,
-                                        }
-                                    )
-                                    break
-                    break  # Found matching ID format, no need to check others
+            # Matching ID format, resolved once when the profile was built
+            id_format = inst["profile"].bundle_trigger
+            if id_format is None:
+                continue
+
+            bundle_partners = INSTRUCTION_BUNDLES[id_format]
+            for partner_id, boost_amount, co_occurrence_rate in bundle_partners:
+                # Check if partner is in results
+                if partner_id in instruction_ids:
+                    # Find and boost the partner instruction
+                    partner_inst = by_id.get(partner_id)
+                    if partner_inst is not None:
+                        partner_inst["routing_score"] += boost_amount
+                        if "score_breakdown" not in partner_inst:
+                            partner_inst["score_breakdown"] = {}
+                        partner_inst["score_breakdown"]["bundle_boost"] = {
+                            "from": id_format,
+                            "boost": boost_amount,
+                            "co_occurrence_rate": co_occurrence_rate,
+                        }
+                        boosts_applied.append(
+                            {
+                                "trigger": id_format,
+                                "boosted": partner_id,
+                                "amount": boost_amount,
+                            }
+                        )
 
         return {
             "applied": len(boosts_applied) > 0,
@@ -103,18 +103,25 @@ class TestSchemaMigration:
             CREATE TABLE routing_events (
                 id INTEGER PRIMARY KEY,
                 timestamp TEXT NOT NULL,
+                instruction_count INTEGER DEFAULT 0,
                 session_id TEXT,
                 engine_version TEXT
             );
             CREATE TABLE routing_triggers (
                 id INTEGER PRIMARY KEY,
                 trigger_type TEXT,
+                trigger_key TEXT,
+                trigger_value TEXT,
                 enabled BOOLEAN
             );
             CREATE TABLE artifact_discovered (
                 id INTEGER PRIMARY KEY,
+                source_file TEXT,
+                section_title TEXT,
+                keywords TEXT,
                 status TEXT,
-                source_type TEXT
+                source_type TEXT,
+                discovered_at TEXT
             );
             CREATE TABLE artifact_implemented (
                 id INTEGER PRIMARY KEY,
@@ -124,7 +131,9 @@ class TestSchemaMigration:
             CREATE TABLE observation_discovered (
                 id INTEGER PRIMARY KEY,
                 status TEXT,
-                observation_type TEXT
+                observation_type TEXT,
+                guidance_type TEXT,
+                discovered_at TEXT
             );
             CREATE TABLE observation_implemented (
                 id INTEGER PRIMARY KEY,
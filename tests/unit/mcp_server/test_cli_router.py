@@ -7,6 +7,7 @@ from mcp_server.formatter import (
     _extract_evaluation_criteria,
     extract_content_without_frontmatter,
     format_routing_results,
+    split_frontmatter,
 )
 
 
@@ -40,6 +41,34 @@ This is the body.
         result = extract_content_without_frontmatter("")
         assert result == ""
 
+    def test_strips_only_leading_block(self):
+        """Blank lines after the block go; later rules and unclosed blocks stay."""
+        content = "---\nid: x\n---\n\n# Body\n---\nmore"
+        assert extract_content_without_frontmatter(content) == "# Body\n---\nmore"
+        unclosed = "---\n\nA horizontal rule opens this body."
+        assert extract_content_without_frontmatter(unclosed) == unclosed
+
+
+class TestSplitFrontmatter:
+    """Tests for single-pass frontmatter/body splitting."""
+
+    def test_returns_frontmatter_and_body(self):
+        """Frontmatter text excludes the delimiters; body drops blank lines."""
+        content = "---\nid: x\nsuccess_signals:\n  - Done\n---  \n\n# Body"
+        assert split_frontmatter(content) == (
+            "id: x\nsuccess_signals:\n  - Done",
+            "# Body",
+        )
+
+    def test_no_frontmatter(self):
+        """Content without frontmatter is returned whole."""
+        assert split_frontmatter("# Body\n---\n") == (None, "# Body\n---\n")
+
+    def test_delimiter_prefix_keeps_criteria_boundary(self):
+        """A '----' line ends the criteria text but not the stripped block."""
+        content = "---\na: 1\n----\nb: 2\n---\nBody"
+        assert split_frontmatter(content) == ("a: 1", "Body")
+
 
 class TestExtractEvaluationCriteria:
     """Tests for evaluation criteria extraction from frontmatter."""
@@ -262,6 +291,28 @@ class TestFormatRoutingResults:
         # Frontmatter should be stripped from content
         assert "title: Test" not in result
 
+    def test_escapes_metadata_but_not_content(self):
+        """Metadata is XML-escaped; instruction content is passed through."""
+        routing_result = {
+            "instructions": [
+                {
+                    "id": 'a"b',
+                    "category": "x&y",
+                    "description": "Use <Foo> & bar",
+                    "routing_score": 5,
+                    "content": "---\nsuccess_signals:\n  - a < b\n---\nif a < b && c:",
+                }
+            ],
+            "count": 1,
+        }
+        result = format_routing_results(routing_result)
+
+        assert 'id="a&quot;b"' in result
+        assert "<category>x&amp;y</category>" in result
+        assert "<summary>Use &lt;Foo&gt; &amp; bar</summary>" in result
+        assert "- a &lt; b\n" in result
+        assert "if a < b && c:" in result
+
     def test_includes_compliance_criteria(self):
         """Should extract and include compliance_criteria from frontmatter."""
         routing_result = {
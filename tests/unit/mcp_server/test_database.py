@@ -5,15 +5,22 @@ import sqlite3
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from mcp_server.database import (
     ArtifactStatus,
     GuidanceType,
+    ImplementationType,
     ObservationType,
     PongogoDatabase,
     SourceType,
+    SQLitePool,
+    TransientDBError,
     TriggerType,
+    bulk_load_triggers,
     get_artifact_stats,
     get_artifacts_by_status,
+    get_database,
     get_default_db_path,
     get_event_stats,
     get_observation_stats,
@@ -21,9 +28,13 @@ from mcp_server.database import (
     get_recent_events,
     get_trigger_stats,
     get_triggers_by_type,
+    promote_observation,
+    reject_observation,
     store_artifact_discovery,
     store_observation,
+    store_observations_batch,
     store_routing_event,
+    store_routing_events_batch,
     upsert_trigger,
 )
 
@@ -147,6 +158,149 @@ class TestPongogoDatabase:
         assert "database_path" in stats
         assert "routing_events_count" in stats
 
+    def test_reuses_connection_per_thread(self, tmp_path):
+        """Should reuse the same connection across calls on one thread."""
+        db = PongogoDatabase(db_path=tmp_path / ".pongogo" / "pongogo.db")
+
+        with db.connection() as first:
+            pass
+        with db.connection() as second:
+            pass
+
+        assert first is second
+
+    def test_connection_pragmas(self, tmp_path):
+        """Should open connections in WAL mode with synchronous=NORMAL."""
+        db = PongogoDatabase(db_path=tmp_path / ".pongogo" / "pongogo.db")
+
+        with db.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_nested_connection_rolls_back_together(self, tmp_path):
+        """Nested contexts should share the outer transaction."""
+        db = PongogoDatabase(db_path=tmp_path / ".pongogo" / "pongogo.db")
+
+        try:
+            with db.connection() as conn:
+                conn.execute(
+                    "INSERT INTO schema_info (key, value) VALUES ('probe', '1')"
+                )
+                with db.connection():
+                    pass
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+
+        assert db.execute_one("SELECT 1 FROM schema_info WHERE key = 'probe'") is None
+
+    def test_execute_many(self, tmp_path):
+        """Should run every parameter set and report total rows affected."""
+        db = PongogoDatabase(db_path=tmp_path / ".pongogo" / "pongogo.db")
+
+        affected = db.execute_many(
+            "INSERT INTO schema_info (key, value) VALUES (?, ?)",
+            [("probe_a", "1"), ("probe_b", "2"), ("probe_c", "3")],
+        )
+
+        assert affected == 3
+        rows = db.execute("SELECT key FROM schema_info WHERE key LIKE 'probe_%'")
+        assert len(rows) == 3
+
+    def test_iter_execute(self, tmp_path):
+        """Should yield the same rows as execute without materializing them."""
+        db = PongogoDatabase(db_path=tmp_path / ".pongogo" / "pongogo.db")
+        sql = "SELECT key, value FROM schema_info ORDER BY key"
+
+        rows = db.iter_execute(sql)
+
+        assert not isinstance(rows, list)
+        assert [tuple(r) for r in rows] == [tuple(r) for r in db.execute(sql)]
+
+    def test_iter_execute_does_not_hold_transaction(self, tmp_path):
+        """Writes made mid-iteration should commit, even if iteration stops."""
+        db_path = tmp_path / ".pongogo" / "pongogo.db"
+        db = PongogoDatabase(db_path=db_path)
+
+        rows = db.iter_execute("SELECT key FROM schema_info")
+        next(rows)
+        db.execute_insert(
+            "INSERT INTO schema_info (key, value) VALUES (?, ?)", ("probe", "1")
+        )
+        rows.close()
+
+        other = sqlite3.connect(db_path)
+        try:
+            assert other.execute(
+                "SELECT value FROM schema_info WHERE key = 'probe'"
+            ).fetchone() == ("1",)
+        finally:
+            other.close()
+
+
+class TestSQLitePool:
+    """Tests for pooled connections."""
+
+    def test_instances_share_connection(self, tmp_path):
+        """Instances for the same path should share one connection per thread."""
+        db_path = tmp_path / ".pongogo" / "pongogo.db"
+        first = PongogoDatabase(db_path=db_path)
+        second = PongogoDatabase(db_path=str(db_path))
+
+        with first.connection() as a, second.connection() as b:
+            assert a is b
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Should close idle connections beyond the per-thread cap."""
+        pool = SQLitePool(max_per_thread=2)
+        paths = [tmp_path / f"db{i}.sqlite" for i in range(3)]
+
+        conns = []
+        for path in paths:
+            with pool.connection(path) as conn:
+                conns.append(conn)
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conns[0].execute("SELECT 1")
+        with pool.connection(paths[2]) as conn:
+            assert conn is conns[2]
+
+
+class TestGetDatabase:
+    """Tests for get_database cache."""
+
+    def test_returns_cached_instance(self, tmp_path):
+        """Should return the same instance for the same path."""
+        db_path = tmp_path / ".pongogo" / "pongogo.db"
+        assert get_database(db_path) is get_database(db_path)
+
+    def test_default_path_follows_project_root(self, tmp_path):
+        """Default path memoization should follow PONGOGO_PROJECT_ROOT."""
+        first_root = tmp_path / "first"
+        second_root = tmp_path / "second"
+        for root in (first_root, second_root):
+            (root / ".pongogo").mkdir(parents=True)
+
+        with patch.dict(os.environ, {"PONGOGO_PROJECT_ROOT": str(first_root)}):
+            first = get_database()
+        with patch.dict(os.environ, {"PONGOGO_PROJECT_ROOT": str(second_root)}):
+            second = get_database()
+
+        assert first.db_path == first_root / ".pongogo" / "pongogo.db"
+        assert second.db_path == second_root / ".pongogo" / "pongogo.db"
+
+    def test_recreates_after_file_removed(self, tmp_path):
+        """Should rebuild schema if the database file was deleted."""
+        db_path = tmp_path / ".pongogo" / "pongogo.db"
+        first = get_database(db_path)
+        first.close()
+        db_path.unlink()
+
+        second = get_database(db_path)
+        assert second is not first
+        assert second.get_schema_version() == "3.1.0"
+
 
 class TestRoutingEvents:
     """Tests for routing event functions."""
@@ -199,6 +353,38 @@ class TestRoutingEvents:
         assert stats["status"] == "active"
         assert stats["total_count"] == 3
 
+    def test_get_stats_first_and_last_event(self, tmp_path):
+        """First/last should follow insert order; recent events count as 24h."""
+        db_path = tmp_path / ".pongogo" / "pongogo.db"
+        db = get_database(db_path)
+        for timestamp in ["2025-01-02T00:00:00", "2025-01-01T00:00:00"]:
+            db.execute_insert(
+                "INSERT INTO routing_events (timestamp, user_message) VALUES (?, ?)",
+                (timestamp, "old"),
+            )
+        store_routing_event("q1", ["i1"], "test", db_path=db_path)
+
+        stats = get_event_stats(db_path=db_path)
+        assert stats["total_count"] == 3
+        assert stats["first_event"] == "2025-01-02T00:00:00"
+        assert stats["last_event"] > "2025-01-02"
+        assert stats["last_24h_count"] == 1
+        assert stats["engine_distribution"] == {"durian-0.6.1": 2, "test": 1}
+
+    def test_get_stats_counts_events_without_engine(self, tmp_path):
+        """The total should include events whose engine_version is NULL."""
+        db_path = tmp_path / ".pongogo" / "pongogo.db"
+        store_routing_event("q1", ["i1"], "test", db_path=db_path)
+        get_database(db_path).execute_insert(
+            "INSERT INTO routing_events (timestamp, user_message, engine_version) "
+            "VALUES (?, ?, NULL)",
+            ("2025-01-01T00:00:00", "legacy"),
+        )
+
+        stats = get_event_stats(db_path=db_path)
+        assert stats["total_count"] == 2
+        assert stats["engine_distribution"] == {"test": 1, None: 1}
+
     def test_get_recent_events(self, tmp_path):
         """Should return recent events."""
         db_path = tmp_path / ".pongogo" / "pongogo.db"
@@ -209,6 +395,35 @@ class TestRoutingEvents:
         events = get_recent_events(limit=10, db_path=db_path)
         assert len(events) == 2
 
+    def test_store_events_batch(self, tmp_path):
+        """Should store all events in one call and report how many."""
+        db_path = tmp_path / ".pongogo" / "pongogo.db"
+
+        stored = store_routing_events_batch(
+            [
+                {
+                    "user_message": "q1",
+                    "routed_instructions": ["i1", "i2"],
+                    "engine_version": "test",
+                },
+                {
+                    "user_message": "q2",
+                    "routed_instructions": [],
+                    "engine_version": "test",
+                    "session_id": "s1",
+                },
+            ],
+            db_path=db_path,
+        )
+
+        assert stored == 2
+        events = get_recent_events(limit=10, db_path=db_path)
+        assert [(e["user_message"], e["instruction_count"]) for e in events] == [
+            ("q2", 0),
+            ("q1", 2),
+        ]
+        assert store_routing_events_batch([], db_path=db_path) == 0
+
 
 class TestRoutingTriggers:
     """Tests for routing trigger functions."""
@@ -238,6 +453,35 @@ class TestRoutingTriggers:
         assert "oops" in friction
         assert "mistake" in friction
 
+    def test_get_triggers_by_type_cache_sees_writes(self, tmp_path):
+        """Cached trigger dicts should be refreshed after upserts."""
+        db_path = tmp_path / ".pongogo" / "pongogo.db"
+
+        upsert_trigger(TriggerType.FRICTION, "oops", "recovery", db_path=db_path)
+        first = get_triggers_by_type(TriggerType.FRICTION, db_path=db_path)
+        first["mutated"] = "by caller"
+
+        upsert_trigger(TriggerType.FRICTION, "mistake", "recovery", db_path=db_path)
+        second = get_triggers_by_type(TriggerType.FRICTION, db_path=db_path)
+
+        assert second == {"oops": "recovery", "mistake": "recovery"}
+
+    def test_bulk_load_triggers(self, tmp_path):
+        """Should load all triggers and disable replaced ones."""
+        db_path = tmp_path / ".pongogo" / "pongogo.db"
+
+        upsert_trigger(TriggerType.FRICTION, "stale", "old", db_path=db_path)
+        count = bulk_load_triggers(
+            TriggerType.FRICTION,
+            {"oops": "recovery", "mistake": None},
+            replace_existing=True,
+            db_path=db_path,
+        )
+
+        assert count == 2
+        friction = get_triggers_by_type(TriggerType.FRICTION, db_path=db_path)
+        assert friction == {"oops": "recovery", "mistake": None}
+
     def test_trigger_stats(self, tmp_path):
         """Should return trigger statistics."""
         db_path = tmp_path / ".pongogo" / "pongogo.db"
@@ -249,6 +493,34 @@ class TestRoutingTriggers:
         assert TriggerType.FRICTION.value in stats["by_type"]
 
 
+class TestTransientErrors:
+    """Tests for lock errors surfacing as TransientDBError."""
+
+    def test_locked_database_raises_transient(self, tmp_path):
+        """Lock errors should raise instead of returning a sentinel."""
+        db = get_database(tmp_path / ".pongogo" / "pongogo.db")
+
+        locked = sqlite3.OperationalError("database is locked")
+
+        with (
+            patch.object(db, "execute_insert", side_effect=locked),
+            pytest.raises(TransientDBError),
+        ):
+            upsert_trigger(TriggerType.FRICTION, "oops", db_path=db.db_path)
+
+    def test_other_errors_return_sentinel(self, tmp_path):
+        """Non-transient SQLite errors should still log and return a sentinel."""
+        db = get_database(tmp_path / ".pongogo" / "pongogo.db")
+
+        with patch.object(
+            db, "execute_insert", side_effect=sqlite3.IntegrityError("constraint")
+        ):
+            assert (
+                store_observation(ObservationType.PATTERN, "Seen", db_path=db.db_path)
+                == 0
+            )
+
+
 class TestArtifacts:
     """Tests for artifact discovery functions."""
 
@@ -350,6 +622,85 @@ class TestObservations:
         )
         assert len(observations) == 2
 
+    def test_store_observations_batch(self, tmp_path):
+        """Should store all observations and return their IDs in order."""
+        from mcp_server.database.observations import ObservationStatus
+
+        db_path = tmp_path / ".pongogo" / "pongogo.db"
+        store_observation(ObservationType.PATTERN, "Existing", db_path=db_path)
+
+        ids = store_observations_batch(
+            [
+                {
+                    "observation_type": ObservationType.GUIDANCE_EXPLICIT,
+                    "observation_content": "Rule 1",
+                    "guidance_type": GuidanceType.EXPLICIT,
+                },
+                {
+                    "observation_type": ObservationType.CORRECTION,
+                    "observation_content": "Fix 1",
+                    "context": {"file": "a.py"},
+                },
+            ],
+            db_path=db_path,
+        )
+
+        rows = get_observations_by_status(ObservationStatus.DISCOVERED, db_path=db_path)
+        by_id = {row["id"]: row for row in rows}
+        assert [by_id[i]["observation_content"] for i in ids] == ["Rule 1", "Fix 1"]
+        assert by_id[ids[1]]["context"] == '{"file":"a.py"}'
+
+    def test_observation_counters_backfilled_for_existing_db(self, tmp_path):
+        """Counters should be rebuilt once for databases that predate them."""
+        from mcp_server.database import database
+
+        db_path = tmp_path / ".pongogo" / "pongogo.db"
+        store_observation(ObservationType.PATTERN, "Seen", db_path=db_path)
+        store_observation(ObservationType.PATTERN, "Again", db_path=db_path)
+
+        # Simulate a database created before observation_counters existed
+        conn = sqlite3.connect(db_path)
+        conn.execute("DELETE FROM observation_counters")
+        conn.execute(
+            "DELETE FROM schema_info WHERE key = 'observation_counters_seeded'"
+        )
+        conn.commit()
+        conn.close()
+        database._initialized_paths.discard(db_path)
+
+        PongogoDatabase(db_path=db_path)
+
+        stats = get_observation_stats(db_path=db_path)
+        assert stats["by_status"] == {"DISCOVERED": 2}
+        assert stats["by_type"] == {"PATTERN": 2}
+
+    def test_promote_observation(self, tmp_path):
+        """Should create implementation and mark observation promoted."""
+        from mcp_server.database.observations import ObservationStatus
+
+        db_path = tmp_path / ".pongogo" / "pongogo.db"
+        obs_id = store_observation(ObservationType.CORRECTION, "Fix", db_path=db_path)
+
+        impl_id = promote_observation(
+            obs_id, ImplementationType.PROJECT_RULE, db_path=db_path
+        )
+
+        assert impl_id
+        promoted = get_observations_by_status(
+            ObservationStatus.PROMOTED, db_path=db_path
+        )
+        assert [o["promoted_to"] for o in promoted] == [impl_id]
+
+    def test_promote_missing_observation(self, tmp_path):
+        """Should return None when the observation doesn't exist."""
+        db_path = tmp_path / ".pongogo" / "pongogo.db"
+
+        assert (
+            promote_observation(999, ImplementationType.TRIGGER, db_path=db_path)
+            is None
+        )
+        assert get_observation_stats(db_path=db_path)["implemented_count"] == 0
+
     def test_observation_stats(self, tmp_path):
         """Should return observation statistics."""
         db_path = tmp_path / ".pongogo" / "pongogo.db"
@@ -365,3 +716,26 @@ class TestObservations:
         assert "by_status" in stats
         assert "by_type" in stats
         assert "by_guidance" in stats
+
+    def test_observation_stats_counts(self, tmp_path):
+        """Should count by status, live type, guidance, and implementation."""
+        db_path = tmp_path / ".pongogo" / "pongogo.db"
+
+        kept = store_observation(
+            ObservationType.GUIDANCE_EXPLICIT,
+            "Rule",
+            guidance_type=GuidanceType.EXPLICIT,
+            db_path=db_path,
+        )
+        dropped = store_observation(ObservationType.CORRECTION, "Fix", db_path=db_path)
+        store_observation(ObservationType.CORRECTION, "Other fix", db_path=db_path)
+        reject_observation(dropped, "noise", db_path=db_path)
+        promote_observation(kept, ImplementationType.TRIGGER, db_path=db_path)
+
+        stats = get_observation_stats(db_path=db_path)
+        assert stats == {
+            "by_status": {"PROMOTED": 1, "REJECTED": 1, "DISCOVERED": 1},
+            "by_type": {"GUIDANCE_EXPLICIT": 1, "CORRECTION": 1},
+            "by_guidance": {"explicit": 1},
+            "implemented_count": 1,
+        }
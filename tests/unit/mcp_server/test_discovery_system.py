@@ -0,0 +1,356 @@
+"""Tests for discovery system scanning and storage."""
+
+from mcp_server.discovery_system import (
+    DiscoveredSection,
+    DiscoveryScanner,
+    DiscoverySystem,
+)
+
+TESTING_SECTION = (
+    "## Testing\n\nRun pytest with coverage before pushing any change to the "
+    "main branch, and fix every failing test first.\n"
+)
+DEPLOY_SECTION = (
+    "## Deployment\n\nDeploy only through the release workflow so that "
+    "artifacts are signed and the changelog is published.\n"
+)
+
+
+def _write_claude_md(root, body):
+    (root / "CLAUDE.md").write_text(body, encoding="utf-8")
+
+
+class TestDiscoveryScanner:
+    """Tests for DiscoveryScanner."""
+
+    def test_scan_all_order_is_stable(self, tmp_path):
+        """Concurrent scanning should return CLAUDE.md, wiki, docs in order."""
+        _write_claude_md(tmp_path, TESTING_SECTION)
+        for folder in ("wiki", "docs"):
+            (tmp_path / folder).mkdir()
+            for i in range(5):
+                (tmp_path / folder / f"page{i}.md").write_text(
+                    DEPLOY_SECTION.replace("Deployment", f"{folder} {i}"),
+                    encoding="utf-8",
+                )
+
+        scanner = DiscoveryScanner(tmp_path)
+        sections = scanner.scan_all()
+
+        sequential = scanner._scan_markdown_file(tmp_path / "CLAUDE.md", "CLAUDE_MD")
+        for folder, source_type in (("wiki", "WIKI"), ("docs", "DOCS")):
+            for md_file in (tmp_path / folder).rglob("*.md"):
+                sequential.extend(scanner._scan_markdown_file(md_file, source_type))
+        assert sections == sequential
+        assert [s.source_type for s in sections] == (
+            ["CLAUDE_MD"] + ["WIKI"] * 5 + ["DOCS"] * 5
+        )
+
+    def test_skips_hidden_files_and_directories(self, tmp_path):
+        """Hidden entries under a scanned folder are ignored."""
+        docs = tmp_path / "docs"
+        (docs / "guide" / "deep").mkdir(parents=True)
+        (docs / ".drafts").mkdir()
+        (docs / "guide" / "deep" / "setup.md").write_text(
+            DEPLOY_SECTION, encoding="utf-8"
+        )
+        (docs / ".drafts" / "wip.md").write_text(TESTING_SECTION, encoding="utf-8")
+        (docs / ".hidden.md").write_text(TESTING_SECTION, encoding="utf-8")
+
+        sections = DiscoveryScanner(tmp_path).scan_docs()
+
+        assert [s.source_file for s in sections] == ["docs/guide/deep/setup.md"]
+
+    def test_project_inside_hidden_directory(self, tmp_path):
+        """Only paths below the scanned folder count as hidden."""
+        root = tmp_path / ".workspace" / "project"
+        (root / "docs").mkdir(parents=True)
+        (root / "docs" / "deploy.md").write_text(DEPLOY_SECTION, encoding="utf-8")
+
+        assert len(DiscoveryScanner(root).scan_docs()) == 1
+
+    def test_extracts_overlapping_code_identifiers(self, tmp_path):
+        """Each code pattern sees the text other patterns matched."""
+        keywords = DiscoveryScanner(tmp_path)._extract_keywords(
+            None, "const function handler = 1; def class Widget"
+        )
+        assert keywords == ["class", "function", "handler", "widget"]
+
+    def test_word_counts_match_lowercased_text(self, tmp_path):
+        """Frequent words are counted in the lowercased text."""
+        scanner = DiscoveryScanner(tmp_path)
+        # "İ" lowercases to "i" plus a combining dot; the Kelvin sign to "k"
+        assert scanner._extract_keywords(None, "İstanbul " * 3) == ["stanbul"]
+        assert scanner._extract_keywords(None, "\u212aelvin " * 3) == ["kelvin"]
+
+
+class TestScanRepository:
+    """Tests for DiscoverySystem.scan_repository."""
+
+    def test_scan_inserts_sections(self, tmp_path):
+        """First scan should store every section as a new discovery."""
+        _write_claude_md(tmp_path, TESTING_SECTION + "\n" + DEPLOY_SECTION)
+        ds = DiscoverySystem(tmp_path)
+
+        result = ds.scan_repository()
+
+        assert result.new_discoveries == 2
+        assert result.updated_discoveries == 0
+        assert len(ds.list_discoveries()) == 2
+
+    def test_rescan_is_idempotent(self, tmp_path):
+        """Rescanning unchanged content should not insert duplicates."""
+        _write_claude_md(tmp_path, TESTING_SECTION)
+        ds = DiscoverySystem(tmp_path)
+        ds.scan_repository()
+
+        result = ds.scan_repository()
+
+        assert result.new_discoveries == 0
+        assert result.updated_discoveries == 1
+        assert len(ds.list_discoveries()) == 1
+
+    def test_rescan_updates_changed_section(self, tmp_path):
+        """Changed content under the same title should update in place."""
+        _write_claude_md(tmp_path, TESTING_SECTION)
+        ds = DiscoverySystem(tmp_path)
+        ds.scan_repository()
+        _write_claude_md(tmp_path, TESTING_SECTION.replace("pytest", "tox"))
+
+        result = ds.scan_repository()
+
+        assert result.updated_discoveries == 1
+        discoveries = ds.list_discoveries()
+        assert len(discoveries) == 1
+        assert "tox" in discoveries[0].section_content
+
+    def test_records_scan_history(self, tmp_path):
+        """Each scan should write one history row per source type."""
+        _write_claude_md(tmp_path, TESTING_SECTION)
+        ds = DiscoverySystem(tmp_path)
+
+        ds.scan_repository()
+
+        rows = ds.db.execute("SELECT source_type, new_discoveries FROM scan_history")
+        assert [(r["source_type"], r["new_discoveries"]) for r in rows] == [
+            ("CLAUDE_MD", 1)
+        ]
+
+
+class TestScanFileCache:
+    """Tests for skipping unchanged files on rescan."""
+
+    def _fail_parse(self, *args):
+        raise AssertionError("unchanged file was parsed")
+
+    def test_unchanged_file_is_not_parsed(self, tmp_path, monkeypatch):
+        """A second scan should reuse sections for files with the same stat."""
+        _write_claude_md(tmp_path, TESTING_SECTION)
+        ds = DiscoverySystem(tmp_path)
+        first = ds.scanner.scan_all()
+
+        monkeypatch.setattr(ds.scanner, "_split_by_headers", self._fail_parse)
+
+        assert ds.scanner.scan_all() == first
+
+    def test_cache_persists_across_instances(self, tmp_path, monkeypatch):
+        """Cached sections should be loaded from the database by a new system."""
+        _write_claude_md(tmp_path, TESTING_SECTION)
+        DiscoverySystem(tmp_path).scan_repository()
+
+        ds = DiscoverySystem(tmp_path)
+        monkeypatch.setattr(ds.scanner, "_split_by_headers", self._fail_parse)
+        result = ds.scan_repository()
+
+        assert result.total_discoveries == 1
+        assert result.updated_discoveries == 1
+
+    def test_changed_and_removed_files(self, tmp_path):
+        """Edited files are re-parsed and deleted files leave the cache."""
+        _write_claude_md(tmp_path, TESTING_SECTION)
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "deploy.md").write_text(DEPLOY_SECTION, encoding="utf-8")
+        ds = DiscoverySystem(tmp_path)
+        ds.scan_repository()
+
+        _write_claude_md(tmp_path, TESTING_SECTION.replace("pytest", "tox"))
+        (tmp_path / "docs" / "deploy.md").unlink()
+        ds.scan_repository()
+
+        rows = ds.db.execute("SELECT path, sections FROM scan_file_cache")
+        assert [r["path"] for r in rows] == ["CLAUDE.md"]
+        assert "tox" in rows[0]["sections"]
+
+
+class TestInsertDiscoveries:
+    """Tests for DiscoverySystem.insert_discoveries."""
+
+    def _section(self, title, content, content_hash):
+        return DiscoveredSection(
+            source_file="CLAUDE.md",
+            source_type="CLAUDE_MD",
+            section_title=title,
+            section_content=content,
+            content_hash=content_hash,
+            keywords=["testing"],
+        )
+
+    def test_skips_existing_hashes(self, tmp_path):
+        """Sections whose content is already stored should be skipped."""
+        ds = DiscoverySystem(tmp_path)
+        first = self._section("Testing", "Run pytest.", "hash-a")
+        ds.insert_discoveries([first])
+
+        inserted = ds.insert_discoveries(
+            [first, self._section("Deploy", "Use CI.", "hash-b")]
+        )
+
+        assert inserted == 1
+        assert len(ds.list_discoveries()) == 2
+
+    def test_empty_batch(self, tmp_path):
+        """An empty batch should not touch the database."""
+        ds = DiscoverySystem(tmp_path)
+        assert ds.insert_discoveries([]) == 0
+
+
+class TestFindMatches:
+    """Tests for DiscoverySystem.find_matches."""
+
+    def _store(self, ds, title, keywords, content_hash):
+        ds.insert_discoveries(
+            [
+                DiscoveredSection(
+                    source_file="CLAUDE.md",
+                    source_type="CLAUDE_MD",
+                    section_title=title,
+                    section_content=f"{title} guidance.",
+                    content_hash=content_hash,
+                    keywords=keywords,
+                )
+            ]
+        )
+
+    def _populate(self, ds):
+        self._store(ds, "Auth", ["authentication", "api_token", "login"], "h1")
+        self._store(ds, "Api", ["api_token", "rate_limit"], "h2")
+        self._store(ds, "Deploy", ["release", "workflow"], "h3")
+
+    def test_ranks_best_match_first(self, tmp_path):
+        """Discoveries sharing more keywords should rank first."""
+        ds = DiscoverySystem(tmp_path)
+        self._populate(ds)
+
+        matches = ds.find_matches(["api_token", "login", "unrelated"])
+
+        assert [m.section_title for m in matches] == ["Auth", "Api"]
+
+    def test_matches_whole_snake_case_keywords(self, tmp_path):
+        """A partial identifier should not match a snake_case keyword."""
+        ds = DiscoverySystem(tmp_path)
+        self._populate(ds)
+
+        assert ds.find_matches(["token"]) == []
+
+    def test_skips_promoted_and_archived(self, tmp_path):
+        """Only DISCOVERED rows should be returned."""
+        ds = DiscoverySystem(tmp_path)
+        self._populate(ds)
+        auth = ds.find_matches(["login"])[0]
+        ds.archive_discovery(auth.id)
+
+        assert ds.find_matches(["login"]) == []
+
+    def test_python_fallback_finds_same_discoveries(self, tmp_path):
+        """The scan used without FTS5 should match the same discoveries."""
+        ds = DiscoverySystem(tmp_path)
+        self._populate(ds)
+        expected = {m.id for m in ds.find_matches(["api_token", "login", "release"])}
+
+        ds._use_fts = False
+
+        matches = ds.find_matches(["api_token", "login", "release"])
+        assert {m.id for m in matches} == expected
+        assert matches[0].section_title == "Auth"
+
+    def test_python_fallback_skips_rows_changed_after_scan(self, tmp_path, monkeypatch):
+        """A winner archived before its row is fetched should be skipped."""
+        ds = DiscoverySystem(tmp_path)
+        self._populate(ds)
+        ds._use_fts = False
+        auth_id = ds.find_matches(["login"])[0].id
+        scan = ds.db.iter_execute
+
+        def scan_then_archive(sql, params=()):
+            yield from scan(sql, params)
+            ds.archive_discovery(auth_id)
+
+        monkeypatch.setattr(ds.db, "iter_execute", scan_then_archive)
+
+        matches = ds.find_matches(["api_token", "login"])
+        assert [m.section_title for m in matches] == ["Api"]
+
+    def test_python_fallback_fetches_in_chunks(self, tmp_path, monkeypatch):
+        """Ranking order should survive fetching winners in several queries."""
+        ds = DiscoverySystem(tmp_path)
+        self._populate(ds)
+        ds._use_fts = False
+        keywords = ["api_token", "login", "release"]
+        expected = [m.id for m in ds.find_matches(keywords)]
+        monkeypatch.setattr("mcp_server.discovery_system.operations._MAX_IN_PARAMS", 1)
+
+        assert len(expected) == 3
+        assert [m.id for m in ds.find_matches(keywords)] == expected
+
+    def test_updated_keywords_are_reindexed(self, tmp_path):
+        """Keyword updates should be visible to matching."""
+        ds = DiscoverySystem(tmp_path)
+        self._populate(ds)
+        ds.db.execute_update(
+            "UPDATE artifact_discovered SET keywords = ? WHERE content_hash = 'h3'",
+            ('["deployment"]',),
+        )
+
+        assert ds.find_matches(["release"]) == []
+        assert [m.section_title for m in ds.find_matches(["deployment"])] == ["Deploy"]
+
+
+class TestGetStats:
+    """Tests for DiscoverySystem.get_stats."""
+
+    def test_counts_by_status_and_source(self, tmp_path):
+        """Totals include every status; by_source excludes archived rows."""
+        _write_claude_md(tmp_path, TESTING_SECTION + "\n" + DEPLOY_SECTION)
+        ds = DiscoverySystem(tmp_path)
+        ds.scan_repository()
+        ds.archive_discovery(ds.list_discoveries()[0].id)
+
+        stats = ds.get_stats()
+
+        assert stats == {
+            "total": 2,
+            "by_status": {"DISCOVERED": 1, "PROMOTED": 0, "ARCHIVED": 1},
+            "by_source": {"CLAUDE_MD": 1},
+        }
+
+
+class TestSlugify:
+    """Tests for DiscoverySystem._slugify."""
+
+    def test_ascii_titles(self, tmp_path):
+        """Punctuation is dropped and whitespace/hyphen runs become one '_'."""
+        ds = DiscoverySystem(tmp_path)
+        assert ds._slugify("Running the Test-Suite (CI/CD)!") == (
+            "running_the_test_suite_cicd"
+        )
+        assert ds._slugify("  Setup -- the   API  ") == "setup_the_api"
+
+    def test_non_ascii_titles(self, tmp_path):
+        """Unicode word characters are kept, other symbols dropped."""
+        ds = DiscoverySystem(tmp_path)
+        assert ds._slugify("Café — Überblick™") == "café_überblick"
+
+    def test_length_limit(self, tmp_path):
+        """Slugs are capped at 50 characters."""
+        ds = DiscoverySystem(tmp_path)
+        assert len(ds._slugify("word " * 40)) == 50
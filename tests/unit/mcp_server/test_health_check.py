@@ -1,13 +1,19 @@
 """Tests for health_check module."""
 
+import os
 import sqlite3
+from datetime import datetime, timezone
+
+import yaml
 
 from mcp_server.health_check import (
+    _probe_events_db,
     check_config_validity,
     check_container_status,
     check_database_health,
     check_event_capture,
     get_health_status,
+    invalidate_health_cache,
 )
 
 
@@ -30,6 +36,20 @@ class TestCheckContainerStatus:
         result = check_container_status()
         assert "containerized" in result
 
+    def test_detects_once_per_process(self, monkeypatch):
+        """Detection should run once and later calls reuse the result."""
+        calls = []
+
+        def detect():
+            calls.append(1)
+            return {"status": "healthy", "reason": "test", "containerized": False}
+
+        monkeypatch.setattr("mcp_server.health_check._container_status", None)
+        monkeypatch.setattr("mcp_server.health_check._detect_container_status", detect)
+
+        assert check_container_status() == check_container_status()
+        assert len(calls) == 1
+
 
 class TestCheckDatabaseHealth:
     """Tests for check_database_health function."""
@@ -73,6 +93,40 @@ class TestCheckDatabaseHealth:
         assert result["status"] == "healthy"
         assert result["writable"] is True
 
+    def test_lock_only_reported_in_deep_mode(self, tmp_path, monkeypatch):
+        """A held write lock should not fail the default permission check."""
+        db_path = tmp_path / "events.db"
+        writer = sqlite3.connect(db_path, isolation_level=None)
+        writer.execute("CREATE TABLE routing_events (id INTEGER PRIMARY KEY)")
+        writer.execute("BEGIN IMMEDIATE")
+
+        monkeypatch.setattr(
+            "mcp_server.health_check.get_events_db_path",
+            lambda: db_path,
+        )
+
+        try:
+            assert check_database_health()["status"] == "healthy"
+            assert check_database_health(deep=True)["status"] == "locked"
+        finally:
+            writer.rollback()
+            writer.close()
+
+    def test_error_when_not_writable(self, tmp_path, monkeypatch):
+        """Should report an error when permissions deny writing."""
+        db_path = tmp_path / "events.db"
+        sqlite3.connect(db_path).close()
+
+        monkeypatch.setattr(
+            "mcp_server.health_check.get_events_db_path",
+            lambda: db_path,
+        )
+        monkeypatch.setattr("mcp_server.health_check.os.access", lambda *_: False)
+
+        result = check_database_health()
+        assert result["status"] == "error"
+        assert result["writable"] is False
+
 
 class TestCheckEventCapture:
     """Tests for check_event_capture function."""
@@ -118,6 +172,57 @@ class TestCheckEventCapture:
         assert result["total_count"] == 0
 
 
+class TestProbeEventsDb:
+    """Tests for the shared events database probe."""
+
+    def test_reports_health_and_activity(self, tmp_path, monkeypatch):
+        """One probe should report both writability and the latest event."""
+        db_path = tmp_path / "events.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE routing_events (id INTEGER PRIMARY KEY, timestamp TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO routing_events (timestamp) VALUES (?)",
+            (datetime.now(timezone.utc).isoformat(),),
+        )
+        conn.commit()
+        conn.close()
+
+        monkeypatch.setattr(
+            "mcp_server.health_check.get_events_db_path",
+            lambda: db_path,
+        )
+
+        database, events = _probe_events_db()
+        assert database["status"] == "healthy"
+        assert events["status"] == "active"
+        assert events["total_count"] == 1
+
+    def test_accepts_zulu_timestamps(self, tmp_path, monkeypatch):
+        """A trailing Z should parse as UTC."""
+        db_path = tmp_path / "events.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE routing_events (id INTEGER PRIMARY KEY, timestamp TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO routing_events (timestamp) VALUES (?)",
+            (datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),),
+        )
+        conn.commit()
+        conn.close()
+
+        monkeypatch.setattr(
+            "mcp_server.health_check.get_events_db_path",
+            lambda: db_path,
+        )
+
+        result = check_event_capture()
+        assert result["status"] == "active"
+        assert result["last_event_ago"].endswith("s ago")
+
+
 class TestCheckConfigValidity:
     """Tests for check_config_validity function."""
 
@@ -179,6 +284,33 @@ class TestCheckConfigValidity:
         result = check_config_validity()
         assert result["status"] == "invalid"
 
+    def test_reuses_verdict_until_files_change(self, tmp_path, monkeypatch):
+        """Config changes and new categories should invalidate the verdict."""
+        pongogo_dir = tmp_path / ".pongogo"
+        (pongogo_dir / "instructions").mkdir(parents=True)
+        config_path = pongogo_dir / "config.yaml"
+        config_path.write_text("key: value\n")
+
+        parses = []
+        safe_load = yaml.safe_load
+        monkeypatch.setattr(
+            "mcp_server.health_check.yaml.safe_load",
+            lambda f: parses.append(1) or safe_load(f),
+        )
+
+        assert check_config_validity(tmp_path)["status"] == "valid"
+        assert check_config_validity(tmp_path)["status"] == "valid"
+        assert len(parses) == 1
+
+        (pongogo_dir / "instructions" / "testing").mkdir()
+        # Directory mtimes can be coarse; make the change visible
+        os.utime(pongogo_dir / "instructions", ns=(0, 1))
+        assert check_config_validity(tmp_path)["categories_count"] == 1
+
+        config_path.write_text("invalid: yaml: content:\n")
+        assert check_config_validity(tmp_path)["status"] == "invalid"
+        assert len(parses) == 3
+
 
 class TestGetHealthStatus:
     """Tests for get_health_status function."""
@@ -230,3 +362,66 @@ class TestGetHealthStatus:
         result = get_health_status()
         # Without config or database, should be degraded or unhealthy
         assert result["overall"] in ("degraded", "unhealthy")
+
+    def test_reuses_recent_result(self, tmp_path, monkeypatch):
+        """Back-to-back polls should share one set of checks until invalidated."""
+        monkeypatch.setattr(
+            "mcp_server.health_check.get_events_db_path",
+            lambda: tmp_path / "events.db",
+        )
+        monkeypatch.setattr(
+            "mcp_server.health_check.get_project_root",
+            lambda: tmp_path,
+        )
+        invalidate_health_cache()
+
+        first = get_health_status()
+        (tmp_path / ".pongogo").mkdir(exist_ok=True)
+        (tmp_path / ".pongogo" / "config.yaml").write_text("key: value\n")
+        assert get_health_status()["timestamp"] == first["timestamp"]
+
+        invalidate_health_cache()
+        assert get_health_status()["config"]["status"] == "valid"
+
+    def test_cached_result_is_not_shared(self, tmp_path, monkeypatch):
+        """Mutating a returned result should not change later polls."""
+        monkeypatch.setattr(
+            "mcp_server.health_check.get_events_db_path",
+            lambda: tmp_path / "events.db",
+        )
+        monkeypatch.setattr(
+            "mcp_server.health_check.get_project_root",
+            lambda: tmp_path,
+        )
+        invalidate_health_cache()
+
+        first = get_health_status()
+        first["config"]["status"] = "annotated"
+        second = get_health_status()
+        second["database"]["status"] = "annotated"
+
+        third = get_health_status()
+        assert third["timestamp"] == first["timestamp"]
+        assert third["config"]["status"] != "annotated"
+        assert third["database"]["status"] != "annotated"
+
+    def test_resolves_paths_once(self, tmp_path, monkeypatch):
+        """Each path should be resolved once per uncached status check."""
+        calls = []
+
+        def events_db_path():
+            calls.append("events_db")
+            return tmp_path / "events.db"
+
+        def project_root():
+            calls.append("project_root")
+            return tmp_path
+
+        monkeypatch.setattr(
+            "mcp_server.health_check.get_events_db_path", events_db_path
+        )
+        monkeypatch.setattr("mcp_server.health_check.get_project_root", project_root)
+        invalidate_health_cache()
+
+        get_health_status()
+        assert sorted(calls) == ["events_db", "project_root"]
@@ -0,0 +1,326 @@
+"""Tests for the rule-based routing engine (pongogo_router)."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mcp_server.database import get_database
+from mcp_server.instruction_handler import InstructionFile, InstructionHandler
+from mcp_server.pongogo_router import (
+    COMMENCEMENT_LOOKBACK_BOOST,
+    RuleBasedRouter,
+    _top_by_score,
+)
+
+
+@pytest.fixture
+def router(tmp_path):
+    """Router over an empty knowledge base."""
+    handler = InstructionHandler(tmp_path)
+    return RuleBasedRouter(handler, {"use_lexicon": False})
+
+
+class TestSimpleApproval:
+    """Tests for IMP-003 approval suppression and commencement override."""
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "let's continue",
+            "Yes, let's proceed with the migration",
+            "ok go ahead and continue",
+            "  Please Resume.  ",
+            "after reviewing the failing checks in the pipeline, please continue",
+        ],
+    )
+    def test_commencement_phrase_overrides_suppression(self, router, message):
+        """Commencement phrases at the start or after a space should not suppress."""
+        assert router._is_simple_approval(message) == (
+            False,
+            "commencement_phrase_detected",
+            True,
+        )
+
+    def test_commencement_phrase_must_start_a_word(self, router):
+        """A phrase glued to a preceding word is not a commencement."""
+        suppress, reason, commencement = router._is_simple_approval("yesgo ahead")
+        assert commencement is False
+        assert reason != "commencement_phrase_detected"
+
+    @pytest.mark.parametrize(
+        ("message", "reason"),
+        [
+            ("Sounds good!!", "exact_approval_match"),
+            ("lgtm.", "exact_approval_match"),
+            ("ok cool", "short_approval_message"),
+            ("ok ...", "short_approval_message"),
+            ("yes great fine then", "approval_dominated_message"),
+            ("yes! yes! run it", "approval_dominated_message"),
+        ],
+    )
+    def test_approval_is_suppressed(self, router, message, reason):
+        """Short approvals should suppress routing with the matching reason."""
+        assert router._is_simple_approval(message) == (True, reason, False)
+
+    def test_work_request_is_not_suppressed(self, router):
+        """Ordinary requests should not be treated as approvals."""
+        assert router._is_simple_approval(
+            "please refactor the database module to use pooling"
+        ) == (False, "not_approval", False)
+
+
+class TestViolationDetection:
+    """Tests for IMP-002 violation signals."""
+
+    def test_emphasis_forms(self, router):
+        """Each emphasis form should be reported once per word."""
+        result = router._detect_violations("stop! no, that is BAD")
+        assert set(result["signals"]) == {
+            "exclaimed_stop",
+            "sentence_start_no",
+            "emphasized_BAD",
+        }
+
+    def test_caps_takes_precedence(self, router):
+        """A capitalized word is reported as emphasized, not exclaimed."""
+        result = router._detect_violations("NO! no!")
+        assert result["signals"] == ["emphasized_NO"]
+
+    def test_plain_words_are_not_violations(self, router):
+        """Emphasis words inside a sentence are not violation signals."""
+        assert (
+            router._detect_violations("there is no bad data to stop")["detected"]
+            is False
+        )
+
+
+def _instruction(inst_id, **metadata):
+    """Build an in-memory instruction file."""
+    return InstructionFile(
+        Path(f"/kb/{inst_id}.instructions.md"), {"id": inst_id, **metadata}, "Body."
+    )
+
+
+class TestInstructionProfiles:
+    """Tests for cached per-instruction scoring profiles."""
+
+    def test_profiles_follow_instruction_reloads(self, router):
+        """Instructions added after construction should be scored."""
+        assert router.route("database migration steps")["count"] == 0
+
+        router.instruction_handler.instructions["db"] = _instruction(
+            "database_migrations",
+            description="How to run database migrations",
+            tags=["Database"],
+        )
+        result = router.route("database migration steps")
+        assert [inst["id"] for inst in result["instructions"]] == [
+            "database_migrations"
+        ]
+
+        router.instruction_handler.instructions["db"] = _instruction(
+            "release_notes", description="Writing release notes"
+        )
+        assert router.route("database migration steps")["count"] == 0
+
+    def test_breakdown_reports_original_spelling(self, router):
+        """Tag and metadata keyword matches should keep their original case."""
+        router.instruction_handler.instructions["ci"] = _instruction(
+            "ci_pipeline",
+            tags=["GitHub-Actions"],
+            routing={"triggers": {"keywords": ["CI_Workflow", "Pipeline"]}},
+        )
+        result = router.route("fix the github ci_workflow pipeline")
+        breakdown = result["instructions"][0]["score_breakdown"]
+        assert "tag:GitHub-Actions" in breakdown["keyword_matches"]
+        assert "metadata_keyword_exact:CI_Workflow" in breakdown["keyword_matches"]
+        assert "metadata_keyword:Pipeline" in breakdown["keyword_matches"]
+
+    def test_keywords_match_as_substrings(self, router):
+        """Keywords should still match inside longer ids, tags and categories."""
+        router.instruction_handler.instructions["t"] = _instruction(
+            "integration_testing",
+            tags=["retesting"],
+            categories=["testsuite"],
+        )
+        result = router.route("test deploy")
+        breakdown = result["instructions"][0]["score_breakdown"]
+        assert breakdown["keyword_matches"] == ["id:test", "tag:retesting"]
+        assert breakdown["category_matches"] == ["testsuite"]
+        assert breakdown["tag_matches"] == ["retesting"]
+
+    def test_globs_and_context_patterns(self, router):
+        """Each matching (file, glob) pair and branch pattern should score."""
+        router.instruction_handler.instructions["py"] = _instruction(
+            "python_style",
+            routing={
+                "applyTo": {"globs": ["*.py", "src/*"]},
+                "contextual": {"files": ["*.md"], "branches": ["feature/*"]},
+            },
+        )
+        result = router.route(
+            "zzz", {"files": ["src/app.py", "README.md"], "branch": "feature/x"}
+        )
+        breakdown = result["instructions"][0]["score_breakdown"]
+        assert breakdown["glob_matches"] == [
+            "src/app.py matches *.py",
+            "src/app.py matches src/*",
+        ]
+        assert breakdown["contextual_matches"] == [
+            "file_context:README.md",
+            "branch_context:feature/x",
+        ]
+        assert breakdown["total_score"] == 7 * 2 + 5 * 2
+
+    def test_no_signal_scores_nothing(self, router):
+        """A message without keywords or context should match nothing."""
+        router.instruction_handler.instructions["t"] = _instruction(
+            "testing_guide", description="Testing guide"
+        )
+        result = router.route("is it on?")
+        assert result["count"] == 0
+        assert result["routing_analysis"]["scoring_breakdown"] == []
+
+    def test_catch_all_branch_pattern_still_scores(self, router):
+        """A '*' branch pattern matches even when no signal is present."""
+        router.instruction_handler.instructions["b"] = _instruction(
+            "any_branch", routing={"contextual": {"branches": ["*"]}}
+        )
+        result = router.route("is it on?")
+        assert [inst["id"] for inst in result["instructions"]] == ["any_branch"]
+
+
+class TestFoundationalInstructions:
+    """Tests for always-included foundational instructions."""
+
+    def test_foundational_follows_reloads(self, router):
+        """Foundational instructions loaded after construction are included."""
+        assert router.route("anything at all")["instructions"] == []
+
+        router.instruction_handler.instructions["core"] = _instruction(
+            "core_principles", foundational=True
+        )
+        result = router.route("anything at all")
+        assert [inst["id"] for inst in result["instructions"]] == ["core_principles"]
+        assert result["routing_analysis"]["foundational_ids"] == ["core_principles"]
+
+    def test_results_are_fresh_per_call(self, router):
+        """Mutating one result must not leak into later routes."""
+        router.instruction_handler.instructions["core"] = _instruction(
+            "core_principles", foundational=True
+        )
+        first = router._get_foundational_instructions()
+        first[0]["score_breakdown"]["bundle_boost"] = {"boost": 5}
+        first[0]["routing_score"] = 0
+
+        second = router._get_foundational_instructions()
+        assert second[0]["score_breakdown"] == {"foundational": True}
+        assert second[0]["routing_score"] > 0
+
+
+class TestPreviousRouting:
+    """Tests for IMP-009 commencement look-back."""
+
+    def test_reads_event_before_latest_from_project_db(
+        self, router, tmp_path, monkeypatch
+    ):
+        """Look-back should skip the current event and empty routings."""
+        db = get_database(tmp_path / ".pongogo" / "pongogo.db")
+        for timestamp, instructions in [
+            ("2025-01-01T00:00:00", ["older"]),
+            ("2025-01-02T00:00:00", ["previous_a", "previous_b"]),
+            ("2025-01-03T00:00:00", []),
+            ("2025-01-04T00:00:00", ["current"]),
+        ]:
+            db.execute_insert(
+                "INSERT INTO routing_events "
+                "(timestamp, user_message, routed_instructions, instruction_count) "
+                "VALUES (?, ?, ?, ?)",
+                (timestamp, "msg", json.dumps(instructions), len(instructions)),
+            )
+        monkeypatch.chdir(tmp_path)
+
+        assert router._get_previous_routing() == {
+            "instructions": ["previous_a", "previous_b"]
+        }
+
+    def test_boosts_previously_routed_instructions(self, router):
+        """Instructions from the previous routing are boosted by normalized id."""
+        router.instruction_handler.instructions["a"] = _instruction(
+            "deploy_checklist.instructions", categories=["releases"]
+        )
+        router.instruction_handler.instructions["b"] = _instruction(
+            "style_guide", categories=["releases"]
+        )
+        result = router.route(
+            "let's continue",
+            {"previous_routing": {"instructions": ["releases/deploy_checklist"]}},
+        )
+        assert [inst["id"] for inst in result["instructions"]] == [
+            "deploy_checklist.instructions"
+        ]
+        breakdown = result["instructions"][0]["score_breakdown"]
+        assert breakdown["commencement_lookback"] == COMMENCEMENT_LOOKBACK_BOOST
+
+    def test_explicit_context_wins(self, router):
+        """Explicit previous_routing in context should be used as-is."""
+        previous = {"instructions": ["a/b"]}
+        assert router._get_previous_routing({"previous_routing": previous}) is previous
+
+
+class TestBundleBoost:
+    """Tests for IMP-007 co-occurrence bundle boosts."""
+
+    def test_boosts_partners_across_id_formats(self, router):
+        """Bundle keys should match category/id and .instructions-suffixed ids."""
+        router.instruction_handler.instructions["a"] = _instruction(
+            "development_workflow_essentials.instructions",
+            categories=["trust_execution"],
+            tags=["workflow"],
+        )
+        router.instruction_handler.instructions["b"] = _instruction(
+            "trust_based_task_execution",
+            categories=["trust_execution"],
+            tags=["workflow"],
+        )
+        result = router.route("workflow")
+
+        boosts = result["routing_analysis"]["bundle_boost"]["boosts"]
+        assert [(b["trigger"], b["boosted"]) for b in boosts] == [
+            (
+                "trust_execution/development_workflow_essentials",
+                "trust_execution/trust_based_task_execution",
+            ),
+        ]
+        by_id = {inst["id"]: inst for inst in result["instructions"]}
+        assert (
+            by_id["trust_based_task_execution"]["score_breakdown"]["bundle_boost"][
+                "boost"
+            ]
+            == 12
+        )
+        # The partner id is matched without the suffix only when checking
+        # presence, so the suffixed instruction is not itself boosted
+        assert (
+            "bundle_boost"
+            not in (
+                by_id["development_workflow_essentials.instructions"]["score_breakdown"]
+            )
+        )
+
+
+class TestTopByScore:
+    """Tests for top-N result selection."""
+
+    @pytest.mark.parametrize("limit", [0, 1, 2, 3, 10])
+    def test_matches_stable_sort(self, limit):
+        """Selection should equal a stable descending sort truncated to limit."""
+        scored = [
+            {"id": "a", "routing_score": 5},
+            {"id": "b", "routing_score": 9},
+            {"id": "c", "routing_score": 5},
+            {"id": "d", "routing_score": 1},
+        ]
+        expected = sorted(scored, key=lambda x: x["routing_score"], reverse=True)
+        assert _top_by_score(scored, limit) == expected[:limit]